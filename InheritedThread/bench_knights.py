@@ -0,0 +1,75 @@
+"""Пропускная способность сражения в потоках при росте числа рыцарей.
+
+Запуск из каталога InheritedThread:
+
+    python bench_knights.py --knights 2 8 32 128 512 --enemies 200000
+
+Рыцари бьют без пауз (день нулевой длины) с силой 1, лог пишется в
+os.devnull (с флагом ``--no-log`` отключается). Сравниваются три режима:
+
+- прежний — общая блокировка на всех рыцарей, логирование под ней;
+- общий — Enemy со своей блокировкой, логирование вне её;
+- доли — ShardedEnemy: у каждого рыцаря своя доля врагов и блокировка.
+
+Печатается число ударов в секунду.
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from knights import Enemy, Knight, ShardedEnemy, run_threads
+
+
+class LockedKnight(Knight):
+    """Прежняя реализация: удар и лог под одной общей блокировкой."""
+    lock = threading.Lock()
+
+    def strike(self):
+        with LockedKnight.lock:
+            if self.enemy.total_enemies <= 0:
+                return False
+            remaining_enemies = self.enemy.reduce_enemies(self.power)
+            self.days += 1
+            self.report_status(remaining_enemies)
+            return True
+
+
+MODES = {
+    'прежний': (LockedKnight, lambda enemies, knights: Enemy(enemies)),
+    'общий': (Knight, lambda enemies, knights: Enemy(enemies)),
+    'доли': (Knight, lambda enemies, knights: ShardedEnemy(enemies, [1] * knights)),
+}
+
+
+def measure(mode, knights, enemies):
+    knight_class, create_enemy = MODES[mode]
+    enemy = create_enemy(enemies, knights)
+    army = [knight_class(f'Рыцарь {i}', 1, enemy, day_length=0, shard=i) for i in range(knights)]
+    started = time.perf_counter()
+    run_threads(army)
+    elapsed = time.perf_counter() - started
+    return sum(knight.days for knight in army) / elapsed
+
+
+def run(knight_counts, enemies):
+    print(f'врагов: {enemies:,}, сила рыцаря: 1')
+    print(f'{"рыцарей":>8}' + ''.join(f'{mode + ", уд/с":>18}' for mode in MODES))
+    for knights in knight_counts:
+        print(f'{knights:>8}' + ''.join(f'{measure(mode, knights, enemies):>18,.0f}' for mode in MODES))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Сражение в потоках при росте числа рыцарей')
+    parser.add_argument('--knights', type=int, nargs='+', default=[2, 8, 32, 128, 512], help='Числа рыцарей')
+    parser.add_argument('--enemies', type=int, default=200_000, help='Количество врагов')
+    parser.add_argument('--no-log', action='store_true', help='Отключить логирование')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.basicConfig(level=logging.INFO, handlers=[logging.FileHandler(os.devnull)])
+    if args.no_log:
+        logging.disable(logging.INFO)
+    run(args.knights, args.enemies)
@@ -0,0 +1,59 @@
+"""Симуляция сражений против решения в замкнутой форме на сетке конфигураций.
+
+Запуск из каталога InheritedThread:
+
+    python bench_solver.py --configs 10000 --knights 4 --max-enemies 10000
+
+Печатается время на всю сетку: simulate_battle по одной конфигурации,
+solve_battle по одной и solve_battles целиком (NumPy, если установлен).
+"""
+import argparse
+import logging
+import random
+import time
+from knights import Enemy, Knight, simulate_battle
+from solver import solve_battle, solve_battles
+
+
+def simulate_all(enemies, powers):
+    for total_enemies, row in zip(enemies, powers):
+        enemy = Enemy(total_enemies)
+        simulate_battle([Knight(f"Рыцарь {i}", power, enemy) for i, power in enumerate(row)])
+
+
+def solve_all(enemies, powers):
+    for total_enemies, row in zip(enemies, powers):
+        solve_battle(total_enemies, row)
+
+
+def run(configs, knights, max_enemies, seed, simulate_limit):
+    rng = random.Random(seed)
+    enemies = [rng.randint(1, max_enemies) for _ in range(configs)]
+    powers = [[rng.randint(1, 100) for _ in range(knights)] for _ in range(configs)]
+    strategies = [('solve_battle', solve_all), ('solve_battles', solve_battles)]
+    if configs <= simulate_limit:
+        strategies.insert(0, ('simulate_battle', simulate_all))
+    print(f'конфигураций: {configs}, рыцарей: {knights}, врагов до {max_enemies}')
+    print(f'{"способ":<18}{"время, с":>10}{"конф./с":>14}')
+    for name, strategy in strategies:
+        started = time.perf_counter()
+        strategy(enemies, powers)
+        elapsed = time.perf_counter() - started
+        print(f'{name:<18}{elapsed:>10.3f}{configs / elapsed:>14,.0f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Симуляция против решения в замкнутой форме')
+    parser.add_argument('--configs', type=int, default=10_000, help='Количество конфигураций')
+    parser.add_argument('--knights', type=int, default=4, help='Рыцарей в конфигурации')
+    parser.add_argument('--max-enemies', type=int, default=10_000, help='Наибольшее число врагов')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора')
+    parser.add_argument('--simulate-limit', type=int, default=10_000,
+                        help='Симулировать, только если конфигураций не больше')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.disable(logging.INFO)
+    run(args.configs, args.knights, args.max_enemies, args.seed, args.simulate_limit)
@@ -4,59 +4,272 @@ import logging
 import json
 import sys
 import argparse
+import glob
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
 
 
 class Enemy:
     def __init__(self, total_enemies):
         self.total_enemies = total_enemies
+        self.lock = threading.Lock()  # Мьютекс для синхронизации доступа к общему ресурсу
 
     def reduce_enemies(self, power):
         self.total_enemies -= power
         return max(self.total_enemies, 0)
 
+    def attack(self, power, shard=0):
+        """Удар рыцаря под блокировкой: вернуть число оставшихся врагов или None, если их уже не осталось."""
+        with self.lock:
+            if self.total_enemies <= 0:
+                return None
+            return self.reduce_enemies(power)
 
-class Knight(threading.Thread):
-    lock = threading.Lock()  # Мьютекс для синхронизации доступа к общему ресурсу
 
-    def __init__(self, name, power, enemy):
+class ShardedEnemy:
+    """Враги, разделённые на доли между рыцарями.
+
+    Доли делятся пропорционально весам (обычно силам рыцарей), у каждой доли
+    своя блокировка, и рыцарь бьёт по своей доле, поэтому рыцари почти не
+    соперничают за блокировку. Опустошив свою долю, рыцарь добивает чужие.
+    Удар не переходит из доли в долю, поэтому ударов может понадобиться на
+    несколько больше, чем с общим счётчиком Enemy. Дробные числа врагов и
+    веса допустимы: тогда остаток от деления достаётся последней доле.
+    """
+
+    def __init__(self, total_enemies, weights):
+        weights = list(weights) or [1]
+        if sum(weights) <= 0:
+            weights = [1] * len(weights)
+        total_enemies = max(total_enemies, 0)
+        self._counts = [total_enemies * weight // sum(weights) for weight in weights]
+        remainder = total_enemies - sum(self._counts)
+        if isinstance(remainder, int):
+            for i in range(remainder):
+                self._counts[i] += 1
+        else:
+            self._counts[-1] += remainder
+        self._locks = [threading.Lock() for _ in self._counts]
+        self._next = list(range(len(self._counts)))  # Доля, с которой рыцарь начинает поиск врагов
+
+    @property
+    def total_enemies(self):
+        return sum(self._counts)
+
+    def attack(self, power, shard=0):
+        """Удар по своей доле, а если она пуста — по первой непустой чужой.
+
+        Вернуть число оставшихся врагов во всех долях (считается без
+        блокировок) или None, если врагов не осталось.
+        """
+        counts = self._counts
+        start = self._next[shard]
+        for step in range(len(counts)):
+            i = (start + step) % len(counts)
+            if counts[i] <= 0:
+                continue
+            with self._locks[i]:
+                if counts[i] <= 0:
+                    continue
+                counts[i] = max(counts[i] - power, 0)
+            self._next[shard] = i
+            return sum(counts)
+        return None
+
+
+class Knight(threading.Thread):
+    def __init__(self, name, power, enemy, day_length=1, shard=0):
         super().__init__()
         self.name = name
         self.power = power
         self.days = 0
         self.enemy = enemy
+        self.day_length = day_length  # Длина дня сражения в секундах
+        self.shard = shard  # Доля врагов рыцаря в ShardedEnemy
 
     def run(self):
-        logging.info(f"{self.name}, на нас напали!")
+        self.report_attack()
         self.battle()
 
     def battle(self):
-        while True:
-            with Knight.lock:  # Защита доступа к общему ресурсу
-                if self.enemy.total_enemies <= 0:
-                    break
-                remaining_enemies = self.enemy.reduce_enemies(self.power)
-                self.days += 1
-                self.report_status(remaining_enemies)
+        while self.strike():
+            time.sleep(self.day_length)  # Ожидание следующего дня
+
+        self.report_victory()
 
-            time.sleep(1)  # Задержка в 1 секунду
+    def strike(self):
+        """Один день сражения: удар по врагам. Возвращает False, если врагов уже не осталось."""
+        remaining_enemies = self.enemy.attack(self.power, self.shard)
+        if remaining_enemies is None:
+            return False
+        self.days += 1
+        self.report_status(remaining_enemies)  # Логирование вне блокировки
+        return True
 
+    def report_attack(self):
+        logging.info(f"{self.name}, на нас напали!")
+
+    def report_victory(self):
         logging.info(f"{self.name} одержал победу спустя {self.days} дней(дня)!")
 
     def report_status(self, remaining_enemies):
         logging.info(f"{self.name}, сражается {self.days} день(дня)..., осталось {remaining_enemies} воинов.")
 
 
+def simulate_battle(knights):
+    """Провести сражение в виртуальном времени, без потоков и пауз.
+
+    Действия рыцарей лежат в куче по времени и порядку постановки: каждый
+    день рыцари бьют в том же порядке, в котором стартуют их потоки, а
+    следующий удар ставится на день позже. Лог и ``days`` у рыцарей
+    получаются такими же, как в режиме с потоками, а каждое действие стоит
+    O(log n) от числа рыцарей. Возвращает виртуальную длительность сражения.
+    """
+    schedule = [(0, order, knight, True) for order, knight in enumerate(knights)]
+    order = len(schedule)
+    clock = 0
+    while schedule:
+        clock, _, knight, first = heappop(schedule)
+        if first:
+            knight.report_attack()
+        if knight.strike():
+            heappush(schedule, (clock + knight.day_length, order, knight, False))
+            order += 1
+        else:
+            knight.report_victory()
+    return clock
+
+
+def run_threads(knights):
+    """Провести сражение в реальном времени: по потоку на рыцаря."""
+    # Запуск потоков
+    for knight in knights:
+        knight.start()
+
+    # Ожидание завершения потоков
+    for knight in knights:
+        knight.join()
+
+
+def create_enemy(config, partition=False):
+    if partition:
+        return ShardedEnemy(config['total_enemies'], [knight_data['power'] for knight_data in config['knights']])
+    return Enemy(config['total_enemies'])
+
+
+def create_knights(config, enemy, day_length=1):
+    return [Knight(knight_data['name'], knight_data['power'], enemy, day_length, shard)
+            for shard, knight_data in enumerate(config['knights'])]
+
+
 def load_config(filename):
     with open(filename, 'r') as f:
         return json.load(f)
 
 
+def find_configs(pattern):
+    """Файлы конфигураций по каталогу (все *.json в нём) или glob-шаблону, в отсортированном порядке."""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.json')
+    return sorted(glob.glob(pattern, recursive=True))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_config(config):
+    """Вернуть описание ошибки в конфигурации или None, если по ней можно провести сражение."""
+    if not isinstance(config, dict) or not isinstance(config.get('knights'), list):
+        return 'expected an object with a list of knights'
+    if not _is_number(config.get('total_enemies')):
+        return 'total_enemies must be a number'
+    for knight_data in config['knights']:
+        if not isinstance(knight_data, dict) or 'name' not in knight_data:
+            return 'every knight must be an object with a name'
+        if not _is_number(knight_data.get('power')) or knight_data['power'] < 0:
+            return f"power of {knight_data['name']!r} must be a non-negative number"
+    if config['total_enemies'] > 0 and not any(knight_data['power'] for knight_data in config['knights']):
+        return 'knights can never win'
+    return None
+
+
+def battle_result(config):
+    """Провести сражение по конфигурации в виртуальном времени и вернуть итог для JSONL."""
+    error = check_config(config)
+    if error:
+        return {'error': f'invalid config: {error}'}
+    enemy = Enemy(config['total_enemies'])
+    knights = create_knights(config, enemy)
+    duration = simulate_battle(knights)
+    return {'duration': duration, 'knights': [{'name': knight.name, 'days': knight.days} for knight in knights]}
+
+
+def _quiet_worker():
+    logging.disable(logging.INFO)  # Ход сражений в пакетном режиме не логируется
+
+
+def run_batch(paths, output, workers=None):
+    """Провести сражения по множеству конфигураций в пуле процессов.
+
+    Разобранные конфигурации кэшируются по SHA-256 содержимого файла, так
+    что одинаковые файлы разбираются и считаются один раз. Итоги пишутся в
+    output построчно в JSON (JSONL) по мере готовности, в порядке первого
+    появления конфигурации в paths; копии идут сразу за первым файлом.
+    Файлы с битым JSON дают строку с ошибкой на своём месте в этом порядке.
+    Возвращает число записанных строк.
+    """
+    configs = {}  # Хэш файла -> разобранная конфигурация
+    parse_errors = {}  # Хэш файла -> итог с ошибкой разбора
+    paths_by_hash = {}
+    written = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = hashlib.sha256(data).hexdigest()
+        if key not in configs:
+            try:
+                configs[key] = json.loads(data)
+            except ValueError as e:
+                configs[key] = None
+                parse_errors[key] = {'error': f'invalid JSON: {e}'}
+        paths_by_hash.setdefault(key, []).append(path)
+
+    workers = workers or os.cpu_count() or 1
+    valid = [config for key, config in configs.items() if key not in parse_errors]
+    chunksize = max(1, len(valid) // (workers * 4))
+    with ProcessPoolExecutor(workers, initializer=_quiet_worker) as pool:
+        results = pool.map(battle_result, valid, chunksize=chunksize)
+        for key in configs:
+            result = parse_errors[key] if key in parse_errors else next(results)
+            for path in paths_by_hash[key]:
+                output.write(json.dumps({'config': path, **result}, ensure_ascii=False) + '\n')
+                written += 1
+    output.flush()
+    return written
+
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Knight Battle Simulation")
-    parser.add_argument('config_file', type=str, help='Path to the configuration file')
+    parser.add_argument('config_file', type=str, nargs='?', help='Path to the configuration file')
     parser.add_argument('--log_level', type=str, default='INFO',
                         help='Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)')
-    return parser.parse_args()
+    parser.add_argument('--realtime', action='store_true',
+                        help='Run one thread per knight with real one-second days instead of simulated time')
+    parser.add_argument('--day_length', type=float, default=1,
+                        help='Length of a battle day in seconds for --realtime')
+    parser.add_argument('--partition', action='store_true',
+                        help='Split enemies into per-knight shards with their own locks')
+    parser.add_argument('--batch', type=str,
+                        help='Directory or glob of configuration files to run in simulated time across a process pool')
+    parser.add_argument('--workers', type=int, help='Number of worker processes for --batch (default: CPU count)')
+    parser.add_argument('--output', type=str, default='-', help='JSONL file for --batch results (default: stdout)')
+    args = parser.parse_args()
+    if (args.config_file is None) == (args.batch is None):
+        parser.error('pass either config_file or --batch')
+    return args
 
 
 def main():
@@ -65,21 +278,24 @@ def main():
     # Настройка уровня логирования
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
 
-    config = load_config(args.config_file)
-    enemy = Enemy(config['total_enemies'])
-
-    knights = []
-    for knight_data in config['knights']:
-        knight = Knight(knight_data['name'], knight_data['power'], enemy)
-        knights.append(knight)
+    if args.batch:
+        paths = find_configs(args.batch)
+        if args.output == '-':
+            written = run_batch(paths, sys.stdout, args.workers)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as output:
+                written = run_batch(paths, output, args.workers)
+        logging.info(f"Проведено сражений: {written}")
+        return
 
-    # Запуск потоков
-    for knight in knights:
-        knight.start()
+    config = load_config(args.config_file)
+    enemy = create_enemy(config, args.partition)
+    knights = create_knights(config, enemy, args.day_length)
 
-    # Ожидание завершения потоков
-    for knight in knights:
-        knight.join()
+    if args.realtime:
+        run_threads(knights)
+    else:
+        simulate_battle(knights)
 
     # Вывод строки об окончании сражения
     logging.info("Все битвы закончились!")
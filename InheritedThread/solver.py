@@ -0,0 +1,107 @@
+import math
+from dataclasses import dataclass
+from numbers import Integral
+from typing import List, Sequence
+
+
+@dataclass
+class BattleOutcome:
+    """Итог сражения без симуляции.
+
+    ``duration`` — длительность в днях (как у simulate_battle при дне в 1 с),
+    ``days`` — число ударов каждого рыцаря, ``last_knight`` — номер рыцаря,
+    добившего врагов (-1, если врагов не было). Рыцарь i бьёт в дни
+    с 1 по days[i].
+    """
+    duration: int
+    days: List[int]
+    last_knight: int
+
+
+def _check(total_enemies, powers):
+    if any(power < 0 for power in powers):
+        raise ValueError("Сила рыцаря не может быть отрицательной")
+    if total_enemies > 0 and not sum(powers):
+        raise ValueError("Рыцари с нулевой силой никогда не победят")
+
+
+def _full_days(total_enemies, total_power) -> int:
+    """Число полных дней, после которых враги ещё остаются."""
+    if isinstance(total_enemies, Integral) and isinstance(total_power, Integral):
+        return (total_enemies - 1) // total_power
+    # Для дробных чисел (E - 1) // P неверно, поэтому считаем ceil(E / P) - 1
+    return math.ceil(total_enemies / total_power) - 1
+
+
+def solve_battle(total_enemies: float, powers: Sequence[float]) -> BattleOutcome:
+    """Посчитать итог сражения арифметикой.
+
+    Каждый день рыцари бьют по очереди, вместе убивая P = sum(powers) врагов.
+    Полных дней, после которых враги ещё остаются, f = (E - 1) // P. В день
+    f + 1 бьют рыцари, пока префиксная сумма сил не покроет остаток E - f * P;
+    они получают f + 1 день, остальные — f. Дробные числа врагов и силы
+    допустимы, дни всегда целые.
+    """
+    _check(total_enemies, powers)
+    if total_enemies <= 0:
+        return BattleOutcome(0, [0] * len(powers), -1)
+    total_power = sum(powers)
+    full_days = _full_days(total_enemies, total_power)
+    remaining = total_enemies - full_days * total_power
+    for last_knight, power in enumerate(powers):
+        remaining -= power
+        if remaining <= 0:
+            break
+    days = [full_days + 1] * (last_knight + 1) + [full_days] * (len(powers) - last_knight - 1)
+    return BattleOutcome(full_days + 1, days, last_knight)
+
+
+def solve_config(config) -> BattleOutcome:
+    """Посчитать итог сражения по конфигурации из config.json."""
+    return solve_battle(config['total_enemies'], [knight['power'] for knight in config['knights']])
+
+
+def solve_battles(total_enemies, powers, use_numpy=None):
+    """Посчитать итоги множества сражений с одинаковым числом рыцарей.
+
+    total_enemies — последовательность из m чисел врагов, powers — матрица
+    m x n сил рыцарей. Возвращает кортеж (durations, days, last_knights):
+    длительности (m), дни рыцарей (m x n) и номера добивших рыцарей (m).
+    Если установлен NumPy (или use_numpy=True), все сражения считаются
+    векторно и результат — массивы NumPy; иначе — списки, посчитанные
+    solve_battle по одному. Целые входы считаются в int64, дробные — в
+    float64, но дни в результате всегда целые.
+    """
+    if use_numpy is not False:
+        try:
+            import numpy as np
+        except ImportError:
+            if use_numpy:
+                raise
+        else:
+            enemies = np.asarray(total_enemies)
+            powers = np.asarray(powers)
+            integral = enemies.dtype.kind in 'biu' and powers.dtype.kind in 'biu'
+            dtype = np.int64 if integral else np.float64
+            enemies = enemies.astype(dtype)
+            powers = powers.astype(dtype).reshape(len(enemies), -1)
+            totals = powers.sum(axis=1)
+            fought = enemies > 0
+            if (powers < 0).any():
+                raise ValueError("Сила рыцаря не может быть отрицательной")
+            if (fought & (totals == 0)).any():
+                raise ValueError("Рыцари с нулевой силой никогда не победят")
+            divisors = np.where(totals > 0, totals, 1)
+            if integral:
+                full_days = (enemies - 1) // divisors
+            else:
+                full_days = (np.ceil(enemies / divisors) - 1).astype(np.int64)
+            full_days = np.where(fought, full_days, 0)
+            remaining = enemies - full_days * totals
+            last_knights = np.where(fought, (powers.cumsum(axis=1) >= remaining[:, None]).argmax(axis=1), -1)
+            days = full_days[:, None] + (np.arange(powers.shape[1]) <= last_knights[:, None])
+            return np.where(fought, full_days + 1, 0), days, last_knights
+
+    outcomes = [solve_battle(enemies, list(row)) for enemies, row in zip(total_enemies, powers)]
+    return ([outcome.duration for outcome in outcomes], [outcome.days for outcome in outcomes],
+            [outcome.last_knight for outcome in outcomes])
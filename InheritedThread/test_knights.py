@@ -1,5 +1,9 @@
+import io
+import json
+import os
+import tempfile
 import unittest
-from knights import Enemy
+from knights import Enemy, Knight, ShardedEnemy, find_configs, run_batch, run_threads, simulate_battle
 
 class TestEnemy(unittest.TestCase):
     def test_reduce_enemies(self):
@@ -12,5 +16,166 @@ class TestEnemy(unittest.TestCase):
         remaining = enemy.reduce_enemies(20)
         self.assertEqual(remaining, 0)
 
+    def test_attack_after_defeat(self):
+        enemy = Enemy(10)
+        self.assertEqual(enemy.attack(20), 0)
+        self.assertIsNone(enemy.attack(20))
+
+class TestShardedEnemy(unittest.TestCase):
+    def test_split_by_weights(self):
+        enemy = ShardedEnemy(101, [1, 2, 2])
+        self.assertEqual(enemy.total_enemies, 101)
+        self.assertEqual(enemy.attack(100, shard=0), 80)
+
+    def test_steals_from_other_shards(self):
+        enemy = ShardedEnemy(30, [0, 1])
+        self.assertEqual(enemy.attack(10, shard=0), 20)
+        self.assertEqual(enemy.attack(25, shard=0), 0)
+        self.assertIsNone(enemy.attack(1, shard=1))
+
+    def test_threads_defeat_all_enemies(self):
+        enemy = ShardedEnemy(10_000, [1] * 16)
+        knights = [Knight(f"Рыцарь {i}", 7, enemy, day_length=0, shard=i) for i in range(16)]
+        with self.assertLogs(level='INFO'):
+            run_threads(knights)
+        self.assertEqual(enemy.total_enemies, 0)
+        self.assertGreaterEqual(sum(knight.days for knight in knights) * 7, 10_000)
+        self.assertLess(sum(knight.days for knight in knights), 10_000 // 7 + 1 + 16)
+
+    def test_fractional_config(self):
+        enemy = ShardedEnemy(100.5, [2.5, 3])
+        self.assertAlmostEqual(enemy.total_enemies, 100.5)
+        knights = [Knight(f"Рыцарь {i}", power, enemy, day_length=0, shard=i) for i, power in enumerate([2.5, 3])]
+        with self.assertLogs(level='INFO'):
+            run_threads(knights)
+        self.assertEqual(enemy.total_enemies, 0)
+        self.assertGreaterEqual(knights[0].days * 2.5 + knights[1].days * 3, 100.5)
+
+class TestSimulation(unittest.TestCase):
+    def make_knights(self, total_enemies, powers, day_length=1):
+        enemy = Enemy(total_enemies)
+        return [Knight(f"Рыцарь {i}", power, enemy, day_length) for i, power in enumerate(powers)], enemy
+
+    def test_simulated_log(self):
+        knights, enemy = self.make_knights(100, [10, 20])
+        with self.assertLogs(level='INFO') as logs:
+            duration = simulate_battle(knights)
+        self.assertEqual([record.getMessage() for record in logs.records], [
+            "Рыцарь 0, на нас напали!",
+            "Рыцарь 0, сражается 1 день(дня)..., осталось 90 воинов.",
+            "Рыцарь 1, на нас напали!",
+            "Рыцарь 1, сражается 1 день(дня)..., осталось 70 воинов.",
+            "Рыцарь 0, сражается 2 день(дня)..., осталось 60 воинов.",
+            "Рыцарь 1, сражается 2 день(дня)..., осталось 40 воинов.",
+            "Рыцарь 0, сражается 3 день(дня)..., осталось 30 воинов.",
+            "Рыцарь 1, сражается 3 день(дня)..., осталось 10 воинов.",
+            "Рыцарь 0, сражается 4 день(дня)..., осталось 0 воинов.",
+            "Рыцарь 1 одержал победу спустя 3 дней(дня)!",
+            "Рыцарь 0 одержал победу спустя 4 дней(дня)!",
+        ])
+        self.assertEqual(duration, 4)
+        self.assertLessEqual(enemy.total_enemies, 0)
+
+    def battle_log(self, knights, run):
+        with self.assertLogs(level='INFO') as logs:
+            run(knights)
+        return [record.getMessage() for record in logs.records]
+
+    def test_single_knight_log_matches_threads(self):
+        simulated, _ = self.make_knights(35, [10])
+        threaded, _ = self.make_knights(35, [10], day_length=0.001)
+        self.assertEqual(self.battle_log(threaded, run_threads), self.battle_log(simulated, simulate_battle))
+        self.assertEqual(threaded[0].days, simulated[0].days)
+
+    def test_simulation_matches_threads(self):
+        # Порядок рыцарей внутри дня в потоках не определён. Когда врагов ровно на
+        # целое число дней, от него не зависят ни дни рыцарей, ни их записи в логе,
+        # ни число врагов в конце каждого дня.
+        for total_enemies, powers in ((90, [10, 20]), (120, [5, 10, 15, 30])):
+            with self.subTest(total_enemies=total_enemies, powers=powers):
+                simulated, _ = self.make_knights(total_enemies, powers)
+                threaded, enemy = self.make_knights(total_enemies, powers, day_length=0.01)
+                simulated_log = self.battle_log(simulated, simulate_battle)
+                threaded_log = self.battle_log(threaded, run_threads)
+
+                self.assertEqual([knight.days for knight in threaded], [knight.days for knight in simulated])
+                self.assertLessEqual(enemy.total_enemies, 0)
+                for knight in simulated:
+                    self.assertEqual(self.knight_messages(threaded_log, knight.name),
+                                     self.knight_messages(simulated_log, knight.name))
+                self.assertEqual(self.day_ends(threaded_log), self.day_ends(simulated_log))
+
+    @staticmethod
+    def knight_messages(log, name):
+        """Записи одного рыцаря без числа оставшихся врагов."""
+        return [message.split(', осталось')[0] for message in log
+                if message.startswith((name + ',', name + ' '))]
+
+    @staticmethod
+    def day_ends(log):
+        """Число врагов в конце каждого дня: наименьшее из записанных за день."""
+        remaining = {}
+        for message in log:
+            if ', осталось ' in message:
+                day = int(message.split('сражается ')[1].split(' ')[0])
+                count = int(message.split(', осталось ')[1].split(' ')[0])
+                remaining[day] = min(count, remaining.get(day, count))
+        return remaining
+
+    def test_many_knights(self):
+        knights, _ = self.make_knights(20_000, [1] * 1000)
+        with self.assertLogs(level='INFO'):
+            duration = simulate_battle(knights)
+        self.assertEqual(duration, 20)
+        self.assertTrue(all(knight.days == 20 for knight in knights))
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content))
+        return path
+
+    def test_run_batch(self):
+        config = {"total_enemies": 100, "knights": [{"name": "Sir Lancelot", "power": 10},
+                                                    {"name": "Sir Galahad", "power": 20}]}
+        self.write('a.json', config)
+        self.write('b.json', config)
+        self.write('c.json', {"total_enemies": 5, "knights": [{"name": "Sir Bors", "power": 0}]})
+        self.write('d.json', '{broken')
+        self.write('e.json', {"total_enemies": 100, "knights": [{"name": "Sir Kay", "power": "10"}]})
+        self.write('f.json', {"total_enemies": "100", "knights": [{"name": "Sir Kay", "power": 10}]})
+        self.write('g.json', {"total_enemies": 10, "knights": [{"name": "Sir Kay", "power": 10}]})
+        self.write('notes.txt', 'not a config')
+
+        paths = find_configs(self.directory.name)
+        self.assertEqual([os.path.basename(path) for path in paths],
+                         ['a.json', 'b.json', 'c.json', 'd.json', 'e.json', 'f.json', 'g.json'])
+        output = io.StringIO()
+        self.assertEqual(run_batch(paths, output, workers=2), 7)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([os.path.basename(line['config']) for line in lines],
+                         ['a.json', 'b.json', 'c.json', 'd.json', 'e.json', 'f.json', 'g.json'])
+        results = {os.path.basename(line['config']): line for line in lines}
+
+        self.assertEqual(results['a.json']['duration'], 4)
+        self.assertEqual([knight['days'] for knight in results['a.json']['knights']], [4, 3])
+        self.assertEqual(results['b.json']['knights'], results['a.json']['knights'])
+        self.assertIn('error', results['c.json'])
+        self.assertIn('error', results['d.json'])
+        self.assertIn('power', results['e.json']['error'])
+        self.assertIn('total_enemies', results['f.json']['error'])
+        self.assertEqual(results['g.json']['duration'], 1)
+
+    def test_glob(self):
+        self.write('x1.json', '{}')
+        self.write('y1.json', '{}')
+        paths = find_configs(os.path.join(self.directory.name, 'x*.json'))
+        self.assertEqual([os.path.basename(path) for path in paths], ['x1.json'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+import logging
+import random
+import unittest
+from knights import Enemy, Knight, simulate_battle
+from solver import solve_battle, solve_battles, solve_config
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.INFO)
+        rng = random.Random(42)
+        self.configs = [(rng.randint(-5, 2000), [rng.randint(0, 50) + 1 for _ in range(rng.randint(1, 8))])
+                        for _ in range(300)]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def simulate(self, total_enemies, powers):
+        enemy = Enemy(total_enemies)
+        knights = [Knight(f"Рыцарь {i}", power, enemy) for i, power in enumerate(powers)]
+        return simulate_battle(knights), [knight.days for knight in knights]
+
+    def test_matches_simulation(self):
+        for total_enemies, powers in self.configs:
+            outcome = solve_battle(total_enemies, powers)
+            self.assertEqual((outcome.duration, outcome.days), self.simulate(total_enemies, powers))
+
+    def test_config(self):
+        outcome = solve_config({"total_enemies": 100, "knights": [{"name": "Sir Lancelot", "power": 10},
+                                                                  {"name": "Sir Galahad", "power": 20}]})
+        self.assertEqual((outcome.duration, outcome.days, outcome.last_knight), (4, [4, 3], 0))
+
+    def test_invalid_powers(self):
+        with self.assertRaises(ValueError):
+            solve_battle(10, [0, 0])
+        with self.assertRaises(ValueError):
+            solve_battle(10, [5, -1])
+
+    def test_batch_fallback(self):
+        enemies = [total_enemies for total_enemies, powers in self.configs if len(powers) == 3]
+        powers = [powers for total_enemies, powers in self.configs if len(powers) == 3]
+        durations, days, last_knights = solve_battles(enemies, powers, use_numpy=False)
+        for i, (total_enemies, row) in enumerate(zip(enemies, powers)):
+            outcome = solve_battle(total_enemies, row)
+            self.assertEqual((durations[i], days[i], last_knights[i]),
+                             (outcome.duration, outcome.days, outcome.last_knight))
+
+    def test_fractional_inputs(self):
+        rng = random.Random(7)
+        # Половинки представимы точно, поэтому симуляция вычитает без ошибок округления
+        configs = [(rng.randint(-10, 4000) / 2, [rng.randint(1, 100) / 2 for _ in range(3)]) for _ in range(200)]
+        configs.append((100, [2.5, 3]))
+        for total_enemies, powers in configs:
+            outcome = solve_battle(total_enemies, powers)
+            self.assertIsInstance(outcome.duration, int)
+            self.assertTrue(all(isinstance(days, int) for days in outcome.days))
+            self.assertEqual((outcome.duration, outcome.days), self.simulate(total_enemies, powers))
+        self.assertEqual(solve_battle(100, [2.5, 3]).days, [19, 18])
+
+        enemies = [total_enemies for total_enemies, powers in configs]
+        powers = [powers for total_enemies, powers in configs]
+        expected = solve_battles(enemies, powers, use_numpy=False)
+        self.assertEqual(expected[:2], ([self.simulate(*config)[0] for config in configs],
+                                        [self.simulate(*config)[1] for config in configs]))
+        if numpy is not None:
+            durations, days, last_knights = solve_battles(enemies, powers, use_numpy=True)
+            self.assertEqual((durations.tolist(), days.tolist(), last_knights.tolist()), expected)
+
+    @unittest.skipIf(numpy is None, 'NumPy не установлен')
+    def test_batch_numpy(self):
+        enemies = [total_enemies for total_enemies, powers in self.configs if len(powers) == 3]
+        powers = [powers for total_enemies, powers in self.configs if len(powers) == 3]
+        expected = solve_battles(enemies, powers, use_numpy=False)
+        durations, days, last_knights = solve_battles(enemies, powers, use_numpy=True)
+        self.assertEqual((durations.tolist(), days.tolist(), last_knights.tolist()), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+from functools import partial
+
+DEPOSIT = 'deposit'
+TAKE = 'take'
+
+
+class AsyncBank:
+    """Банк для тысяч одновременных клиентов-корутин в одном потоке.
+
+    ``deposit`` и ``take`` защищены asyncio.Lock. Снятие при недостатке
+    средств либо отклоняется, как в Bank, либо с ``wait=True`` ждёт на условии,
+    пока пополнения не покроют сумму. Запросы можно подавать и через
+    ограниченную очередь ``submit``: когда в ней ``max_pending`` запросов,
+    клиенты ждут места, а ``workers`` обработчиков выполняют запросы по порядку.
+    """
+
+    def __init__(self, balance=0, max_pending=1000, workers=1):
+        self.balance = balance
+        self.max_pending = max_pending
+        self.workers = workers
+        self._lock = asyncio.Lock()
+        self._funds = asyncio.Condition(self._lock)
+        self._requests = asyncio.Queue(maxsize=max_pending)
+        self._processors = []
+        self._waiting_takes = set()
+        self._closed = False
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def deposit(self, amount):
+        """Пополнить баланс и разбудить ожидающие снятия; вернуть новый баланс."""
+        async with self._funds:
+            self.balance += amount
+            balance = self.balance
+            self._funds.notify_all()
+        logging.info(f"Пополнение: {amount}. Баланс: {balance}")
+        return balance
+
+    async def take(self, amount, wait=False, timeout=None):
+        """Снять средства; False, если их недостаточно (с wait=True — если не дождались за timeout)."""
+        async with self._funds:
+            if amount > self.balance and wait:
+                try:
+                    await asyncio.wait_for(self._funds.wait_for(lambda: amount <= self.balance), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            if amount > self.balance:
+                accepted = False
+            else:
+                self.balance -= amount
+                accepted, balance = True, self.balance
+        if not accepted:
+            logging.warning("Запрос отклонён, недостаточно средств")
+            return False
+        logging.info(f"Снятие: {amount}. Баланс: {balance}")
+        return True
+
+    def start(self):
+        """Запустить обработчиков очереди запросов."""
+        self._closed = False
+        if not self._processors:
+            self._processors = [asyncio.create_task(self._process()) for _ in range(self.workers)]
+
+    @property
+    def pending(self):
+        """Число запросов в очереди."""
+        return self._requests.qsize()
+
+    async def submit(self, operation, amount, wait=False):
+        """Поставить запрос в очередь, дождавшись места, и вернуть future с результатом.
+
+        Запросы выполняются после запуска обработчиков (start или async with);
+        если банк закрыли, не запустив, future запроса отменяется.
+        """
+        if operation not in (DEPOSIT, TAKE):
+            raise ValueError(f'Неизвестная операция: {operation}')
+        if self._closed:
+            raise RuntimeError('Банк закрыт')
+        future = asyncio.get_running_loop().create_future()
+        await self._requests.put((operation, amount, wait, future))
+        if self._closed and not self._processors:
+            # Место в очереди освободил close, обработчиков уже не будет
+            self._cancel_pending()
+        return future
+
+    async def call(self, operation, amount, wait=False):
+        """Выполнить запрос через очередь и вернуть его результат."""
+        return await (await self.submit(operation, amount, wait))
+
+    async def _process(self):
+        while True:
+            operation, amount, wait, future = await self._requests.get()
+            try:
+                if operation == TAKE and wait:
+                    # Ожидающее снятие не занимает обработчика, иначе пополнения из очереди не дойдут до банка
+                    task = asyncio.create_task(self.take(amount, wait=True))
+                    self._waiting_takes.add(task)
+                    task.add_done_callback(self._waiting_takes.discard)
+                    task.add_done_callback(partial(_copy_result, future))
+                    continue
+                try:
+                    if operation == DEPOSIT:
+                        result = await self.deposit(amount)
+                    else:
+                        result = await self.take(amount)
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self._requests.task_done()
+
+    async def close(self):
+        """Дождаться обработки очереди и остановить обработчиков.
+
+        Снятия, которые всё ещё ждут средств, отклоняются. Если обработчики
+        не запускались, future запросов из очереди отменяются. Новые запросы
+        после закрытия не принимаются.
+        """
+        self._closed = True
+        if not self._processors:
+            self._cancel_pending()
+            return
+        await self._requests.join()
+        for task in list(self._waiting_takes) + self._processors:
+            task.cancel()
+        await asyncio.gather(*self._waiting_takes, *self._processors, return_exceptions=True)
+        self._processors = []
+
+    def _cancel_pending(self):
+        """Отменить future всех запросов, оставшихся в очереди."""
+        while not self._requests.empty():
+            *_, future = self._requests.get_nowait()
+            future.cancel()
+            self._requests.task_done()
+
+
+def _copy_result(future, task):
+    """Передать результат ожидающего снятия в future клиента; отменённое снятие отклонено."""
+    if future.done():
+        return
+    if task.cancelled():
+        future.set_result(False)
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
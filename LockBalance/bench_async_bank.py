@@ -0,0 +1,81 @@
+"""Нагрузка на AsyncBank от 10 тыс. одновременных клиентов-корутин.
+
+Запуск из каталога LockBalance:
+
+    python bench_async_bank.py --clients 10000 --ops 10 --max-pending 1000
+
+Половина клиентов пополняет баланс, половина снимает те же суммы с ожиданием
+средств, так что в конце все снятия выполнены и баланс нулевой. Замеряется
+режим прямых вызовов deposit/take и режим через ограниченную очередь submit;
+печатаются операции в секунду, задержки p50/p99 и наибольшая длина очереди.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+from async_bank import DEPOSIT, TAKE, AsyncBank
+
+
+async def client(bank, operation, amounts, queued, latencies):
+    for amount in amounts:
+        started = time.perf_counter()
+        if queued:
+            await bank.call(operation, amount, wait=operation == TAKE)
+        elif operation == DEPOSIT:
+            await bank.deposit(amount)
+        else:
+            await bank.take(amount, wait=True)
+        latencies.append(time.perf_counter() - started)
+
+
+async def watch_queue(bank, depths):
+    while True:
+        depths.append(bank.pending)
+        await asyncio.sleep(0.001)
+
+
+async def measure(plans, queued, max_pending, workers):
+    bank = AsyncBank(max_pending=max_pending, workers=workers)
+    latencies, depths = [], []
+    watcher = asyncio.create_task(watch_queue(bank, depths))
+    started = time.perf_counter()
+    async with bank:
+        await asyncio.gather(*(client(bank, operation, amounts, queued, latencies) for operation, amounts in plans))
+    elapsed = time.perf_counter() - started
+    watcher.cancel()
+    assert bank.balance == 0
+    latencies.sort()
+    return (len(latencies) / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)],
+            max(depths, default=0))
+
+
+def run(clients, ops, max_pending, workers, seed):
+    rng = random.Random(seed)
+    amounts = [[rng.randint(50, 500) for _ in range(ops)] for _ in range(clients // 2)]
+    takes = [list(plan) for plan in amounts]
+    rng.shuffle(takes)
+    plans = [(DEPOSIT, plan) for plan in amounts] + [(TAKE, plan) for plan in takes]
+    rng.shuffle(plans)
+
+    print(f'клиентов: {len(plans)}, операций на клиента: {ops}')
+    print(f'{"режим":<30}{"оп/с":>12}{"p50, мс":>10}{"p99, мс":>10}{"очередь":>10}')
+    for queued, name in ((False, 'прямые вызовы'), (True, f'очередь до {max_pending}')):
+        throughput, p50, p99, depth = asyncio.run(measure(plans, queued, max_pending, workers))
+        print(f'{name:<30}{throughput:>12,.0f}{p50 * 1000:>10.2f}{p99 * 1000:>10.2f}{depth:>10,}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Нагрузка на AsyncBank')
+    parser.add_argument('--clients', type=int, default=10_000, help='Количество клиентов-корутин')
+    parser.add_argument('--ops', type=int, default=10, help='Операций на клиента')
+    parser.add_argument('--max-pending', type=int, default=1000, help='Размер очереди запросов')
+    parser.add_argument('--workers', type=int, default=1, help='Количество обработчиков очереди')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора сумм')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.getLogger().setLevel(logging.ERROR)
+    run(args.clients, args.ops, args.max_pending, args.workers, args.seed)
@@ -0,0 +1,82 @@
+"""Накладные расходы InstrumentedLock и пример собранной статистики.
+
+Запуск из каталога LockBalance:
+
+    python bench_instrumented_lock.py --iterations 1000000 --dump
+
+Замеряется стоимость пары захват/освобождение (через with и через
+acquire_lock) для threading.Lock, InstrumentedLock с выключенным и с
+включённым сбором. Затем симуляция Bank из scripts.py запускается с
+InstrumentedLock, и печатается статистика в формате Prometheus.
+"""
+import argparse
+import logging
+import threading
+import time
+from instrumented_lock import InstrumentedLock
+from scripts import Bank, acquire_lock
+
+
+def with_statement(lock, iterations):
+    for _ in range(iterations):
+        with lock:
+            pass
+
+
+def context_manager(lock, iterations):
+    for _ in range(iterations):
+        with acquire_lock(lock):
+            pass
+
+
+def empty_loop(lock, iterations):
+    for _ in range(iterations):
+        pass
+
+
+def cost_ns(function, lock, iterations):
+    """Время одной итерации в наносекундах за вычетом пустого цикла."""
+    started = time.perf_counter_ns()
+    function(lock, iterations)
+    elapsed = time.perf_counter_ns() - started
+    started = time.perf_counter_ns()
+    empty_loop(lock, iterations)
+    return (elapsed - (time.perf_counter_ns() - started)) / iterations
+
+
+def run(iterations, transactions, dump):
+    locks = (('threading.Lock', threading.Lock()),
+             ('InstrumentedLock, сбор выключен', InstrumentedLock(sampling=False)),
+             ('InstrumentedLock, сбор включён', InstrumentedLock()))
+    print(f'{"блокировка":<34}{"with, нс":>12}{"acquire_lock, нс":>20}')
+    for name, lock in locks:
+        print(f'{name:<34}{cost_ns(with_statement, lock, iterations):>12,.0f}'
+              f'{cost_ns(context_manager, lock, iterations):>20,.0f}')
+
+    logging.getLogger().setLevel(logging.ERROR)
+    lock = InstrumentedLock('bank')
+    bank = Bank(lock=lock)
+    threads = [threading.Thread(target=bank.deposit, args=(transactions,)),
+               threading.Thread(target=bank.take, args=(transactions,))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = lock.stats()
+    print(f'\nсимуляция Bank: захватов {stats["acquisitions"]}, с ожиданием {stats["contended"]}, '
+          f'среднее удержание {stats["hold"]["sum_ns"] / max(stats["hold"]["count"], 1):,.0f} нс')
+    if dump:
+        print(lock.prometheus_text())
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Накладные расходы InstrumentedLock')
+    parser.add_argument('--iterations', type=int, default=1_000_000, help='Итераций на замер')
+    parser.add_argument('--transactions', type=int, default=200, help='Транзакций в симуляции Bank')
+    parser.add_argument('--dump', action='store_true', help='Напечатать статистику в формате Prometheus')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.iterations, args.transactions, args.dump)
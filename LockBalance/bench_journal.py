@@ -0,0 +1,120 @@
+"""Сравнение поштучной блокировки Bank и журнала транзакций JournaledBank.
+
+Запуск из каталога LockBalance:
+
+    python bench_journal.py --transactions 100000 --producers 2
+
+Половина производителей пополняет баланс, половина снимает средства; суммы
+генерируются заранее. Замеряются:
+
+- Bank.deposit/Bank.take как есть, с паузой 1 мс на транзакцию (на меньшем
+  числе транзакций, иначе замер длится минуты);
+- поштучная блокировка без паузы: захват блокировки и _update_balance/_withdraw
+  на каждую транзакцию;
+- JournaledBank: производители кладут операции в очередь, применитель
+  применяет их пачками под одной блокировкой.
+
+Логирование по умолчанию отключено (уровень ERROR), чтобы замерять блокировки,
+а не вывод; с ``--log`` остаётся уровень INFO и вывод идёт в файл bench_journal.log.
+"""
+import argparse
+import logging
+import random
+import threading
+import time
+from scripts import Bank, acquire_lock
+from journal import JournaledBank
+
+
+def run_threads(targets) -> float:
+    """Запустить потоки одновременно и вернуть время до завершения последнего."""
+    barrier = threading.Barrier(len(targets) + 1)
+
+    def wrapped(target):
+        barrier.wait()
+        target()
+
+    threads = [threading.Thread(target=wrapped, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def bank_as_is(producers: int, transactions: int) -> float:
+    bank = Bank()
+    targets = [(lambda: bank.deposit(transactions)) if i % 2 == 0 else (lambda: bank.take(transactions))
+               for i in range(producers)]
+    return producers * transactions / run_threads(targets)
+
+
+def per_op_lock(plans: list) -> float:
+    bank = Bank()
+
+    def deposit(amounts):
+        for amount in amounts:
+            with acquire_lock(bank.lock):
+                bank._update_balance(amount)
+
+    def take(amounts):
+        for amount in amounts:
+            with acquire_lock(bank.lock):
+                if amount <= bank.balance:
+                    bank._withdraw(amount)
+
+    targets = [(lambda plan=plan: deposit(plan)) if i % 2 == 0 else (lambda plan=plan: take(plan))
+               for i, plan in enumerate(plans)]
+    return sum(map(len, plans)) / run_threads(targets)
+
+
+def journaled(plans: list, batch_size: int) -> float:
+    bank = JournaledBank(batch_size=batch_size)
+
+    def submit(method, amounts):
+        for amount in amounts:
+            method(amount)
+
+    targets = [(lambda plan=plan: submit(bank.submit_deposit, plan)) if i % 2 == 0
+               else (lambda plan=plan: submit(bank.submit_take, plan))
+               for i, plan in enumerate(plans)]
+    elapsed = run_threads(targets)
+    started = time.perf_counter()
+    bank.close()  # Время применения хвоста журнала тоже учитывается
+    elapsed += time.perf_counter() - started
+    return sum(map(len, plans)) / elapsed
+
+
+def run(transactions: int, producers: int, batch_size: int, sleep_transactions: int, seed: int) -> None:
+    rng = random.Random(seed)
+    plans = [[rng.randint(50, 500) for _ in range(transactions)] for _ in range(producers)]
+    print(f'{"режим":<36}{"оп/с":>14}')
+    print(f'{"Bank как есть (пауза 1 мс)":<36}{bank_as_is(producers, sleep_transactions):>14,.0f}')
+    print(f'{"поштучная блокировка без паузы":<36}{per_op_lock(plans):>14,.0f}')
+    print(f'{f"журнал, пачки до {batch_size}":<36}{journaled(plans, batch_size):>14,.0f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Поштучная блокировка против журнала транзакций')
+    parser.add_argument('--transactions', type=int, default=100_000, help='Транзакций на производителя')
+    parser.add_argument('--producers', type=int, default=2, help='Количество потоков-производителей')
+    parser.add_argument('--batch-size', type=int, default=1024, help='Максимальный размер пачки журнала')
+    parser.add_argument('--sleep-transactions', type=int, default=200,
+                        help='Транзакций на производителя для Bank с паузой')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора сумм')
+    parser.add_argument('--log', action='store_true', help='Оставить логирование уровня INFO')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    root = logging.getLogger()
+    if args.log:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(logging.FileHandler('bench_journal.log', mode='w', encoding='utf-8'))
+    else:
+        root.setLevel(logging.ERROR)
+    run(args.transactions, args.producers, args.batch_size, args.sleep_transactions, args.seed)
@@ -0,0 +1,80 @@
+"""Пропускная способность Ledger при разном числе потоков.
+
+Запуск из каталога LockBalance:
+
+    python bench_ledger.py --ops 100000 --threads 1 2 4 8 16
+
+Для каждой операции (deposit, take, transfer) потоки выполняют заранее
+сгенерированные случайные операции над общим набором счетов. Сравниваются
+одна общая блокировка (stripes=1) и блокировки по полосам.
+"""
+import argparse
+import random
+import threading
+import time
+from ledger import Ledger
+
+OPERATIONS = ('deposit', 'take', 'transfer')
+
+
+def make_ledger(accounts: int, stripes: int) -> Ledger:
+    ledger = Ledger(stripes=stripes)
+    for account in range(accounts):
+        ledger.open_account(account, 1_000_000)
+    return ledger
+
+
+def worker(ledger: Ledger, operation: str, plan: list, barrier: threading.Barrier) -> None:
+    method = getattr(ledger, operation)
+    barrier.wait()
+    if operation == 'transfer':
+        for source, target, amount in plan:
+            method(source, target, amount)
+    else:
+        for account, _, amount in plan:
+            method(account, amount)
+
+
+def measure(operation: str, threads: int, ops: int, accounts: int, stripes: int, seed: int) -> float:
+    """Операций в секунду для threads потоков, выполняющих ops операций на всех."""
+    ledger = make_ledger(accounts, stripes)
+    rng = random.Random(seed)
+    per_thread = ops // threads
+    plans = [[(rng.randrange(accounts), rng.randrange(accounts), rng.randint(50, 500))
+              for _ in range(per_thread)] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=worker, args=(ledger, operation, plan, barrier)) for plan in plans]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if operation == 'transfer':
+        assert ledger.total() == accounts * 1_000_000
+    return per_thread * threads / elapsed
+
+
+def run(ops: int, accounts: int, stripes: int, thread_counts: list, seed: int) -> None:
+    print(f'{"операция":<10}{"потоков":>8}{"1 блокировка, оп/с":>22}{f"{stripes} полос, оп/с":>22}')
+    for operation in OPERATIONS:
+        for threads in thread_counts:
+            single = measure(operation, threads, ops, accounts, 1, seed)
+            striped = measure(operation, threads, ops, accounts, stripes, seed)
+            print(f'{operation:<10}{threads:>8}{single:>22,.0f}{striped:>22,.0f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Пропускная способность Ledger')
+    parser.add_argument('--ops', type=int, default=100_000, help='Количество операций на замер')
+    parser.add_argument('--accounts', type=int, default=1000, help='Количество счетов')
+    parser.add_argument('--stripes', type=int, default=64, help='Количество полос блокировок')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16], help='Числа потоков')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора операций')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.ops, args.accounts, args.stripes, args.threads, args.seed)
@@ -0,0 +1,55 @@
+"""Сравнение банка на потоках и на процессах с разделяемыми балансами.
+
+Запуск из каталога LockBalance:
+
+    python bench_multiprocess.py --transactions 20000 --workers 1 2 4 8 --risk-work 2000
+
+Общее число транзакций делится между исполнителями; каждая операция перед
+захватом блокировки выполняет проверку рисков из ``--risk-work`` шагов. В
+потоках проверки выполняются по очереди из-за GIL, в процессах — параллельно,
+поэтому выигрыш процессов ограничен числом ядер. Время процессов включает
+запуск пула.
+"""
+import argparse
+import os
+import time
+from multiprocess_bank import MultiprocessBank, ThreadedBank
+
+
+def measure(bank, workers: int, transactions: int, min_amount: int, max_amount: int,
+            risk_work: int, seed: int) -> float:
+    """Операций (пополнений и снятий) в секунду."""
+    per_worker = transactions // workers
+    started = time.perf_counter()
+    result = bank.run(workers, per_worker, min_amount, max_amount, risk_work, seed)
+    elapsed = time.perf_counter() - started
+    assert bank.balance == result.deposited - result.taken
+    return 2 * per_worker * workers / elapsed
+
+
+def run(transactions: int, worker_counts: list, min_amount: int, max_amount: int,
+        risk_work: int, accounts: int, seed: int) -> None:
+    print(f'ядер: {os.cpu_count()}, проверка рисков: {risk_work} шагов')
+    print(f'{"исполнителей":<14}{"потоки, оп/с":>16}{"процессы, оп/с":>18}{"ускорение":>12}')
+    for workers in worker_counts:
+        threaded = measure(ThreadedBank(accounts), workers, transactions, min_amount, max_amount, risk_work, seed)
+        processes = measure(MultiprocessBank(accounts), workers, transactions, min_amount, max_amount,
+                            risk_work, seed)
+        print(f'{workers:<14}{threaded:>16,.0f}{processes:>18,.0f}{processes / threaded:>11.2f}x')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Банк на потоках против банка на процессах')
+    parser.add_argument('--transactions', type=int, default=20_000, help='Общее число транзакций')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Числа исполнителей')
+    parser.add_argument('--min-amount', type=int, default=50, help='Минимальная сумма')
+    parser.add_argument('--max-amount', type=int, default=500, help='Максимальная сумма')
+    parser.add_argument('--risk-work', type=int, default=2000, help='Шагов проверки рисков на операцию')
+    parser.add_argument('--accounts', type=int, default=16, help='Количество счетов')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.transactions, args.workers, args.min_amount, args.max_amount, args.risk_work, args.accounts, args.seed)
@@ -0,0 +1,62 @@
+"""Стоимость журнала упреждающей записи при разном размере пачки fsync.
+
+Запуск из каталога LockBalance:
+
+    python bench_wal.py --transactions 20000 --group-commit 1 10 100 1000
+
+Выполняются чередующиеся пополнения и снятия под блокировкой банка, без паузы
+и с отключённым логированием. Сравнивается Bank в памяти и DurableBank с
+разным group_commit; печатаются операции в секунду и число вызовов fsync.
+"""
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+from scripts import Bank
+from wal import DurableBank
+
+
+def apply(bank: Bank, amounts: list) -> float:
+    """Применить операции и вернуть время в секундах."""
+    started = time.perf_counter()
+    for i, amount in enumerate(amounts):
+        with bank.lock:
+            if i % 2 == 0:
+                bank._update_balance(amount)
+            elif amount <= bank.balance:
+                bank._withdraw(amount)
+    return time.perf_counter() - started
+
+
+def run(transactions: int, group_commits: list, snapshot_every: int, seed: int) -> None:
+    rng = random.Random(seed)
+    amounts = [rng.randint(50, 500) for _ in range(transactions)]
+
+    print(f'{"режим":<28}{"оп/с":>14}{"fsync":>10}')
+    print(f'{"Bank в памяти":<28}{transactions / apply(Bank(), amounts):>14,.0f}{0:>10}')
+    with tempfile.TemporaryDirectory() as directory:
+        for group_commit in group_commits:
+            path = os.path.join(directory, f'bank-{group_commit}.wal')
+            bank = DurableBank(path=path, group_commit=group_commit, snapshot_every=snapshot_every)
+            elapsed = apply(bank, amounts)
+            bank.close()
+            print(f'{f"DurableBank, пачка {group_commit}":<28}{transactions / elapsed:>14,.0f}'
+                  f'{bank._wal.syncs:>10,}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Стоимость журнала упреждающей записи')
+    parser.add_argument('--transactions', type=int, default=20_000, help='Количество операций')
+    parser.add_argument('--group-commit', type=int, nargs='+', default=[1, 10, 100, 1000],
+                        help='Размеры пачки fsync')
+    parser.add_argument('--snapshot-every', type=int, default=10_000, help='Операций между снимками')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора сумм')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.getLogger().setLevel(logging.ERROR)
+    run(args.transactions, args.group_commit, args.snapshot_every, args.seed)
@@ -0,0 +1,99 @@
+"""Сравнение стратегий блокировки на одном и том же потоке транзакций.
+
+Запуск из каталога LockBalance:
+
+    python bench_workload.py --transactions 1000000 --threads 1 2 4 --seed 42
+
+Поток генерируется один раз (NumPy, если установлен, иначе random) и без
+пауз воспроизводится в каждой стратегии:
+
+- bank — Bank, блокировка на каждую операцию;
+- bank-instrumented — Bank с InstrumentedLock при выключенном сборе;
+- journal — JournaledBank, пачки под одной блокировкой;
+- ledger — Ledger с блокировками по полосам и ``--accounts`` счетами.
+
+Логирование отключено. При одном потоке итог (баланс и число отклонённых
+снятий) стратегий с одним балансом совпадает: это проверяется и печатается,
+а при расхождении бенчмарк завершается с кодом 1. Ledger участвует в
+проверке, только если ``--accounts 1``.
+"""
+import argparse
+import logging
+import sys
+import time
+from functools import partial
+from instrumented_lock import InstrumentedLock
+from journal import JournaledBank
+from ledger import Ledger
+from scripts import Bank
+from workload import generate_workload, replay, replay_bank, replay_journal, replay_ledger
+
+
+def run_bank(workload, threads, accounts, lock=None):
+    bank = Bank() if lock is None else Bank(lock=lock)
+    elapsed, rejected = replay(partial(replay_bank, bank), workload, threads)
+    return elapsed, rejected, bank.balance
+
+
+def run_journal(workload, threads, accounts):
+    bank = JournaledBank()
+    elapsed, _ = replay(partial(replay_journal, bank), workload, threads)
+    started = time.perf_counter()
+    bank.close()
+    return elapsed + time.perf_counter() - started, bank.rejected, bank.balance
+
+
+def run_ledger(workload, threads, accounts):
+    ledger = Ledger()
+    for account in range(accounts):
+        ledger.open_account(account)
+    elapsed, rejected = replay(partial(replay_ledger, ledger), workload, threads)
+    return elapsed, rejected, ledger.total()
+
+
+STRATEGIES = {
+    'bank': run_bank,
+    'bank-instrumented': lambda workload, threads, accounts: run_bank(
+        workload, threads, accounts, InstrumentedLock('bank', sampling=False)),
+    'journal': run_journal,
+    'ledger': run_ledger,
+}
+
+
+def run(transactions, thread_counts, accounts, seed, strategies):
+    started = time.perf_counter()
+    workload = generate_workload(transactions, accounts=accounts, seed=seed)
+    print(f'поток: {len(workload):,} транзакций, генерация ({workload.backend}) '
+          f'{time.perf_counter() - started:.2f} с, seed={seed}')
+    print(f'{"стратегия":<20}{"потоков":>8}{"оп/с":>14}{"отклонено":>12}{"баланс":>16}')
+    consistent = True
+    for threads in thread_counts:
+        outcomes = {}
+        for name in strategies:
+            elapsed, rejected, balance = STRATEGIES[name](workload, threads, accounts)
+            print(f'{name:<20}{threads:>8}{len(workload) / elapsed:>14,.0f}{rejected:>12,}{balance:>16,}')
+            if name != 'ledger' or accounts == 1:
+                outcomes[name] = (balance, rejected)
+        if threads == 1 and len(outcomes) > 1:
+            same = len(set(outcomes.values())) == 1
+            consistent = consistent and same
+            print(f'итоги при одном потоке ({", ".join(outcomes)}): {"совпадают" if same else "РАСХОДЯТСЯ"}')
+    return consistent
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Стратегии блокировки на одном потоке транзакций')
+    parser.add_argument('--transactions', type=int, default=1_000_000, help='Количество транзакций')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4], help='Числа потоков')
+    parser.add_argument('--accounts', type=int, default=1, help='Количество счетов для ledger')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора')
+    parser.add_argument('--strategies', nargs='+', choices=sorted(STRATEGIES), default=list(STRATEGIES),
+                        help='Стратегии для сравнения')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.getLogger().setLevel(logging.ERROR)
+    if not run(args.transactions, args.threads, args.accounts, args.seed, args.strategies):
+        sys.exit(1)
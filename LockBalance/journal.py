@@ -0,0 +1,163 @@
+import logging
+import queue
+import random
+import threading
+from dataclasses import dataclass
+from scripts import Bank
+
+DEPOSIT = 'deposit'
+TAKE = 'take'
+
+
+@dataclass
+class JournaledBank(Bank):
+    """Банк с журналом транзакций.
+
+    Производители не захватывают блокировку: пополнения и снятия кладутся в
+    очередь, а один поток-применитель забирает их пачками до ``batch_size``
+    операций и применяет каждую пачку под одним захватом блокировки. Снятие
+    отклоняется, если на момент применения средств недостаточно. Логирование
+    выполняется после освобождения блокировки.
+
+    После close новые операции не принимаются (RuntimeError). Ошибка при
+    применении пачки не останавливает поток-применитель: она записывается в
+    ``errors``, а ожидающие flush освобождаются.
+    """
+    batch_size: int = 1024
+
+    def __post_init__(self):
+        self.applied = 0
+        self.rejected = 0
+        self.errors = []
+        self._closed = False
+        self._queue = queue.SimpleQueue()
+        self._applier = threading.Thread(target=self._apply_loop, name='bank-journal', daemon=True)
+        self._applier.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit_deposit(self, amount):
+        """Поставить пополнение в журнал."""
+        self._check_open()
+        _check_amount(amount)
+        self._queue.put((DEPOSIT, amount))
+
+    def submit_take(self, amount):
+        """Поставить снятие в журнал."""
+        self._check_open()
+        _check_amount(amount)
+        self._queue.put((TAKE, amount))
+
+    def deposit(self, transactions=100, min_amount=50, max_amount=500):
+        """Поставить в журнал пополнения на случайные суммы."""
+        self._check_open()
+        for _ in range(transactions):
+            self._queue.put((DEPOSIT, random.randint(min_amount, max_amount)))
+
+    def take(self, transactions=100, min_amount=50, max_amount=500):
+        """Поставить в журнал снятия на случайные суммы."""
+        self._check_open()
+        for _ in range(transactions):
+            self._queue.put((TAKE, random.randint(min_amount, max_amount)))
+
+    def flush(self):
+        """Дождаться применения всех операций, поставленных в журнал до вызова."""
+        self._check_open()
+        applied = threading.Event()
+        self._queue.put((applied, None))
+        while not applied.wait(0.1):
+            if not self._applier.is_alive():
+                raise RuntimeError('Поток-применитель журнала остановлен')
+
+    def close(self):
+        """Применить оставшиеся операции и остановить поток-применитель."""
+        self._closed = True
+        if self._applier.is_alive():
+            self._queue.put((None, None))
+            self._applier.join()
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError('Журнал закрыт')
+
+    def _apply_loop(self):
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                running = self._apply_batch(batch)
+            except Exception as error:
+                logging.exception("Ошибка применения пачки журнала")
+                self.errors.append(error)
+                running = self._release(batch)
+            if not running:
+                return
+
+    @staticmethod
+    def _release(batch):
+        """Освободить ожидающих flush в непримененной пачке; False, если в ней команда остановки."""
+        running = True
+        for operation, _ in batch:
+            if operation is None:
+                running = False
+            elif operation is not DEPOSIT and operation is not TAKE:
+                operation.set()
+        return running
+
+    def _apply_batch(self, batch):
+        """Применить пачку под одной блокировкой; False, если получена команда остановки."""
+        running = True
+        events = []
+        journal = []
+        with self.lock:
+            balance = self.balance
+            for operation, amount in batch:
+                if operation is DEPOSIT:
+                    balance += amount
+                    journal.append((operation, amount, balance))
+                elif operation is TAKE:
+                    if amount <= balance:
+                        balance -= amount
+                        journal.append((operation, amount, balance))
+                    else:
+                        journal.append((operation, amount, None))
+                elif operation is None:
+                    running = False
+                else:
+                    events.append(operation)
+            self.balance = balance
+        self._log(journal)
+        for event in events:
+            event.set()
+        return running
+
+    def _log(self, journal):
+        """Учесть и залогировать применённые операции вне блокировки."""
+        log_info = logging.getLogger().isEnabledFor(logging.INFO)
+        rejected = 0
+        for operation, amount, balance in journal:
+            if balance is None:
+                rejected += 1
+                logging.warning(f"Запрос на {amount} отклонён, недостаточно средств")
+            elif not log_info:
+                continue
+            elif operation is DEPOSIT:
+                logging.info(f"Пополнение: {amount}. Баланс: {balance}")
+            else:
+                logging.info(f"Снятие: {amount}. Баланс: {balance}")
+        self.applied += len(journal) - rejected
+        self.rejected += rejected
+
+
+def _check_amount(amount):
+    if not isinstance(amount, (int, float)):
+        raise TypeError(f'Сумма операции должна быть числом, а не {type(amount).__name__}')
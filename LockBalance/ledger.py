@@ -0,0 +1,122 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator, List
+
+
+class _Stripe:
+    """Полоса счетов: балансы и блокировка, защищающая их."""
+    __slots__ = ('lock', 'balances')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.balances: Dict[Hashable, int] = {}
+
+
+class Ledger:
+    """Книга счетов с блокировками по полосам.
+
+    Счёт попадает в полосу по хэшу своего идентификатора, и операции над
+    счётом захватывают только блокировку этой полосы, поэтому потоки,
+    работающие с разными счетами, почти не ждут друг друга. Перевод между
+    счетами захватывает обе полосы в порядке их номеров, что исключает
+    взаимную блокировку при встречных переводах. При ``stripes=1`` все счета
+    защищены одной общей блокировкой.
+    """
+
+    def __init__(self, stripes: int = 64):
+        if stripes < 1:
+            raise ValueError('Количество полос должно быть положительным')
+        self._stripes = [_Stripe() for _ in range(stripes)]
+
+    def _index(self, account: Hashable) -> int:
+        return hash(account) % len(self._stripes)
+
+    def _stripe(self, account: Hashable) -> _Stripe:
+        return self._stripes[hash(account) % len(self._stripes)]
+
+    def open_account(self, account: Hashable, balance: int = 0) -> None:
+        """Открыть счёт с начальным балансом."""
+        if balance < 0:
+            raise ValueError('Начальный баланс не может быть отрицательным')
+        stripe = self._stripe(account)
+        with stripe.lock:
+            if account in stripe.balances:
+                raise ValueError(f'Счёт {account} уже открыт')
+            stripe.balances[account] = balance
+
+    def balance(self, account: Hashable) -> int:
+        """Баланс счёта; KeyError, если счёт не открыт."""
+        stripe = self._stripe(account)
+        with stripe.lock:
+            return stripe.balances[account]
+
+    def deposit(self, account: Hashable, amount: int) -> int:
+        """Пополнить счёт и вернуть новый баланс."""
+        _check_amount(amount)
+        stripe = self._stripe(account)
+        with stripe.lock:
+            balances = stripe.balances
+            balances[account] += amount
+            return balances[account]
+
+    def take(self, account: Hashable, amount: int) -> bool:
+        """Снять средства со счёта; False, если средств недостаточно."""
+        _check_amount(amount)
+        stripe = self._stripe(account)
+        with stripe.lock:
+            balances = stripe.balances
+            if amount > balances[account]:
+                return False
+            balances[account] -= amount
+            return True
+
+    def transfer(self, source: Hashable, target: Hashable, amount: int) -> bool:
+        """Перевести средства между счетами; False, если на source недостаточно средств."""
+        _check_amount(amount)
+        source_index, target_index = self._index(source), self._index(target)
+        source_stripe, target_stripe = self._stripes[source_index], self._stripes[target_index]
+        if source_index == target_index:
+            with source_stripe.lock:
+                return _move(source_stripe.balances, target_stripe.balances, source, target, amount)
+        first, second = ((source_stripe, target_stripe) if source_index < target_index
+                         else (target_stripe, source_stripe))
+        with first.lock, second.lock:
+            return _move(source_stripe.balances, target_stripe.balances, source, target, amount)
+
+    @contextmanager
+    def _locked(self, *indexes: int) -> Iterator[None]:
+        """Захватить блокировки полос по возрастанию номеров, без повторов."""
+        locks = [self._stripes[index].lock for index in sorted(set(indexes))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def accounts(self) -> List[Hashable]:
+        """Идентификаторы всех открытых счетов."""
+        with self._locked(*range(len(self._stripes))):
+            return [account for stripe in self._stripes for account in stripe.balances]
+
+    def total(self) -> int:
+        """Сумма балансов всех счетов, согласованная на один момент времени."""
+        with self._locked(*range(len(self._stripes))):
+            return sum(sum(stripe.balances.values()) for stripe in self._stripes)
+
+
+def _move(source_balances: dict, target_balances: dict, source: Hashable, target: Hashable, amount: int) -> bool:
+    """Перенести сумму между счетами; вызывается под блокировками обеих полос."""
+    if target not in target_balances:
+        raise KeyError(target)
+    if amount > source_balances[source]:
+        return False
+    source_balances[source] -= amount
+    target_balances[target] += amount
+    return True
+
+
+def _check_amount(amount: int) -> None:
+    if amount <= 0:
+        raise ValueError('Сумма операции должна быть положительной')
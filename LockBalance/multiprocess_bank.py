@@ -0,0 +1,151 @@
+import multiprocessing
+import random
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class RunResult:
+    """Итог симуляции: суммы пополнений и снятий и число отклонённых снятий."""
+    deposited: int = 0
+    taken: int = 0
+    rejected: int = 0
+
+    def add(self, other: 'RunResult') -> None:
+        self.deposited += other.deposited
+        self.taken += other.taken
+        self.rejected += other.rejected
+
+
+def risk_check(amount, work):
+    """Имитация проверки рисков: чисто вычислительная работа из work шагов."""
+    score = amount
+    for i in range(work):
+        score = (score * 31 + i) % 1000003
+    return score
+
+
+def simulate(balances, locks, transactions=100, min_amount=50, max_amount=500, risk_work=0, seed=None):
+    """Выполнить transactions пополнений и столько же снятий над случайными счетами.
+
+    Проверка рисков выполняется вне блокировки, под блокировкой счёта только
+    меняется баланс. Подходит и для потоков (список и threading.Lock), и для
+    процессов (разделяемый массив и multiprocessing.Lock).
+    """
+    rng = random.Random(seed)
+    accounts = len(locks)
+    result = RunResult()
+    for _ in range(transactions):
+        account = rng.randrange(accounts)
+        amount = rng.randint(min_amount, max_amount)
+        risk_check(amount, risk_work)
+        with locks[account]:
+            balances[account] += amount
+        result.deposited += amount
+
+        account = rng.randrange(accounts)
+        amount = rng.randint(min_amount, max_amount)
+        risk_check(amount, risk_work)
+        with locks[account]:
+            if amount <= balances[account]:
+                balances[account] -= amount
+                result.taken += amount
+                continue
+        result.rejected += 1
+    return result
+
+
+_shared = None
+
+
+def _init_worker(balances, locks):
+    global _shared
+    _shared = balances, locks
+
+
+def _run_worker(kwargs):
+    balances, locks = _shared
+    return simulate(balances, locks, **kwargs)
+
+
+class MultiprocessBank:
+    """Банк, в котором операции выполняют процессы пула.
+
+    Каждый процесс чередует пополнения и снятия над случайными счетами,
+    отдельных процессов для пополнений и для снятий нет.
+
+    Балансы ``accounts`` счетов лежат в разделяемом массиве
+    multiprocessing.Array, у каждого счёта своя межпроцессная блокировка.
+    Вычисления вне блокировок (проверка рисков) выполняются параллельно, а не
+    по очереди из-за GIL, как в потоках.
+    """
+
+    def __init__(self, accounts=1, balance=0, context=None):
+        self._context = context or multiprocessing.get_context()
+        self._balances = self._context.Array('q', [balance] * accounts, lock=False)
+        self._locks = [self._context.Lock() for _ in range(accounts)]
+
+    @property
+    def balances(self):
+        """Балансы всех счетов."""
+        return list(self._balances)
+
+    @property
+    def balance(self):
+        """Суммарный баланс всех счетов."""
+        return sum(self._balances)
+
+    def run(self, workers=2, transactions=100, min_amount=50, max_amount=500, risk_work=0, seed=None):
+        """Запустить workers процессов, каждый выполняет transactions пополнений и снятий."""
+        tasks = [dict(transactions=transactions, min_amount=min_amount, max_amount=max_amount,
+                      risk_work=risk_work, seed=None if seed is None else seed + i)
+                 for i in range(workers)]
+        result = RunResult()
+        with self._context.Pool(workers, initializer=_init_worker,
+                                initargs=(self._balances, self._locks)) as pool:
+            for worker_result in pool.map(_run_worker, tasks):
+                result.add(worker_result)
+        return result
+
+
+class ThreadedBank:
+    """Тот же банк на потоках: для сравнения с MultiprocessBank."""
+
+    def __init__(self, accounts=1, balance=0):
+        self._balances = [balance] * accounts
+        self._locks = [threading.Lock() for _ in range(accounts)]
+
+    @property
+    def balances(self):
+        """Балансы всех счетов."""
+        return list(self._balances)
+
+    @property
+    def balance(self):
+        """Суммарный баланс всех счетов."""
+        return sum(self._balances)
+
+    def run(self, workers=2, transactions=100, min_amount=50, max_amount=500, risk_work=0, seed=None):
+        """Запустить workers потоков, каждый выполняет transactions пополнений и снятий."""
+        results = [None] * workers
+
+        def target(i):
+            results[i] = simulate(self._balances, self._locks, transactions, min_amount, max_amount,
+                                  risk_work, None if seed is None else seed + i)
+
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        result = RunResult()
+        for worker_result in results:
+            result.add(worker_result)
+        return result
+
+
+if __name__ == "__main__":
+    bank = MultiprocessBank()
+    result = bank.run(workers=2)
+    print(f'Пополнено: {result.deposited}, снято: {result.taken}, отклонено: {result.rejected}')
+    print(f'Итоговый баланс: {bank.balance}')
@@ -3,7 +3,7 @@ import random
 import time
 import logging
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logging.basicConfig(level=logging.INFO)
 
@@ -18,7 +18,7 @@ def acquire_lock(lock):
 @dataclass
 class Bank:
     balance: int = 0
-    lock: threading.Lock = threading.Lock()
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def deposit(self, transactions=100, min_amount=50, max_amount=500):
         """Метод для пополнения баланса банка."""
@@ -52,20 +52,21 @@ class Bank:
         self.balance -= amount
         logging.info(f"Снятие: {amount}. Баланс: {self.balance}")
 
-# Создаем объект класса Bank
-bk = Bank()
+if __name__ == "__main__":
+    # Создаем объект класса Bank
+    bk = Bank()
 
-# Создаем потоки для методов deposit и take
-th1 = threading.Thread(target=Bank.deposit, args=(bk,))
-th2 = threading.Thread(target=Bank.take, args=(bk,))
+    # Создаем потоки для методов deposit и take
+    th1 = threading.Thread(target=Bank.deposit, args=(bk,))
+    th2 = threading.Thread(target=Bank.take, args=(bk,))
 
-# Запускаем потоки
-th1.start()
-th2.start()
+    # Запускаем потоки
+    th1.start()
+    th2.start()
 
-# Ждем завершения потоков
-th1.join()
-th2.join()
+    # Ждем завершения потоков
+    th1.join()
+    th2.join()
 
-# Выводим итоговый баланс
-print(f'Итоговый баланс: {bk.balance}')
+    # Выводим итоговый баланс
+    print(f'Итоговый баланс: {bk.balance}')
@@ -0,0 +1,76 @@
+import unittest
+import asyncio
+from async_bank import DEPOSIT, TAKE, AsyncBank
+
+
+class TestAsyncBank(unittest.IsolatedAsyncioTestCase):
+
+    async def test_deposit_and_take(self):
+        """Проверяем пополнение, снятие и отклонение при недостатке средств."""
+        bank = AsyncBank()
+        self.assertEqual(await bank.deposit(300), 300)
+        self.assertTrue(await bank.take(200))
+        self.assertFalse(await bank.take(200))
+        self.assertEqual(bank.balance, 100)
+
+    async def test_take_waits_for_funds(self):
+        """Проверяем, что снятие с wait=True дожидается пополнения."""
+        bank = AsyncBank()
+        take = asyncio.create_task(bank.take(150, wait=True))
+        await asyncio.sleep(0)
+        await bank.deposit(100)
+        self.assertFalse(take.done())
+        await bank.deposit(100)
+        self.assertTrue(await take)
+        self.assertEqual(bank.balance, 50)
+        self.assertFalse(await bank.take(100, wait=True, timeout=0.01))
+
+    async def test_queue_backpressure(self):
+        """Проверяем, что при заполненной очереди submit ждёт места."""
+        bank = AsyncBank(max_pending=2)
+        await bank.submit(DEPOSIT, 10)
+        await bank.submit(DEPOSIT, 10)
+        blocked = asyncio.create_task(bank.submit(DEPOSIT, 10))
+        await asyncio.sleep(0)
+        self.assertEqual(bank.pending, 2)
+        self.assertFalse(blocked.done())
+        async with bank:
+            future = await blocked
+            self.assertEqual(await future, 30)
+        self.assertEqual(bank.balance, 30)
+
+    async def test_many_clients_through_queue(self):
+        """Проверяем, что ожидающие снятия через очередь не блокируют пополнения."""
+        async with AsyncBank(max_pending=8) as bank:
+            takes = [bank.call(TAKE, 10, wait=True) for _ in range(50)]
+            deposits = [bank.call(DEPOSIT, 10) for _ in range(50)]
+            results = await asyncio.gather(*takes, *deposits)
+        self.assertTrue(all(results[:50]))
+        self.assertEqual(bank.balance, 0)
+
+    async def test_close_rejects_waiting_takes(self):
+        """Проверяем, что при закрытии снятия, ждущие средств, отклоняются."""
+        bank = AsyncBank()
+        bank.start()
+        future = await bank.submit(TAKE, 100, wait=True)
+        await asyncio.sleep(0)
+        await bank.close()
+        self.assertFalse(await future)
+
+    async def test_close_without_start_cancels_requests(self):
+        """Проверяем, что закрытие незапущенного банка отменяет запросы из очереди, в том числе ждавшие места."""
+        bank = AsyncBank(max_pending=1)
+        queued = await bank.submit(DEPOSIT, 10)
+        blocked = asyncio.create_task(bank.submit(DEPOSIT, 20))
+        await asyncio.sleep(0)
+        await bank.close()
+        self.assertTrue(queued.cancelled())
+        self.assertTrue((await blocked).cancelled())
+        self.assertEqual(bank.pending, 0)
+        with self.assertRaises(RuntimeError):
+            await bank.submit(DEPOSIT, 30)
+        self.assertEqual(bank.balance, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
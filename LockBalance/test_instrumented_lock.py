@@ -0,0 +1,70 @@
+import unittest
+import threading
+import time
+from instrumented_lock import InstrumentedLock
+from scripts import Bank, acquire_lock
+
+
+class TestInstrumentedLock(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем новую блокировку со сбором статистики перед каждым тестом."""
+        self.lock = InstrumentedLock('test')
+
+    def test_counts_and_histograms(self):
+        """Проверяем, что каждый захват попадает в гистограммы ожидания и удержания."""
+        for _ in range(5):
+            with self.lock:
+                pass
+        with acquire_lock(self.lock):
+            time.sleep(0.002)
+        stats = self.lock.stats()
+        self.assertEqual(stats['acquisitions'], 6)
+        self.assertEqual(stats['wait']['count'], 6)
+        self.assertEqual(stats['hold']['buckets'][float('inf')], 6)
+        self.assertGreaterEqual(stats['hold']['sum_ns'], 2_000_000)
+        self.assertEqual(stats['contended'], 0)
+
+    def test_contended_call_site(self):
+        """Проверяем, что захват с ожиданием учитывается по месту вызова вне acquire_lock."""
+        holding = threading.Event()
+
+        def hold():
+            with self.lock:
+                holding.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        holding.wait()
+        with acquire_lock(self.lock):
+            pass
+        thread.join()
+
+        stats = self.lock.stats()
+        self.assertEqual(stats['contended'], 1)
+        [site] = stats['contended_by_site']
+        self.assertIn('test_instrumented_lock.py', site)
+        self.assertIn('test_contended_call_site', site)
+        self.assertGreaterEqual(stats['wait']['sum_ns'], 10_000_000)
+
+    def test_sampling_off(self):
+        """Проверяем, что при выключенном сборе блокировка работает, а статистика не растёт."""
+        self.lock.set_sampling(False)
+        with self.lock:
+            self.assertTrue(self.lock.locked())
+            self.assertFalse(self.lock.acquire(False))
+        self.assertEqual(self.lock.stats()['acquisitions'], 0)
+
+    def test_bank_with_instrumented_lock(self):
+        """Проверяем работу Bank с InstrumentedLock и экспорт в формате Prometheus."""
+        bank = Bank(lock=self.lock)
+        bank.deposit(transactions=3, min_amount=50, max_amount=100)
+        text = self.lock.prometheus_text()
+        self.assertIn('# TYPE lock_wait_seconds histogram', text)
+        self.assertIn('lock_hold_seconds_bucket{lock="test",le="+Inf"} 3', text)
+        self.assertIn('lock_acquisitions_total{lock="test"} 3', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
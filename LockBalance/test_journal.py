@@ -0,0 +1,75 @@
+import unittest
+import threading
+from journal import DEPOSIT, JournaledBank
+
+
+class TestJournaledBank(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем новый JournaledBank перед каждым тестом."""
+        self.bank = JournaledBank(batch_size=16)
+
+    def tearDown(self):
+        self.bank.close()
+
+    def test_submit_and_flush(self):
+        """Проверяем, что после flush все операции применены по порядку."""
+        self.bank.submit_deposit(100)
+        self.bank.submit_take(70)
+        self.bank.submit_take(70)  # Отклоняется: на балансе 30
+        self.bank.flush()
+        self.assertEqual(self.bank.balance, 30)
+        self.assertEqual((self.bank.applied, self.bank.rejected), (2, 1))
+
+    def test_close_applies_pending(self):
+        """Проверяем, что close применяет оставшиеся операции журнала."""
+        self.bank.deposit(transactions=100, min_amount=50, max_amount=100)
+        self.bank.close()
+        self.assertGreaterEqual(self.bank.balance, 100 * 50)
+        self.assertEqual(self.bank.applied, 100)
+
+    def test_closed_journal_rejects_operations(self):
+        """Проверяем, что после close операции и flush не принимаются, а не теряются молча."""
+        self.bank.close()
+        with self.assertRaises(RuntimeError):
+            self.bank.submit_deposit(100)
+        with self.assertRaises(RuntimeError):
+            self.bank.deposit(transactions=1)
+        with self.assertRaises(RuntimeError):
+            self.bank.flush()
+        self.assertEqual(self.bank.balance, 0)
+
+    def test_invalid_amount_rejected(self):
+        """Проверяем, что нечисловая сумма отклоняется сразу и не останавливает применитель."""
+        with self.assertRaises(TypeError):
+            self.bank.submit_deposit('100')
+        self.bank.submit_deposit(100)
+        self.bank.flush()
+        self.assertEqual(self.bank.balance, 100)
+
+    def test_apply_error_releases_flush(self):
+        """Проверяем, что ошибка применения записывается, а flush не зависает."""
+        with self.assertLogs(level='ERROR'):
+            self.bank._queue.put((DEPOSIT, object()))  # Минуя проверку submit_deposit
+            self.bank.flush()
+        self.assertEqual(len(self.bank.errors), 1)
+        self.bank.submit_deposit(100)
+        self.bank.flush()
+        self.assertEqual(self.bank.balance, 100)
+
+    def test_concurrent_producers(self):
+        """Проверяем, что операции нескольких производителей не теряются и баланс не отрицателен."""
+        threads = [threading.Thread(target=self.bank.deposit, args=(500, 50, 100)) for _ in range(2)]
+        threads += [threading.Thread(target=self.bank.take, args=(500, 50, 100)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.bank.flush()
+
+        self.assertEqual(self.bank.applied + self.bank.rejected, 2000)
+        self.assertGreaterEqual(self.bank.balance, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import threading
+import random
+from ledger import Ledger
+
+
+class TestLedger(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем книгу счетов с двумя счетами перед каждым тестом."""
+        self.ledger = Ledger(stripes=8)
+        self.ledger.open_account('alice', 500)
+        self.ledger.open_account('bob')
+
+    def test_open_account(self):
+        """Проверяем начальные балансы и запрет повторного открытия счета."""
+        self.assertEqual(self.ledger.balance('alice'), 500)
+        self.assertEqual(self.ledger.balance('bob'), 0)
+        with self.assertRaises(ValueError):
+            self.ledger.open_account('alice')
+        with self.assertRaises(KeyError):
+            self.ledger.balance('carol')
+
+    def test_deposit_and_take(self):
+        """Проверяем пополнение и снятие, в том числе при недостатке средств."""
+        self.assertEqual(self.ledger.deposit('bob', 100), 100)
+        self.assertTrue(self.ledger.take('bob', 60))
+        self.assertFalse(self.ledger.take('bob', 60))
+        self.assertEqual(self.ledger.balance('bob'), 40)
+        with self.assertRaises(ValueError):
+            self.ledger.deposit('bob', 0)
+
+    def test_transfer(self):
+        """Проверяем перевод между счетами и отказ при недостатке средств."""
+        self.assertTrue(self.ledger.transfer('alice', 'bob', 200))
+        self.assertFalse(self.ledger.transfer('bob', 'alice', 300))
+        self.assertEqual((self.ledger.balance('alice'), self.ledger.balance('bob')), (300, 200))
+        with self.assertRaises(KeyError):
+            self.ledger.transfer('alice', 'carol', 10)
+        self.assertEqual(self.ledger.balance('alice'), 300)
+
+    def test_concurrent_transfers_keep_total(self):
+        """Проверяем, что встречные переводы не вызывают взаимной блокировки и сохраняют сумму."""
+        ledger = Ledger(stripes=4)
+        for account in range(20):
+            ledger.open_account(account, 1000)
+
+        def transfers(seed):
+            rng = random.Random(seed)
+            for _ in range(2000):
+                source, target = rng.randrange(20), rng.randrange(20)
+                ledger.transfer(source, target, rng.randint(1, 300))
+
+        threads = [threading.Thread(target=transfers, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(ledger.total(), 20 * 1000)
+        self.assertTrue(all(ledger.balance(account) >= 0 for account in ledger.accounts()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from multiprocess_bank import MultiprocessBank, ThreadedBank
+
+
+class TestMultiprocessBank(unittest.TestCase):
+
+    def test_balance_matches_operations(self):
+        """Проверяем, что итоговый баланс равен разнице пополнений и снятий."""
+        bank = MultiprocessBank(accounts=4, balance=100)
+        result = bank.run(workers=2, transactions=200, min_amount=50, max_amount=100, seed=1)
+        self.assertEqual(bank.balance, 400 + result.deposited - result.taken)
+        self.assertTrue(all(balance >= 0 for balance in bank.balances))
+
+    def test_same_result_as_threads(self):
+        """Проверяем, что один процесс и один поток с тем же зерном дают одинаковый итог."""
+        processes, threads = MultiprocessBank(accounts=2), ThreadedBank(accounts=2)
+        process_result = processes.run(workers=1, transactions=100, risk_work=10, seed=7)
+        thread_result = threads.run(workers=1, transactions=100, risk_work=10, seed=7)
+        self.assertEqual(process_result, thread_result)
+        self.assertEqual(processes.balances, threads.balances)
+
+    def test_take_insufficient_funds(self):
+        """Проверяем, что снятия больше баланса счета отклоняются и баланс не отрицателен."""
+        bank = ThreadedBank(accounts=8)
+        result = bank.run(workers=4, transactions=200, min_amount=50, max_amount=500, seed=3)
+        self.assertGreater(result.rejected, 0)
+        self.assertTrue(all(balance >= 0 for balance in bank.balances))
+        self.assertEqual(bank.balance, result.deposited - result.taken)
+
+
+if __name__ == '__main__':
+    unittest.main()
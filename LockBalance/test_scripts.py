@@ -15,6 +15,10 @@ class TestBank(unittest.TestCase):
         """Проверяем, что начальный баланс равен 0."""
         self.assertEqual(self.bank.balance, 0)
 
+    def test_banks_do_not_share_lock(self):
+        """Проверяем, что у каждого объекта Bank своя блокировка."""
+        self.assertIsNot(self.bank.lock, Bank().lock)
+
     def test_deposit(self):
         """Проверяем, что метод deposit корректно увеличивает баланс."""
         self.bank.deposit(transactions=10, min_amount=50, max_amount=100)
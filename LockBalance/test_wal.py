@@ -0,0 +1,73 @@
+import unittest
+import os
+import shutil
+import tempfile
+from wal import DurableBank, WriteAheadLog
+
+
+class TestDurableBank(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем временный каталог для журнала перед каждым тестом."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'bank.wal')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_replay_after_crash(self):
+        """Проверяем, что баланс восстанавливается из журнала без закрытия банка."""
+        bank = DurableBank(path=self.path)
+        bank.deposit(transactions=20, min_amount=50, max_amount=100)
+        bank.take(transactions=5, min_amount=50, max_amount=100)
+        # Банк не закрыт, как при аварийном завершении
+        self.assertEqual(DurableBank(path=self.path).balance, bank.balance)
+
+    def test_path_required(self):
+        """Проверяем, что без явного пути журнал не создаётся в текущем каталоге."""
+        with self.assertRaises(ValueError):
+            DurableBank()
+
+    def test_initial_balance_and_snapshot(self):
+        """Проверяем восстановление из снимка и журнала после него."""
+        with DurableBank(balance=300, path=self.path, snapshot_every=5) as bank:
+            bank.deposit(transactions=12, min_amount=50, max_amount=100)
+        self.assertTrue(os.path.exists(self.path + '.snapshot'))
+        self.assertEqual(DurableBank(path=self.path).balance, bank.balance)
+
+    def test_torn_tail_ignored(self):
+        """Проверяем, что недописанная последняя запись отбрасывается."""
+        with DurableBank(path=self.path) as bank:
+            bank.deposit(transactions=3, min_amount=100, max_amount=100)
+        with open(self.path, 'ab') as f:
+            f.write(b'4 D 10')
+        with DurableBank(path=self.path) as recovered:
+            self.assertEqual(recovered.balance, 300)
+            recovered.deposit(transactions=1, min_amount=5, max_amount=5)
+        self.assertEqual(DurableBank(path=self.path).balance, 305)
+
+    def test_records_before_snapshot_skipped(self):
+        """Проверяем, что записи, учтённые в снимке, не применяются повторно."""
+        with DurableBank(path=self.path) as bank:
+            bank.deposit(transactions=3, min_amount=100, max_amount=100)
+            with open(self.path, 'rb') as f:
+                journal = f.read()
+            bank.checkpoint()
+        # Сбой между записью снимка и обрезкой журнала
+        with open(self.path, 'wb') as f:
+            f.write(journal)
+        self.assertEqual(DurableBank(path=self.path).balance, 300)
+
+    def test_group_commit(self):
+        """Проверяем, что fsync выполняется один раз на пачку записей."""
+        wal = WriteAheadLog(self.path, group_commit=10, fsync=False)
+        wal.recover()
+        for _ in range(25):
+            wal.append('D', 1)
+        self.assertEqual(wal.syncs, 2)
+        wal.close()
+        self.assertEqual(wal.syncs, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import logging
+from functools import partial
+from journal import JournaledBank
+from ledger import Ledger
+from scripts import Bank
+from workload import DEPOSIT, TAKE, generate_workload, replay, replay_bank, replay_journal, replay_ledger
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestWorkload(unittest.TestCase):
+
+    def setUp(self):
+        """Отключаем логирование операций: потоки содержат тысячи транзакций."""
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_seeded_generation(self):
+        """Проверяем, что одно зерно дает один и тот же поток, а другое — другой."""
+        first = generate_workload(1000, min_amount=50, max_amount=60, seed=1)
+        second = generate_workload(1000, min_amount=50, max_amount=60, seed=1)
+        self.assertEqual(list(first.amounts), list(second.amounts))
+        self.assertEqual(list(first.operations), list(second.operations))
+        self.assertNotEqual(list(first.amounts), list(generate_workload(1000, seed=2).amounts))
+        self.assertTrue(all(50 <= amount <= 60 for amount in first.amounts))
+        self.assertEqual(set(first.operations), {DEPOSIT, TAKE})
+
+    def test_random_fallback(self):
+        """Проверяем генерацию без NumPy и разбиение потока на части."""
+        workload = generate_workload(10, accounts=3, seed=5, use_numpy=False)
+        self.assertEqual(workload.backend, 'random')
+        self.assertTrue(all(0 <= account < 3 for account in workload.accounts))
+        parts = workload.split(3)
+        self.assertEqual([len(part) for part in parts], [4, 4, 2])
+        self.assertEqual([amount for part in parts for amount in part.amounts], list(workload.amounts))
+
+    @unittest.skipIf(numpy is None, 'NumPy не установлен')
+    def test_numpy_backend(self):
+        """Проверяем векторную генерацию через NumPy."""
+        workload = generate_workload(1000, seed=3, use_numpy=True)
+        self.assertEqual(workload.backend, 'numpy')
+        self.assertEqual(workload.amounts, generate_workload(1000, seed=3, use_numpy=True).amounts)
+
+    def test_strategies_agree_on_same_workload(self):
+        """Проверяем, что в одном потоке Bank, JournaledBank и Ledger дают одинаковый итог."""
+        workload = generate_workload(5000, seed=7)
+
+        bank = Bank()
+        _, bank_rejected = replay(partial(replay_bank, bank), workload)
+
+        journaled = JournaledBank()
+        replay(partial(replay_journal, journaled), workload)
+        journaled.close()
+
+        ledger = Ledger()
+        ledger.open_account(0)
+        _, ledger_rejected = replay(partial(replay_ledger, ledger), workload)
+
+        self.assertEqual(bank.balance, journaled.balance)
+        self.assertEqual(bank.balance, ledger.balance(0))
+        self.assertEqual(bank_rejected, journaled.rejected)
+        self.assertEqual(bank_rejected, ledger_rejected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional
+from scripts import Bank
+
+DEPOSIT = 'D'
+WITHDRAW = 'W'
+
+
+class WriteAheadLog:
+    """Журнал упреждающей записи для баланса банка.
+
+    Каждая операция дописывается в конец файла строкой ``<номер> <D|W> <сумма>``.
+    Записи сбрасываются на диск (flush и fsync) пачками по ``group_commit``
+    штук, поэтому стоимость надёжности зависит от размера пачки, а не от
+    числа транзакций; при сбое могут потеряться только записи последней
+    незавершённой пачки. Снимок баланса пишется во временный файл и атомарно
+    заменяет предыдущий через os.replace. Каталог сбрасывается на диск до
+    обрезки журнала, чтобы после сбоя питания не остаться без снимка и без
+    журнала одновременно.
+    Номера записей позволяют при восстановлении пропустить операции, уже
+    учтённые в снимке, даже если сбой произошёл между снимком и обрезкой.
+    """
+
+    def __init__(self, path: str, group_commit: int = 1, fsync: bool = True):
+        if group_commit < 1:
+            raise ValueError('Размер пачки должен быть положительным')
+        self.path = path
+        self.snapshot_path = path + '.snapshot'
+        self.group_commit = group_commit
+        self.fsync = fsync
+        self.seq = 0
+        self.records_since_snapshot = 0
+        self.syncs = 0
+        self._pending = 0
+        self._file = None
+
+    def recover(self):
+        """Восстановить баланс из снимка и журнала; None, если сохранённого состояния нет.
+
+        Недописанная последняя строка (сбой посреди записи) отбрасывается.
+        После восстановления журнал открыт для дописывания.
+        """
+        balance, snapshot_seq = None, 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            balance, snapshot_seq = snapshot['balance'], snapshot['seq']
+        self.seq = snapshot_seq
+
+        valid_size = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    record = _parse_record(line)
+                    if record is None:
+                        break
+                    valid_size += len(line)
+                    seq, operation, amount = record
+                    if seq <= snapshot_seq:
+                        continue
+                    balance = (balance or 0) + (amount if operation == DEPOSIT else -amount)
+                    self.seq = seq
+                    self.records_since_snapshot += 1
+
+        self._file = open(self.path, 'ab')
+        if self._file.tell() != valid_size:
+            self._file.truncate(valid_size)
+        return balance
+
+    def append(self, operation: str, amount: int) -> int:
+        """Дописать операцию и вернуть её номер; каждые group_commit записей сбрасываются на диск."""
+        self.seq += 1
+        self._file.write(f'{self.seq} {operation} {amount}\n'.encode('ascii'))
+        self.records_since_snapshot += 1
+        self._pending += 1
+        if self._pending >= self.group_commit:
+            self.sync()
+        return self.seq
+
+    def sync(self) -> None:
+        """Сбросить дописанные записи на диск."""
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.syncs += 1
+        self._pending = 0
+
+    def snapshot(self, balance: int) -> None:
+        """Атомарно записать снимок баланса и обрезать журнал."""
+        self.sync()
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'balance': balance, 'seq': self.seq}, f)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        if self.fsync:
+            _fsync_directory(self.snapshot_path)
+        self._file.truncate(0)
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.records_since_snapshot = 0
+
+    def close(self) -> None:
+        """Сбросить оставшиеся записи и закрыть журнал."""
+        if self._file is not None and not self._file.closed:
+            if self._pending:
+                self.sync()
+            self._file.close()
+
+
+def _fsync_directory(path: str) -> None:
+    """Сбросить на диск каталог файла, чтобы переименование в нём пережило сбой питания."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Windows: каталог нельзя открыть для fsync
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _parse_record(line: bytes):
+    """Разобрать строку журнала; None для недописанной или повреждённой строки."""
+    if not line.endswith(b'\n'):
+        return None
+    try:
+        seq, operation, amount = line.decode('ascii').split()
+        if operation not in (DEPOSIT, WITHDRAW):
+            return None
+        return int(seq), operation, int(amount)
+    except ValueError:
+        return None
+
+
+@dataclass
+class DurableBank(Bank):
+    """Банк, переживающий перезапуск: операции пишутся в журнал до изменения баланса.
+
+    При создании баланс восстанавливается из снимка и журнала по ``path``,
+    путь обязателен. Каждые ``snapshot_every`` операций пишется снимок и
+    журнал обрезается.
+    """
+    path: Optional[str] = None
+    group_commit: int = 1
+    snapshot_every: int = 10000
+    fsync: bool = True
+
+    def __post_init__(self):
+        if not self.path:
+            raise ValueError('Укажите путь к журналу: DurableBank(path=...)')
+        self._wal = WriteAheadLog(self.path, self.group_commit, self.fsync)
+        recovered = self._wal.recover()
+        if recovered is not None:
+            self.balance = recovered
+        elif self.balance:
+            self._wal.snapshot(self.balance)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _update_balance(self, amount):
+        """Записывает пополнение в журнал и обновляет баланс."""
+        self._wal.append(DEPOSIT, amount)
+        super()._update_balance(amount)
+        self._maybe_snapshot()
+
+    def _withdraw(self, amount):
+        """Записывает снятие в журнал и снимает сумму с баланса."""
+        self._wal.append(WITHDRAW, amount)
+        super()._withdraw(amount)
+        self._maybe_snapshot()
+
+    def _maybe_snapshot(self):
+        if self._wal.records_since_snapshot >= self.snapshot_every:
+            self._wal.snapshot(self.balance)
+
+    def checkpoint(self):
+        """Записать снимок текущего баланса и обрезать журнал."""
+        with self.lock:
+            self._wal.snapshot(self.balance)
+
+    def close(self):
+        """Сбросить журнал на диск и закрыть его."""
+        with self.lock:
+            self._wal.close()
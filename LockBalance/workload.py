@@ -0,0 +1,130 @@
+import random
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Sequence
+from scripts import acquire_lock
+
+DEPOSIT = 0
+TAKE = 1
+
+
+@dataclass
+class Workload:
+    """Заранее сгенерированный поток транзакций.
+
+    ``operations`` — коды операций (DEPOSIT или TAKE), ``amounts`` — суммы,
+    ``accounts`` — номера счетов (для банков с одним балансом не используются).
+    ``backend`` показывает, чем сгенерированы данные: "numpy" или "random".
+    """
+    operations: Sequence[int]
+    amounts: Sequence[int]
+    accounts: Sequence[int]
+    seed: int
+    backend: str
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def split(self, parts):
+        """Разбить поток на parts непрерывных частей для параллельного воспроизведения."""
+        size = max(1, -(-len(self) // parts))
+        return [Workload(self.operations[i:i + size], self.amounts[i:i + size], self.accounts[i:i + size],
+                         self.seed, self.backend)
+                for i in range(0, len(self), size)]
+
+
+def generate_workload(transactions, min_amount=50, max_amount=500, deposit_ratio=0.5, accounts=1,
+                      seed=0, use_numpy=None):
+    """Сгенерировать воспроизводимый поток транзакций.
+
+    Если установлен NumPy (или use_numpy=True), суммы, операции и счета
+    генерируются векторно через numpy.random.default_rng(seed); иначе — через
+    random.Random(seed). Один и тот же seed даёт один и тот же поток в пределах
+    одного способа генерации, но потоки NumPy и random различаются.
+    """
+    if use_numpy is not False:
+        try:
+            import numpy as np
+        except ImportError:
+            if use_numpy:
+                raise
+        else:
+            rng = np.random.default_rng(seed)
+            amounts = rng.integers(min_amount, max_amount + 1, size=transactions, dtype=np.int64)
+            operations = (rng.random(transactions) >= deposit_ratio).astype(np.int8)
+            account_ids = rng.integers(0, accounts, size=transactions, dtype=np.int64)
+            return Workload(operations.tolist(), amounts.tolist(), account_ids.tolist(), seed, 'numpy')
+
+    rng = random.Random(seed)
+    randint, uniform = rng.randint, rng.random
+    amounts = array('q', [randint(min_amount, max_amount) for _ in range(transactions)])
+    operations = array('b', [DEPOSIT if uniform() < deposit_ratio else TAKE for _ in range(transactions)])
+    if accounts > 1:
+        account_ids = array('q', [rng.randrange(accounts) for _ in range(transactions)])
+    else:
+        account_ids = array('q', [0]) * transactions
+    return Workload(operations, amounts, account_ids, seed, 'random')
+
+
+def replay_bank(bank, workload):
+    """Воспроизвести поток в Bank без пауз, захватывая блокировку на каждую операцию.
+
+    Возвращает число отклонённых снятий.
+    """
+    rejected = 0
+    lock = bank.lock
+    for operation, amount in zip(workload.operations, workload.amounts):
+        with acquire_lock(lock):
+            if operation == DEPOSIT:
+                bank._update_balance(amount)
+            elif amount <= bank.balance:
+                bank._withdraw(amount)
+            else:
+                rejected += 1
+    return rejected
+
+
+def replay_journal(bank, workload):
+    """Поставить поток в журнал JournaledBank; результат виден после flush или close."""
+    submit = (bank.submit_deposit, bank.submit_take)
+    for operation, amount in zip(workload.operations, workload.amounts):
+        submit[operation](amount)
+
+
+def replay_ledger(ledger, workload):
+    """Воспроизвести поток в Ledger по счетам workload.accounts; вернуть число отклонённых снятий."""
+    rejected = 0
+    deposit, take = ledger.deposit, ledger.take
+    for operation, amount, account in zip(workload.operations, workload.amounts, workload.accounts):
+        if operation == DEPOSIT:
+            deposit(account, amount)
+        elif not take(account, amount):
+            rejected += 1
+    return rejected
+
+
+def replay(apply, workload, threads=1):
+    """Воспроизвести поток функцией apply(workload) в threads потоках.
+
+    Поток делится на непрерывные части, части запускаются одновременно.
+    Возвращает время в секундах и сумму результатов apply (например, число
+    отклонённых снятий). При threads=1 результат детерминирован.
+    """
+    parts = workload.split(threads)
+    results = [0] * len(parts)
+    barrier = threading.Barrier(len(parts) + 1)
+
+    def target(i):
+        barrier.wait()
+        results[i] = apply(parts[i])
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(len(parts))]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started, sum(result or 0 for result in results)
@@ -0,0 +1,67 @@
+"""Пересадка гостей по событиям против опроса столов в цикле.
+
+Запуск из каталога QueuesInThreading:
+
+    python bench_cafe.py --tables 100 --guests 10000 --min-wait 0.02 --max-wait 0.05
+
+Для каждого режима печатаются общее время, задержка между уходом гостя и
+посадкой следующего за его стол (p50/p99) и загрузка процессора — отношение
+процессорного времени процесса к реальному. Режим опроса воспроизводит прежний
+discuss_guests и включается флагом ``--polling``.
+"""
+import argparse
+import logging
+import time
+from threading import Event
+from cafe import Cafe, Guest, Table
+
+
+class PollingCafe(Cafe):
+    """Прежняя реализация: непрерывный опрос всех столов."""
+
+    def discuss_guests(self):
+        while not self.queue.empty() or any(not table.is_free() for table in self.tables):
+            for table in self.tables:
+                self._check_table(table)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] if values else 0.0
+
+
+def measure(cafe_class, tables, guests, wait_range):
+    cafe = cafe_class([Table(number) for number in range(1, tables + 1)])
+    visitors = [Guest(f'Гость {i}', Event(), wait_range) for i in range(guests)]
+    started, cpu_started = time.perf_counter(), time.process_time()
+    cafe.guest_arrival(*visitors)
+    cafe.discuss_guests()
+    cafe.close_cafe()
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+    latencies = cafe.seating_latencies
+    return elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), cpu / elapsed
+
+
+def run(tables, guests, wait_range, polling):
+    modes = [('события', Cafe)] + ([('опрос', PollingCafe)] if polling else [])
+    print(f'столов: {tables}, гостей: {guests}, время за столом: {wait_range[0]}–{wait_range[1]} с')
+    print(f'{"режим":<10}{"время, с":>10}{"p50, мкс":>12}{"p99, мкс":>12}{"загрузка ЦП":>14}')
+    for name, cafe_class in modes:
+        elapsed, p50, p99, load = measure(cafe_class, tables, guests, wait_range)
+        print(f'{name:<10}{elapsed:>10.2f}{p50 * 1e6:>12,.0f}{p99 * 1e6:>12,.0f}{load:>13.0%}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Пересадка гостей по событиям против опроса')
+    parser.add_argument('--tables', type=int, default=100, help='Количество столов')
+    parser.add_argument('--guests', type=int, default=10_000, help='Количество гостей')
+    parser.add_argument('--min-wait', type=float, default=0.02, help='Минимальное время за столом, с')
+    parser.add_argument('--max-wait', type=float, default=0.05, help='Максимальное время за столом, с')
+    parser.add_argument('--polling', action='store_true', help='Замерить и прежний режим опроса')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    logging.disable(logging.INFO)
+    run(args.tables, args.guests, (args.min_wait, args.max_wait), args.polling)
@@ -0,0 +1,79 @@
+"""Поток на гостя (Cafe) против пула потоков по числу столов (PooledCafe).
+
+Запуск из каталога QueuesInThreading:
+
+    python bench_pooled_cafe.py --tables 100 --guests 100000 --min-wait 0.001 --max-wait 0.002
+
+Каждый режим запускается в отдельном процессе, чтобы пиковая память (RSS)
+не смешивалась. Печатаются общее время, наибольшее число живых потоков и
+пиковая память процесса.
+"""
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import threading
+import time
+from threading import Event
+from cafe import Cafe, Guest, PooledCafe, Table, Visitor
+
+MODES = {'потоки': 'threads', 'пул': 'pool'}
+
+
+def watch_threads(stop, peak):
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        time.sleep(0.01)
+
+
+def child(mode, tables, guests, wait_range):
+    """Выполнить один режим и напечатать результат в JSON."""
+    logging.disable(logging.INFO)
+    stop, peak = Event(), [0]
+    watcher = threading.Thread(target=watch_threads, args=(stop, peak), daemon=True)
+    watcher.start()
+    started = time.perf_counter()
+    if mode == 'threads':
+        cafe = Cafe([Table(number) for number in range(1, tables + 1)])
+        cafe.guest_arrival(*(Guest(f'Гость {i}', Event(), wait_range) for i in range(guests)))
+    else:
+        cafe = PooledCafe([Table(number) for number in range(1, tables + 1)])
+        cafe.guest_arrival(*(Visitor(f'Гость {i}', wait_range) for i in range(guests)))
+    cafe.discuss_guests()
+    cafe.close_cafe()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    print(json.dumps({'elapsed': elapsed, 'threads': peak[0] - 1,
+                      'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def run(tables, guests, wait_range):
+    print(f'столов: {tables}, гостей: {guests}, время за столом: {wait_range[0]}–{wait_range[1]} с')
+    print(f'{"режим":<10}{"время, с":>10}{"потоков":>10}{"память, МиБ":>14}')
+    for name, mode in MODES.items():
+        completed = subprocess.run([sys.executable, __file__, '--child', mode, '--tables', str(tables),
+                                    '--guests', str(guests), '--min-wait', str(wait_range[0]),
+                                    '--max-wait', str(wait_range[1])],
+                                   capture_output=True, text=True, check=True)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(f'{name:<10}{result["elapsed"]:>10.2f}{result["threads"]:>10}{result["rss_mb"]:>14.1f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Поток на гостя против пула потоков')
+    parser.add_argument('--tables', type=int, default=100, help='Количество столов')
+    parser.add_argument('--guests', type=int, default=100_000, help='Количество гостей')
+    parser.add_argument('--min-wait', type=float, default=0.001, help='Минимальное время за столом, с')
+    parser.add_argument('--max-wait', type=float, default=0.002, help='Максимальное время за столом, с')
+    parser.add_argument('--child', choices=sorted(MODES.values()), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    if args.child:
+        child(args.child, args.tables, args.guests, (args.min_wait, args.max_wait))
+    else:
+        run(args.tables, args.guests, (args.min_wait, args.max_wait))
@@ -0,0 +1,58 @@
+"""Поиск свободного стола перебором против пула FreeTables.
+
+Запуск из каталога QueuesInThreading:
+
+    python bench_seating.py --tables 10 100 1000 10000 --operations 100000
+
+Почти все столы заняты, свободный стол каждый раз освобождается в случайном
+месте зала. Перебор, как в прежнем _seat_guest, проходит столы по порядку,
+пул берёт стол из кучи. Печатается время одной пары «посадить — освободить».
+"""
+import argparse
+import random
+import time
+from cafe import FreeTables, Table
+
+
+def linear(tables, order):
+    for number in order:
+        tables[number].guest = None
+        free_table = next((table for table in tables if table.is_free()), None)
+        free_table.guest = True
+
+
+def pooled(tables, order):
+    free = FreeTables()
+    for number in order:
+        free.push(tables[number])
+        free.pop(1)
+
+
+def measure(strategy, count, operations, seed):
+    tables = [Table(number, guest=True) for number in range(count)]
+    rng = random.Random(seed)
+    order = [rng.randrange(count) for _ in range(operations)]
+    started = time.perf_counter()
+    strategy(tables, order)
+    return (time.perf_counter() - started) / operations
+
+
+def run(table_counts, operations, seed):
+    print(f'{"столов":>8}{"перебор, мкс":>16}{"пул, мкс":>12}')
+    for count in table_counts:
+        scan = measure(linear, count, operations, seed)
+        pool = measure(pooled, count, operations, seed)
+        print(f'{count:>8,}{scan * 1e6:>16.2f}{pool * 1e6:>12.2f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Перебор столов против пула свободных столов')
+    parser.add_argument('--tables', type=int, nargs='+', default=[10, 100, 1000, 10_000], help='Числа столов')
+    parser.add_argument('--operations', type=int, default=100_000, help='Количество посадок')
+    parser.add_argument('--seed', type=int, default=42, help='Зерно генератора')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.tables, args.operations, args.seed)
@@ -1,108 +1,337 @@
+import heapq
 import random
 import time
 import logging
-from threading import Thread, Event
+from bisect import bisect_right, insort
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Thread, Event, Condition, Lock, local
 from queue import Queue
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _wait_time(wait_range: Tuple[float, float]) -> float:
+    """Случайное время за столом: целые секунды для целых границ, как раньше, иначе дробное."""
+    low, high = wait_range
+    if isinstance(low, int) and isinstance(high, int):
+        return random.randint(low, high)
+    return random.uniform(low, high)
+
 @dataclass
 class Table:
     number: int
     guest: Optional['Guest'] = None
+    seats: int = 4  # Вместимость стола
 
     def is_free(self) -> bool:
         """Проверяет, свободен ли стол."""
         return self.guest is None
 
 class Guest(Thread):
-    def __init__(self, name: str, stop_event: Event):
+    def __init__(self, name: str, stop_event: Event, wait_range: Tuple[float, float] = (3, 10),
+                 party_size: int = 1, vip: bool = False):
         super().__init__()
         self.name = name
         self.stop_event = stop_event
+        self.wait_range = wait_range  # Границы времени за столом в секундах
+        self.party_size = party_size  # Сколько мест нужно компании гостя
+        self.vip = vip  # VIP-гость садится раньше обычных
         self.has_left = False  # Состояние, покинул ли гость кафе
+        self.left_at = None  # Момент ухода по time.perf_counter
+        self.completions = None  # Очередь кафе, куда гость сообщает о своём уходе
 
     def run(self):
         """Имитация времени, проведенного гостем за столом."""
-        wait_time = random.randint(3, 10)
+        wait_time = _wait_time(self.wait_range)
         logging.info(f"{self.name} ожидает {wait_time} секунд.")
         time.sleep(wait_time)
+        self.left_at = time.perf_counter()
         self.has_left = True  # Гость покинул кафе
         self.stop_event.set()  # Устанавливаем событие завершения после еды
+        if self.completions is not None:
+            self.completions.put(self)
+
+class FreeTables:
+    """Свободные столы, разложенные по вместимости.
+
+    Для каждой вместимости хранится куча номеров свободных столов, поэтому
+    взять и вернуть стол стоит O(log n). pop выдаёт самый маленький из
+    подходящих по вместимости столов, а среди них — с наименьшим номером.
+    """
+
+    def __init__(self, tables: Iterable[Table] = ()):
+        self._by_seats = {}
+        self._seats = []  # Отсортированные вместимости столов
+        self._size = 0
+        for table in tables:
+            self.push(table)
+
+    def push(self, table: Table):
+        """Возвращает стол в число свободных."""
+        heap = self._by_seats.get(table.seats)
+        if heap is None:
+            heap = self._by_seats[table.seats] = []
+            insort(self._seats, table.seats)
+        heapq.heappush(heap, (table.number, table))
+        self._size += 1
+
+    def pop(self, party_size: int = 1) -> Optional[Table]:
+        """Забирает свободный стол хотя бы на party_size мест или возвращает None."""
+        for seats in self._seats[bisect_right(self._seats, party_size - 1):]:
+            heap = self._by_seats[seats]
+            if heap:
+                self._size -= 1
+                return heapq.heappop(heap)[1]
+        return None
+
+    def __len__(self):
+        return self._size
+
+class WaitingQueue:
+    """Очередь ожидания с приоритетами.
+
+    VIP-гости стоят впереди обычных, внутри одного приоритета — по времени
+    прихода. Для каждого размера компании своя куча, поэтому освободившийся
+    стол достаётся первому по приоритету гостю, который за ним поместится,
+    за O(log n).
+    """
+
+    def __init__(self):
+        self._by_size = {}
+        self._sizes = []  # Отсортированные размеры компаний
+        self._order = count()
+        self._size = 0
+
+    def put(self, guest: Guest):
+        """Ставит гостя в очередь."""
+        heap = self._by_size.get(guest.party_size)
+        if heap is None:
+            heap = self._by_size[guest.party_size] = []
+            insort(self._sizes, guest.party_size)
+        heapq.heappush(heap, (not guest.vip, next(self._order), guest))
+        self._size += 1
+
+    def get(self, seats: Optional[int] = None) -> Optional[Guest]:
+        """Забирает первого по приоритету гостя, чья компания поместится на seats мест."""
+        sizes = self._sizes if seats is None else self._sizes[:bisect_right(self._sizes, seats)]
+        heads = [heap for heap in map(self._by_size.get, sizes) if heap]
+        if not heads:
+            return None
+        self._size -= 1
+        return heapq.heappop(min(heads, key=lambda heap: heap[0][:2]))[2]
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def qsize(self) -> int:
+        return self._size
+
+    def __len__(self):
+        return self._size
 
 class Cafe:
+    """Кафе, которое пересаживает гостей по событиям, а не опросом столов.
+
+    Гость, закончив есть, кладёт себя в очередь завершений ``completions``.
+    discuss_guests ждёт на этой очереди, не занимая процессор, и сразу
+    освобождает стол ушедшего гостя и сажает за него следующего из очереди.
+    В ``seating_latencies`` копятся задержки между уходом гостя и посадкой
+    следующего за тот же стол.
+
+    Свободные столы хранятся в FreeTables, ожидающие гости — в WaitingQueue,
+    так что посадка не перебирает все столы и стоит O(log n). Компания
+    садится за самый маленький подходящий стол, VIP-гости — вне очереди.
+    """
+
     def __init__(self, tables: List[Table]):
-        self.queue = Queue()
+        self.queue = WaitingQueue()
         self.tables = tables
+        self.completions = Queue()
+        self.seating_latencies = []
+        self._free_tables = FreeTables(table for table in tables if table.is_free())
+        self._max_seats = max((table.seats for table in tables), default=0)
+        self._table_of = {}  # Гость -> стол, за которым он сидит
+        self._lock = Lock()  # Защищает свободные столы и очередь
 
     def guest_arrival(self, *guests: Guest):
         """Обрабатывает прибытие гостей в кафе."""
+        for guest in guests:
+            if guest.party_size > self._max_seats:
+                raise ValueError(f"{guest.name}: компании из {guest.party_size} человек негде сесть")
         for guest in guests:
             self._seat_guest(guest)
 
     def _seat_guest(self, guest: Guest):
         """Сажает гостя за свободный стол или ставит в очередь."""
-        free_table = next((table for table in self.tables if table.is_free()), None)
+        with self._lock:
+            free_table = self._free_tables.pop(guest.party_size)
+            if free_table is None:
+                self.queue.put(guest)
         if free_table:
-            free_table.guest = guest
-            guest.start()
+            self._occupy(free_table, guest)
             logging.info(f"{guest.name} сел(-а) за стол номер {free_table.number}")
         else:
-            self.queue.put(guest)
             logging.info(f"{guest.name} в очереди")
 
+    def _occupy(self, table: Table, guest: Guest):
+        """Сажает гостя за стол и запускает его."""
+        table.guest = guest
+        self._table_of[guest] = table
+        guest.completions = self.completions
+        guest.start()
+
     def discuss_guests(self):
-        """Обслуживает гостей, пока есть очередь или занятые столы."""
-        while not self.queue.empty() or any(not table.is_free() for table in self.tables):
-            for table in self.tables:
-                self._check_table(table)
+        """Обслуживает гостей, пока есть очередь или занятые столы.
+
+        Ожидание ушедших гостей блокирующее: пока все едят, поток кафе спит.
+        """
+        while self._table_of:
+            self._check_table(self._table_of[self.completions.get()])
 
     def _check_table(self, table: Table):
         """Проверяет состояние стола и освобождает его, если гость ушел."""
-        if table.guest and table.guest.has_left:
-            logging.info(f"{table.guest.name} покушал(-а) и ушёл(ушла)")
+        guest = table.guest
+        if guest and guest.has_left:
+            logging.info(f"{guest.name} покушал(-а) и ушёл(ушла)")
             logging.info(f"Стол номер {table.number} свободен")
+            del self._table_of[guest]
             table.guest = None
-            self._seat_next_guest(table)
-
-    def _seat_next_guest(self, table: Table):
-        """Сажает следующего гостя из очереди за свободный стол."""
-        if not self.queue.empty():
-            next_guest = self.queue.get()
-            table.guest = next_guest
-            next_guest.start()
+            self._seat_next_guest(table, guest.left_at)
+            guest.join()  # Поток гостя уже дошёл до конца run
+
+    def _seat_next_guest(self, table: Table, left_at: Optional[float] = None):
+        """Сажает за свободный стол первого подходящего гостя из очереди."""
+        with self._lock:
+            next_guest = self.queue.get(table.seats)
+            if next_guest is None:
+                self._free_tables.push(table)
+        if next_guest:
+            if left_at is not None:
+                self.seating_latencies.append(time.perf_counter() - left_at)
+            self._occupy(table, next_guest)
             logging.info(f"{next_guest.name} вышел(-ла) из очереди и сел(-а) за стол номер {table.number}")
 
+    def close_cafe(self):
+        """Закрывает кафе, когда все гости покинут заведение.
+
+        Не опрашивает столы, а дожидается ухода оставшихся гостей через
+        discuss_guests, поэтому закрывается сразу после ухода последнего.
+        """
+        self.discuss_guests()
+        logging.info("Кафе закрыто. Все гости покинули заведение.")
+
+class Visitor:
+    """Гость без собственного потока.
+
+    Выполняется как задача в пуле PooledCafe, поэтому стоит несколько сотен
+    байт вместо целого потока и может приходить в кафе сколько угодно раз.
+    """
+    __slots__ = ('name', 'wait_range', 'visits', 'left_at')
+
+    def __init__(self, name: str, wait_range: Tuple[float, float] = (3, 10)):
+        self.name = name
+        self.wait_range = wait_range
+        self.visits = 0
+        self.left_at = None
+
+    def visit(self, table: Table):
+        """Имитация времени, проведенного гостем за столом."""
+        wait_time = _wait_time(self.wait_range)
+        logging.info(f"{self.name} сел(-а) за стол номер {table.number} и ожидает {wait_time} секунд.")
+        time.sleep(wait_time)
+        self.visits += 1
+        self.left_at = time.perf_counter()
+        logging.info(f"{self.name} покушал(-а) и ушёл(ушла)")
+
+
+class PooledCafe:
+    """Кафе, в котором гости — задачи пула потоков по числу столов.
+
+    Каждый поток пула закреплён за своим столом, поэтому пул сам не даёт
+    посадить больше гостей, чем столов, а его очередь задач служит очередью
+    гостей. Число потоков не зависит от числа гостей.
+    """
+
+    def __init__(self, tables: List[Table]):
+        self.tables = tables
+        self._free_tables = Queue()
+        for table in tables:
+            self._free_tables.put(table)
+        self._local = local()
+        self._pool = ThreadPoolExecutor(max_workers=len(tables), thread_name_prefix='table',
+                                        initializer=self._take_table)
+        self._outstanding = 0
+        self._done = Condition()
+
+    def _take_table(self):
+        """Закрепляет стол за новым потоком пула."""
+        self._local.table = self._free_tables.get_nowait()
+
+    def guest_arrival(self, *guests: Visitor):
+        """Ставит гостей в очередь пула; гость садится, как только освободится стол."""
+        for guest in guests:
+            with self._done:
+                self._outstanding += 1
+            try:
+                self._pool.submit(self._serve, guest)
+            except BaseException:
+                self._finish()
+                raise
+
+    def _serve(self, guest: Visitor):
+        table = self._local.table
+        table.guest = guest
+        try:
+            guest.visit(table)
+        except Exception:
+            logging.exception(f"{guest.name}: ошибка за столом номер {table.number}")
+        finally:
+            table.guest = None
+            self._finish()
+
+    def _finish(self):
+        """Снимает гостя со счёта и будит ожидающих, когда гостей не осталось."""
+        with self._done:
+            self._outstanding -= 1
+            if not self._outstanding:
+                self._done.notify_all()
+
+    def discuss_guests(self):
+        """Ждёт, пока все пришедшие гости поедят и уйдут."""
+        with self._done:
+            self._done.wait_for(lambda: not self._outstanding)
+
     def close_cafe(self):
         """Закрывает кафе, когда все гости покинут заведение."""
-        while not self.queue.empty() or any(table.guest for table in self.tables):
-            time.sleep(1)  # Ожидание, пока все гости не покинут кафе
+        self.discuss_guests()
+        self._pool.shutdown(wait=True)
         logging.info("Кафе закрыто. Все гости покинули заведение.")
 
-# Конфигурация
-NUM_TABLES = 5
-GUEST_NAMES = [
-    'Maria', 'Oleg', 'Vakhtang', 'Sergey', 'Darya', 'Arman',
-    'Vitoria', 'Nikita', 'Galina', 'Pavel', 'Ilya', 'Alexandra'
-]
+if __name__ == "__main__":
+    # Конфигурация
+    NUM_TABLES = 5
+    GUEST_NAMES = [
+        'Maria', 'Oleg', 'Vakhtang', 'Sergey', 'Darya', 'Arman',
+        'Vitoria', 'Nikita', 'Galina', 'Pavel', 'Ilya', 'Alexandra'
+    ]
 
-# Создание столов
-tables = [Table(number) for number in range(1, NUM_TABLES + 1)]
+    # Создание столов
+    tables = [Table(number) for number in range(1, NUM_TABLES + 1)]
 
-# Создание гостей с событием завершения
-guests = [Guest(name, Event()) for name in GUEST_NAMES]
+    # Создание гостей с событием завершения
+    guests = [Guest(name, Event()) for name in GUEST_NAMES]
 
-# Заполнение кафе столами
-cafe = Cafe(tables)
+    # Заполнение кафе столами
+    cafe = Cafe(tables)
 
-# Приём гостей
-cafe.guest_arrival(*guests)
+    # Приём гостей
+    cafe.guest_arrival(*guests)
 
-# Обслуживание гостей
-cafe.discuss_guests()
+    # Обслуживание гостей
+    cafe.discuss_guests()
 
-# Закрытие кафе
-cafe.close_cafe()
+    # Закрытие кафе
+    cafe.close_cafe()
@@ -0,0 +1,97 @@
+import unittest
+import logging
+from threading import Event
+import threading
+from cafe import Cafe, FreeTables, Guest, PooledCafe, Table, Visitor, WaitingQueue
+
+
+class TestCafe(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем кафе с тремя столами и отключаем логирование."""
+        logging.disable(logging.INFO)
+        self.tables = [Table(number) for number in range(1, 4)]
+        self.cafe = Cafe(self.tables)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_all_guests_served(self):
+        """Проверяем, что все гости обслужены, а столы и очередь свободны."""
+        guests = [Guest(f'Гость {i}', Event(), (0.005, 0.01)) for i in range(10)]
+        self.cafe.guest_arrival(*guests)
+        self.assertEqual(self.cafe.queue.qsize(), 7)
+        self.cafe.discuss_guests()
+        self.cafe.close_cafe()
+
+        self.assertTrue(all(guest.has_left and guest.stop_event.is_set() for guest in guests))
+        self.assertTrue(all(table.is_free() for table in self.tables))
+        self.assertTrue(self.cafe.queue.empty())
+        self.assertEqual(len(self.cafe.seating_latencies), 7)
+
+    def test_queued_guest_takes_freed_table(self):
+        """Проверяем, что гость из очереди садится за стол ушедшего гостя."""
+        cafe = Cafe([Table(1)])
+        first, second = Guest('Первый', Event(), (0.01, 0.01)), Guest('Второй', Event(), (0.01, 0.01))
+        cafe.guest_arrival(first, second)
+        self.assertIs(cafe.tables[0].guest, first)
+        first.join()
+        cafe.discuss_guests()
+        self.assertTrue(second.has_left)
+        self.assertGreaterEqual(second.left_at, first.left_at)
+
+    def test_party_takes_smallest_fitting_table(self):
+        """Проверяем, что компания садится за самый маленький подходящий стол."""
+        free = FreeTables([Table(1, seats=6), Table(2, seats=2), Table(3, seats=4), Table(4, seats=2)])
+        self.assertEqual(free.pop(3).number, 3)
+        self.assertEqual(free.pop(1).number, 2)
+        self.assertEqual(free.pop(5).number, 1)
+        self.assertIsNone(free.pop(3))
+        self.assertEqual(len(free), 1)
+
+    def test_vip_and_fitting_guest_served_first(self):
+        """Проверяем, что VIP идёт раньше, а стол достаётся первому, кто за ним поместится."""
+        queue = WaitingQueue()
+        regular, party, vip = (Guest('Обычный', Event()), Guest('Компания', Event(), party_size=4),
+                               Guest('VIP', Event(), vip=True))
+        for guest in (regular, party, vip):
+            queue.put(guest)
+        self.assertIs(queue.get(4), vip)
+        self.assertIs(queue.get(2), regular)
+        self.assertIsNone(queue.get(2))
+        self.assertIs(queue.get(), party)
+        self.assertTrue(queue.empty())
+
+    def test_party_too_large_rejected(self):
+        """Проверяем, что компанию больше любого стола не принимают."""
+        with self.assertRaises(ValueError):
+            self.cafe.guest_arrival(Guest('Компания', Event(), party_size=5))
+        self.assertTrue(self.cafe.queue.empty())
+
+    def test_pooled_cafe_reuses_guests(self):
+        """Проверяем, что в PooledCafe гость может прийти повторно, а потоков не больше, чем столов."""
+        cafe = PooledCafe(self.tables)
+        visitors = [Visitor(f'Гость {i}', (0.001, 0.003)) for i in range(20)]
+        cafe.guest_arrival(*visitors)
+        cafe.guest_arrival(*visitors)
+        table_threads = [thread for thread in threading.enumerate() if thread.name.startswith('table')]
+        self.assertLessEqual(len(table_threads), 3)
+        cafe.close_cafe()
+
+        self.assertTrue(all(visitor.visits == 2 for visitor in visitors))
+        self.assertTrue(all(table.is_free() for table in self.tables))
+
+    def test_pooled_cafe_arrival_after_close(self):
+        """Проверяем, что отказ пула принять гостя не оставляет его на счету и ожидание не зависает."""
+        cafe = PooledCafe(self.tables)
+        cafe.close_cafe()
+        with self.assertRaises(RuntimeError):
+            cafe.guest_arrival(Visitor('Опоздавший', (0.001, 0.002)), Visitor('Ещё один', (0.001, 0.002)))
+        waiter = threading.Thread(target=cafe.discuss_guests)
+        waiter.start()
+        waiter.join(1)
+        self.assertFalse(waiter.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import math
+import threading
+from collections import Counter
+from typing import Iterable, List, Tuple
+from car_management.models.car import Car
+
+
+class FleetAnalytics:
+    """Агрегаты по автопарку, обновляемые при каждом добавлении и удалении.
+
+    Хранит число автомобилей по моделям, гистограмму емкостей батарей
+    электромобилей и распределение VIN по диапазонам. Каждое изменение
+    автопарка обновляет агрегаты за O(1), поэтому запросы дашбордов
+    выполняются за O(1) или O(число корзин) без перебора автопарка.
+    Обновления защищены блокировкой, так как сервис может вызываться из пула потоков.
+    """
+
+    def __init__(self, battery_bucket_size: float = 10.0, vin_bucket_size: int = 1000000):
+        self.battery_bucket_size = battery_bucket_size
+        self.vin_bucket_size = vin_bucket_size
+        self.total = 0
+        self.electric = 0
+        self._model_counts = Counter()
+        self._battery_buckets = Counter()
+        self._vin_buckets = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cars(cls, cars: Iterable[Car], **kwargs) -> 'FleetAnalytics':
+        """Построить агрегаты по существующему автопарку, например после запуска с SQLite."""
+        analytics = cls(**kwargs)
+        analytics.on_add_many(cars)
+        return analytics
+
+    def on_add(self, car: Car) -> None:
+        """Учесть добавленный автомобиль."""
+        with self._lock:
+            self._update(car, 1)
+
+    def on_add_many(self, cars: Iterable[Car]) -> None:
+        """Учесть пачку добавленных автомобилей."""
+        with self._lock:
+            for car in cars:
+                self._update(car, 1)
+
+    def on_remove(self, car: Car) -> None:
+        """Учесть удалённый автомобиль."""
+        with self._lock:
+            self._update(car, -1)
+
+    def _update(self, car: Car, delta: int) -> None:
+        self.total += delta
+        _change(self._model_counts, car.model, delta)
+        _change(self._vin_buckets, car.vin // self.vin_bucket_size, delta)
+        battery_capacity = getattr(car, 'battery_capacity', None)
+        if battery_capacity is not None:
+            self.electric += delta
+            _change(self._battery_buckets, math.floor(battery_capacity / self.battery_bucket_size), delta)
+
+    def count_by_model(self, model: str) -> int:
+        """Число автомобилей модели за O(1)."""
+        return self._model_counts.get(model, 0)
+
+    def model_counts(self) -> dict:
+        """Число автомобилей по всем моделям."""
+        return dict(self._model_counts)
+
+    def battery_histogram(self) -> List[Tuple[float, int]]:
+        """Гистограмма емкостей батарей: пары (нижняя граница корзины, число электромобилей)."""
+        return [(bucket * self.battery_bucket_size, count) for bucket, count in sorted(self._battery_buckets.items())]
+
+    def vin_distribution(self) -> List[Tuple[int, int]]:
+        """Распределение VIN: пары (нижняя граница диапазона, число автомобилей)."""
+        return [(bucket * self.vin_bucket_size, count) for bucket, count in sorted(self._vin_buckets.items())]
+
+    def snapshot(self) -> dict:
+        """Все агрегаты одним согласованным словарём."""
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> dict:
+        return {
+            'total': self.total,
+            'electric': self.electric,
+            'models': self.model_counts(),
+            'battery_histogram': self.battery_histogram(),
+            'vin_distribution': self.vin_distribution(),
+        }
+
+    def verify(self, cars: Iterable[Car]) -> bool:
+        """Сверить инкрементальные агрегаты с полным пересчётом по автопарку."""
+        return self.snapshot() == recompute(cars, self.battery_bucket_size, self.vin_bucket_size)
+
+
+def _change(counter: Counter, key, delta: int) -> None:
+    """Изменить счётчик и удалить ключ, если счётчик обнулился."""
+    value = counter[key] + delta
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+def recompute(cars: Iterable[Car], battery_bucket_size: float = 10.0, vin_bucket_size: int = 1000000) -> dict:
+    """Полный пересчёт агрегатов по автопарку в формате FleetAnalytics.snapshot.
+
+    Если установлен NumPy, колонки автопарка обрабатываются векторно; иначе
+    агрегаты строятся обычным проходом.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return FleetAnalytics.from_cars(cars, battery_bucket_size=battery_bucket_size,
+                                        vin_bucket_size=vin_bucket_size).snapshot()
+
+    models, vins, battery_capacities = [], [], []
+    for car in cars:
+        models.append(car.model)
+        vins.append(car.vin)
+        battery_capacity = getattr(car, 'battery_capacity', None)
+        battery_capacities.append(math.nan if battery_capacity is None else battery_capacity)
+
+    model_names, model_counts = np.unique(np.array(models, dtype=object), return_counts=True)
+    vin_buckets, vin_counts = np.unique(np.array(vins, dtype=np.int64) // vin_bucket_size, return_counts=True)
+    battery_capacities = np.array(battery_capacities, dtype=np.float64)
+    battery_capacities = battery_capacities[~np.isnan(battery_capacities)]
+    battery_buckets, battery_counts = np.unique(np.floor(battery_capacities / battery_bucket_size).astype(np.int64),
+                                                return_counts=True)
+    return {
+        'total': len(vins),
+        'electric': len(battery_capacities),
+        'models': dict(zip(model_names.tolist(), model_counts.tolist())),
+        'battery_histogram': [(bucket * battery_bucket_size, count)
+                              for bucket, count in zip(battery_buckets.tolist(), battery_counts.tolist())],
+        'vin_distribution': [(bucket * vin_bucket_size, count)
+                             for bucket, count in zip(vin_buckets.tolist(), vin_counts.tolist())],
+    }
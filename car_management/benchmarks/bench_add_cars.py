@@ -0,0 +1,94 @@
+"""Бенчмарк пакетной загрузки автомобилей через CarService.add_cars.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_add_cars --rows 1000000 --source csv
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+from car_management.loaders.car_loaders import CSV_FIELDS, read_rows
+from car_management.repositories.car_repository import CarRepository
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.services.car_service import CarService
+
+
+def _plate(i: int) -> str:
+    """Уникальный номер из 6 символов 0-9a-z: хватает на 36**6 строк."""
+    digits = []
+    for _ in range(6):
+        i, digit = divmod(i, 36)
+        digits.append('0123456789abcdefghijklmnopqrstuvwxyz'[digit])
+    return ''.join(reversed(digits))
+
+
+def generate_rows(count: int, invalid_every: int = 0):
+    """Генерирует строки с уникальными VIN и номерами; каждая десятая — электромобиль."""
+    for i in range(count):
+        vin = 1000000 + i
+        if invalid_every and i % invalid_every == 0:
+            vin = 42  # Неверный диапазон VIN
+        battery_capacity = 40.0 + i % 60 if i % 10 == 0 else None
+        yield (f'Model{i % 100}', vin, _plate(i), battery_capacity)
+
+
+def write_rows(path: str, rows) -> None:
+    """Записывает строки в CSV или JSONL в зависимости от расширения."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            for model, vin, numbers, battery_capacity in rows:
+                writer.writerow((model, vin, numbers, '' if battery_capacity is None else battery_capacity))
+        else:
+            for model, vin, numbers, battery_capacity in rows:
+                record = {'model': model, 'vin': vin, 'numbers': numbers}
+                if battery_capacity is not None:
+                    record['battery_capacity'] = battery_capacity
+                f.write(json.dumps(record) + '\n')
+
+
+def run(rows: int, source: str, chunk_size: int, indexed: bool, invalid_every: int) -> None:
+    repository = IndexedCarRepository() if indexed else CarRepository()
+    service = CarService(repository)
+
+    path = None
+    if source == 'memory':
+        data = generate_rows(rows, invalid_every)
+    else:
+        fd, path = tempfile.mkstemp(suffix=f'.{source}')
+        os.close(fd)
+        write_rows(path, generate_rows(rows, invalid_every))
+        data = read_rows(path)
+
+    try:
+        start = time.perf_counter()
+        result = service.add_cars(data, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+    finally:
+        if path:
+            os.remove(path)
+
+    print(f'Источник: {source}, репозиторий: {type(repository).__name__}, chunk_size: {chunk_size}')
+    print(f'Строк: {rows}, добавлено: {result.added}, ошибок: {len(result.errors)}')
+    print(f'Время: {elapsed:.2f} с, скорость: {rows / elapsed:,.0f} строк/с')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Бенчмарк CarService.add_cars')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Количество строк')
+    parser.add_argument('--source', choices=('memory', 'csv', 'jsonl'), default='memory',
+                        help='Источник строк')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='Размер пачки')
+    parser.add_argument('--indexed', action='store_true', help='Использовать IndexedCarRepository')
+    parser.add_argument('--invalid-every', type=int, default=1000,
+                        help='Каждая N-я строка некорректна (0 — без ошибок)')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.rows, args.source, args.chunk_size, args.indexed, args.invalid_every)
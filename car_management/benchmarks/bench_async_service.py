@@ -0,0 +1,68 @@
+"""Бенчмарк задержек AsyncCarService при 10 тыс. одновременных запросов.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_async_service --requests 10000
+
+Все запросы add_car запускаются одновременно через asyncio.gather; для
+каждого измеряется время от запуска до завершения. Сравниваются репозиторий
+в памяти (вызовы прямо в цикле событий) и SQLite (вызовы в пуле потоков).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from car_management.models.car import Car
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.repositories.sqlite_car_repository import SQLiteCarRepository
+from car_management.services.async_car_service import AsyncCarService
+
+
+async def timed_add(service: AsyncCarService, car: Car) -> float:
+    started = time.perf_counter()
+    await service.add_car(car)
+    return time.perf_counter() - started
+
+
+async def run_requests(service: AsyncCarService, count: int) -> tuple:
+    cars = [Car(f'Model{i % 100}', 1000000 + i, f'{i:06d}') for i in range(count)]
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(timed_add(service, car) for car in cars))
+    return time.perf_counter() - started, sorted(latencies)
+
+
+def report(name: str, elapsed: float, latencies: list) -> None:
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f'{name:<28}{len(latencies) / elapsed:>12,.0f}{statistics.median(latencies) * 1000:>10.2f}'
+          f'{percentile(0.95):>10.2f}{percentile(0.99):>10.2f}{latencies[-1] * 1000:>10.2f}')
+
+
+async def run(count: int, workers: int) -> None:
+    print(f'{"репозиторий":<28}{"запросов/с":>12}{"p50, мс":>10}{"p95, мс":>10}{"p99, мс":>10}{"max, мс":>10}')
+
+    async with AsyncCarService(IndexedCarRepository()) as service:
+        report('IndexedCarRepository', *await run_requests(service, count))
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SQLiteCarRepository(os.path.join(directory, 'cars.db'), pool_size=workers)
+        try:
+            async with AsyncCarService(repository, max_workers=workers) as service:
+                report(f'SQLiteCarRepository ({workers} потока)', *await run_requests(service, count))
+        finally:
+            repository.close()
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Бенчмарк задержек AsyncCarService')
+    parser.add_argument('--requests', type=int, default=10000, help='Число одновременных запросов')
+    parser.add_argument('--workers', type=int, default=4, help='Размер пула потоков для SQLite')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    asyncio.run(run(args.requests, args.workers))
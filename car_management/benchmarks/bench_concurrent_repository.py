@@ -0,0 +1,72 @@
+"""Нагрузочный бенчмарк ConcurrentCarRepository с несколькими писателями.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_concurrent_repository --cars 200000
+
+Каждый поток вставляет свою долю автомобилей через save_if_absent, а
+половина VIN пересекается с соседним потоком, чтобы проверить атомарность
+вставки. Для каждого числа потоков сравниваются одна общая блокировка
+(stripes=1) и блокировки по полосам.
+"""
+import argparse
+import threading
+import time
+from car_management.models.car import Car
+from car_management.repositories.concurrent_car_repository import ConcurrentCarRepository
+
+
+def build_cars(count: int) -> list:
+    return [Car(f'Model{i % 100}', 1000000 + i, f'{i:06d}') for i in range(count)]
+
+
+def run_writers(repository: ConcurrentCarRepository, cars: list, threads: int) -> tuple:
+    """Запустить писателей и вернуть (время, число вставок)."""
+    share = len(cars) // threads
+    inserted = [0] * threads
+    barrier = threading.Barrier(threads)
+
+    def writer(number: int) -> None:
+        # Поток пишет свою долю и половину доли соседа
+        start = number * share
+        own = cars[start:start + share]
+        neighbour = cars[(start + share) % len(cars):][:share // 2]
+        barrier.wait()
+        count = 0
+        for car in own + neighbour:
+            count += repository.save_if_absent(car)
+        inserted[number] = count
+
+    workers = [threading.Thread(target=writer, args=(number,)) for number in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started, sum(inserted)
+
+
+def run(count: int, thread_counts: list, stripes: int) -> None:
+    cars = build_cars(count)
+    print(f'{"потоки":>7}{"полосы":>8}{"операций/с":>14}{"вставлено":>11}{"ожидания, %":>13}')
+    for threads in thread_counts:
+        for stripe_count in (1, stripes):
+            repository = ConcurrentCarRepository(stripes=stripe_count)
+            elapsed, inserted = run_writers(repository, cars, threads)
+            stats = repository.contention_stats()
+            assert inserted == len(repository) == (count // threads) * threads
+            print(f'{threads:>7}{stripe_count:>8}{stats["acquisitions"] / elapsed:>14,.0f}'
+                  f'{inserted:>11}{stats["contention_ratio"] * 100:>13.2f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Нагрузочный бенчмарк ConcurrentCarRepository')
+    parser.add_argument('--cars', type=int, default=200_000, help='Количество автомобилей')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16], help='Числа потоков')
+    parser.add_argument('--stripes', type=int, default=64, help='Число полос')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.cars, args.threads, args.stripes)
@@ -0,0 +1,86 @@
+"""Время импорта и запуска car_management для отслеживания регрессий.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_import_time --runs 10 --max-us 100000
+
+Каждый замер — отдельный процесс ``python -X importtime -c "import ..."``,
+поэтому модули не берутся из кэша интерпретатора. Печатается медиана
+суммарного времени импорта, самые дорогие модули и время setup_logging с
+кэшем конфигурации и без него. С ``--max-us`` бенчмарк завершается с кодом 1,
+если медиана времени импорта превышает порог.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+SETUP_LOGGING_CODE = '''
+import time
+started = time.perf_counter()
+from car_management.logging_config import setup_logging
+setup_logging(use_cache={use_cache})
+print((time.perf_counter() - started) * 1e6)
+'''
+
+
+def import_times(module: str) -> dict:
+    """Собственное и суммарное время импорта (мкс) каждого модуля в новом процессе."""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                               capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def setup_logging_time(use_cache: bool) -> float:
+    """Время импорта logging_config и вызова setup_logging (мкс) в новом процессе."""
+    completed = subprocess.run([sys.executable, '-c', SETUP_LOGGING_CODE.format(use_cache=use_cache)],
+                               capture_output=True, text=True, check=True)
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def run(module: str, runs: int, top: int) -> float:
+    totals = []
+    self_times = defaultdict(list)
+    for _ in range(runs):
+        times = import_times(module)
+        totals.append(times[module][1])
+        for name, (self_us, _) in times.items():
+            self_times[name].append(self_us)
+
+    median_total = statistics.median(totals)
+    print(f'импорт {module}: медиана {median_total:,.0f} мкс, минимум {min(totals):,} мкс ({runs} запусков)')
+    print('самые дорогие модули (собственное время, медиана):')
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, values in slowest[:top]:
+        print(f'  {name:<48}{statistics.median(values):>10,.0f} мкс')
+
+    for use_cache, title in ((False, 'без кэша'), (True, 'с кэшем')):
+        setup_logging_time(use_cache)  # Прогрев: создание кэша и .pyc
+        elapsed = statistics.median(setup_logging_time(use_cache) for _ in range(runs))
+        print(f'setup_logging {title:<10}{elapsed:>10,.0f} мкс')
+    return median_total
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Время импорта и запуска car_management')
+    parser.add_argument('--module', default='car_management.main', help='Импортируемый модуль')
+    parser.add_argument('--runs', type=int, default=10, help='Количество запусков')
+    parser.add_argument('--top', type=int, default=10, help='Сколько самых дорогих модулей показать')
+    parser.add_argument('--max-us', type=int, default=None,
+                        help='Порог медианы времени импорта в микросекундах')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    median_total = run(args.module, args.runs, args.top)
+    if args.max_us is not None and median_total > args.max_us:
+        print(f'превышен порог: {median_total:,.0f} мкс > {args.max_us:,} мкс')
+        sys.exit(1)
@@ -0,0 +1,80 @@
+"""Сравнение памяти, занимаемой автопарком, для разных способов хранения.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_memory --cars 1000000
+
+Измеряется прирост памяти по tracemalloc после построения автопарка, в котором
+каждый десятый автомобиль электрический. Строки моделей и номеров создаются
+заново для каждого автомобиля, как при чтении из файла.
+"""
+import argparse
+import gc
+import tracemalloc
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.models.slotted_car import SlottedCar, SlottedElectricCar
+from car_management.repositories.columnar_car_repository import ColumnarCarRepository
+
+
+def build_objects(count: int, car_class, electric_class) -> list:
+    """Построить список объектов автомобилей."""
+    cars = []
+    for i in range(count):
+        model, vin, numbers = f'Model{i % 100}', 1000000 + i, f'{i:06d}'
+        if i % 10 == 0:
+            cars.append(electric_class(model, vin, numbers, 40.0 + i % 60))
+        else:
+            cars.append(car_class(model, vin, numbers))
+    return cars
+
+
+def build_columnar(count: int) -> ColumnarCarRepository:
+    """Построить колоночное хранилище с тем же составом автопарка."""
+    repository = ColumnarCarRepository()
+    repository.save_many(build_objects_lazy(count))
+    return repository
+
+
+def build_objects_lazy(count: int):
+    """Те же автомобили, но по одному, без промежуточного списка."""
+    for i in range(count):
+        model, vin, numbers = f'Model{i % 100}', 1000000 + i, f'{i:06d}'
+        if i % 10 == 0:
+            yield SlottedElectricCar(model, vin, numbers, 40.0 + i % 60)
+        else:
+            yield SlottedCar(model, vin, numbers)
+
+
+def measure(build, count: int) -> int:
+    """Прирост памяти в байтах после построения автопарка."""
+    gc.collect()
+    tracemalloc.start()
+    fleet = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del fleet
+    return current
+
+
+def run(count: int) -> None:
+    variants = [
+        ('Car / ElectricCar', lambda n: build_objects(n, Car, ElectricCar)),
+        ('SlottedCar / SlottedElectricCar', lambda n: build_objects(n, SlottedCar, SlottedElectricCar)),
+        ('ColumnarCarRepository', build_columnar),
+    ]
+    print(f'Автомобилей: {count}')
+    print(f'{"Хранение":<34}{"МиБ":>10}{"байт/авто":>12}')
+    for name, build in variants:
+        used = measure(build, count)
+        print(f'{name:<34}{used / 2 ** 20:>10.1f}{used / count:>12.1f}')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Сравнение памяти для хранения автопарка')
+    parser.add_argument('--cars', type=int, default=1_000_000, help='Количество автомобилей')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    run(parse_arguments().cars)
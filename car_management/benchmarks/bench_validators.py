@@ -0,0 +1,65 @@
+"""Сравнение поштучной и пакетной валидации VIN и номеров.
+
+Запуск из корня репозитория:
+
+    python -m car_management.benchmarks.bench_validators --rows 1000000
+
+Поштучная валидация — вызовы validate_vin/validate_numbers с перехватом
+исключений, пакетная — validate_cars_batch по спискам и, если установлен
+NumPy, по массивам NumPy.
+"""
+import argparse
+import time
+from car_management.exceptions.car_exceptions import CarException
+from car_management.validators.car_validators import validate_cars_batch, validate_numbers, validate_vin
+
+
+def scalar(vins: list, numbers: list) -> int:
+    """Число ошибок при поштучной валидации."""
+    errors = 0
+    for vin, plate in zip(vins, numbers):
+        try:
+            validate_vin(vin)
+            validate_numbers(plate)
+        except CarException:
+            errors += 1
+    return errors
+
+
+def batch(vins, numbers) -> int:
+    """Число ошибок при пакетной валидации."""
+    mask, _ = validate_cars_batch(vins, numbers)
+    return len(mask) - int(sum(mask))
+
+
+def measure(name: str, function, rows: int, *args) -> None:
+    started = time.perf_counter()
+    errors = function(*args)
+    elapsed = time.perf_counter() - started
+    print(f'{name:<26}{elapsed:>8.3f} с{rows / elapsed:>16,.0f} строк/с   ошибок: {errors}')
+
+
+def run(rows: int, invalid_every: int) -> None:
+    vins = [42 if i % invalid_every == 0 else 1000000 + i for i in range(rows)]
+    numbers = [f'{i:06d}' if i % (invalid_every + 1) else 'abc' for i in range(rows)]
+
+    measure('поштучно', scalar, rows, vins, numbers)
+    measure('пакетно (списки)', batch, rows, vins, numbers)
+    try:
+        import numpy as np
+    except ImportError:
+        print('NumPy не установлен, пакетная валидация массивов пропущена')
+        return
+    measure('пакетно (NumPy)', batch, rows, np.array(vins), np.array(numbers))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Сравнение поштучной и пакетной валидации')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Количество строк')
+    parser.add_argument('--invalid-every', type=int, default=100, help='Каждая N-я строка некорректна')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    run(args.rows, args.invalid_every)
@@ -15,3 +15,10 @@ class IncorrectCarNumbers(CarException):
 
     def __init__(self, message: str) -> None:
         self.message = message
+
+
+class DuplicateCar(CarException):
+    """Исключение для автомобиля, VIN или номер которого уже есть в репозитории."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -0,0 +1,62 @@
+import csv
+import json
+from typing import Iterator, Optional, Tuple
+
+CSV_FIELDS = ('model', 'vin', 'numbers', 'battery_capacity')
+
+
+def _to_int(value):
+    """Преобразует VIN к int, оставляя нечисловые значения как есть для валидации."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _to_float(value) -> Optional[float]:
+    """Преобразует емкость батареи к float; пустое значение означает обычный автомобиль.
+
+    Нечисловые значения остаются как есть: add_cars запишет их в ошибки строки.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def read_csv_rows(path: str) -> Iterator[Tuple]:
+    """Построчно читает автомобили из CSV с колонками model, vin, numbers, battery_capacity."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for record in csv.DictReader(f):
+            yield (record['model'], _to_int(record['vin']), record['numbers'],
+                   _to_float(record.get('battery_capacity')))
+
+
+def read_jsonl_rows(path: str) -> Iterator[Tuple]:
+    """Построчно читает автомобили из JSONL, по одному JSON-объекту в строке.
+
+    Строка, которую не удалось разобрать, отдаётся как есть, чтобы add_cars
+    записал её в ошибки и продолжил загрузку.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                row = (record['model'], record['vin'], record['numbers'],
+                       _to_float(record.get('battery_capacity')))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                row = line.rstrip('\n')
+            yield row
+
+
+def read_rows(path: str) -> Iterator[Tuple]:
+    """Выбирает загрузчик по расширению файла (.csv или .jsonl)."""
+    if path.endswith('.csv'):
+        return read_csv_rows(path)
+    if path.endswith('.jsonl'):
+        return read_jsonl_rows(path)
+    raise ValueError(f'Неподдерживаемый формат файла: {path}')
@@ -1,15 +1,74 @@
-import logging
-import logging.config
-import yaml
+import json
 import os
 
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logging_config.yaml')
+CACHE_SUFFIX = '.cache.json'
 
-def setup_logging(config_file: str) -> None:
-    with open(config_file, 'r') as f:
+
+def _cache_file(config_file: str) -> str:
+    return config_file + CACHE_SUFFIX
+
+
+def _read_cache(cache_file: str, stat: os.stat_result):
+    """Разобранная конфигурация из кэша или None, если кэш устарел или повреждён."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('mtime_ns') != stat.st_mtime_ns or cached.get('size') != stat.st_size:
+        return None
+    return cached.get('config')
+
+
+def _write_cache(cache_file: str, stat: os.stat_result, config: dict) -> None:
+    """Сохранить кэш атомарно; если каталог недоступен для записи, работаем без кэша."""
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def load_config(config_file: str = DEFAULT_CONFIG_FILE, use_cache: bool = True) -> dict:
+    """Загрузить конфигурацию логирования из YAML.
+
+    Разобранная конфигурация кэшируется в JSON рядом с YAML и используется,
+    пока не изменятся время модификации или размер YAML. PyYAML импортируется
+    только при промахе кэша.
+    """
+    stat = os.stat(config_file)
+    cache_file = _cache_file(config_file)
+    if use_cache:
+        config = _read_cache(cache_file, stat)
+        if config is not None:
+            return config
+
+    import yaml
+    with open(config_file, 'r', encoding='utf-8') as f:
         config = yaml.safe_load(f.read())
 
-    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-    config['loggers']['__main__']['level'] = log_level
-    config['loggers']['statistics']['level'] = log_level
+    if use_cache:
+        _write_cache(cache_file, stat, config)
+    return config
+
+
+def apply_log_level(config: dict, log_level: str) -> dict:
+    """Установить уровень для всех логгеров конфигурации."""
+    for logger_config in config.get('loggers', {}).values():
+        logger_config['level'] = log_level
+    return config
+
+
+def setup_logging(config_file: str = DEFAULT_CONFIG_FILE, use_cache: bool = True) -> None:
+    """Настроить логирование; уровень логгеров задаётся переменной LOG_LEVEL."""
+    config = load_config(config_file, use_cache)
+    apply_log_level(config, os.getenv('LOG_LEVEL', 'INFO').upper())
 
+    import logging.config
     logging.config.dictConfig(config)
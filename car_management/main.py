@@ -1,13 +1,14 @@
-from car_management.models.car import Car
-from car_management.models.electric_car import ElectricCar
+import logging
 from car_management.services.car_service import CarService
 from car_management.repositories.car_repository import CarRepository
 from car_management.logging_config import setup_logging
 
+logger = logging.getLogger(__name__)
+
 
 def main():
     """Основная функция для создания автомобилей."""
-    setup_logging('logging_config.yaml')
+    setup_logging()
 
     # Создание репозитория и сервиса
     car_repository = CarRepository()
@@ -21,19 +22,13 @@ def main():
         ('ElectricModel1', 1000003, 'e12345', 75.0)  # Длина 6, корректный формат
     ]
 
-    for data in cars_data:
-        if len(data) == 3:  # Обычный автомобиль
-            model, vin, numbers = data
-            car = Car(model, vin, numbers)
-        else:  # Электрический автомобиль
-            model, vin, numbers, battery_capacity = data
-            car = ElectricCar(model, vin, numbers, battery_capacity)
-
-        car_service.add_car(car)
+    # Пакетная загрузка: ошибки отдельных строк не прерывают загрузку
+    result = car_service.add_cars(cars_data)
+    for row_error in result.errors:
+        logger.warning(f'Строка {row_error.index} пропущена: {row_error.error}')
 
-    # Получение всех автомобилей
-    all_cars = car_service.get_all_cars()
-    for car in all_cars:
+    # Вывод всех автомобилей постранично, без копирования всего автопарка
+    for car in car_service.iter_cars():
         print(car.get_info())
 
 
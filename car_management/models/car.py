@@ -14,6 +14,19 @@ class Car:
         validate_vin(self.vin)
         validate_numbers(self.numbers)
 
+    @classmethod
+    def from_validated(cls, model: str, vin: int, numbers: str) -> 'Car':
+        """Создать автомобиль без валидации — для уже проверенных данных.
+
+        Используется при пакетной загрузке после validate_cars_batch и при
+        чтении из хранилища, куда попадают только проверенные автомобили.
+        """
+        car = cls.__new__(cls)
+        car.model = model
+        car.vin = vin
+        car.numbers = numbers
+        return car
+
     def get_info(self) -> str:
         """Получить информацию об автомобиле."""
         return f'{self.model} с VIN: {self.vin} и номером: {self.numbers}'
@@ -8,6 +8,13 @@ class ElectricCar(Car):
         super().__init__(model, vin, numbers)
         self.battery_capacity = battery_capacity
 
+    @classmethod
+    def from_validated(cls, model: str, vin: int, numbers: str, battery_capacity: float) -> 'ElectricCar':
+        """Создать электрический автомобиль без валидации — для уже проверенных данных."""
+        car = super().from_validated(model, vin, numbers)
+        car.battery_capacity = battery_capacity
+        return car
+
     def get_info(self) -> str:
         """Получить информацию об электрическом автомобиле."""
         return f'{super().get_info()} и емкостью батареи: {self.battery_capacity} кВтч'
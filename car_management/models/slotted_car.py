@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from car_management.validators.car_validators import validate_vin, validate_numbers
+
+
+@dataclass(order=True, slots=True)
+class SlottedCar:
+    """Вариант Car со __slots__: без __dict__ у каждого экземпляра."""
+    model: str
+    vin: int
+    numbers: str = field(compare=False)
+
+    def __post_init__(self):
+        validate_vin(self.vin)
+        validate_numbers(self.numbers)
+
+    @classmethod
+    def from_validated(cls, model: str, vin: int, numbers: str) -> 'SlottedCar':
+        """Создать автомобиль без валидации — для уже проверенных данных."""
+        car = cls.__new__(cls)
+        car.model = model
+        car.vin = vin
+        car.numbers = numbers
+        return car
+
+    def get_info(self) -> str:
+        """Получить информацию об автомобиле."""
+        return f'{self.model} с VIN: {self.vin} и номером: {self.numbers}'
+
+
+@dataclass(order=True, slots=True)
+class SlottedElectricCar(SlottedCar):
+    """Вариант ElectricCar со __slots__."""
+    battery_capacity: float = field(compare=False)
+
+    @classmethod
+    def from_validated(cls, model: str, vin: int, numbers: str,
+                       battery_capacity: float) -> 'SlottedElectricCar':
+        """Создать электрический автомобиль без валидации — для уже проверенных данных."""
+        car = cls.__new__(cls)
+        car.model = model
+        car.vin = vin
+        car.numbers = numbers
+        car.battery_capacity = battery_capacity
+        return car
+
+    def get_info(self) -> str:
+        """Получить информацию об электрическом автомобиле."""
+        # super() без аргументов не работает в dataclass со slots=True, поэтому вызываем явно
+        return f'{SlottedCar.get_info(self)} и емкостью батареи: {self.battery_capacity} кВтч'
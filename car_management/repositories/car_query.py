@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class CarFilter:
+    """Условия выборки автомобилей, которые репозиторий проверяет у себя.
+
+    Все условия необязательны и объединяются через «и». Диапазон VIN
+    включает обе границы, ``battery_capacity_above`` — строгое «больше»
+    и отбирает только электромобили.
+    """
+    electric: Optional[bool] = None
+    battery_capacity_above: Optional[float] = None
+    vin_from: Optional[int] = None
+    vin_to: Optional[int] = None
+    model_prefix: Optional[str] = None
+
+    def matches_values(self, model: str, vin: int, battery_capacity: Optional[float]) -> bool:
+        """Проверить условия по значениям атрибутов автомобиля."""
+        if self.electric is not None and (battery_capacity is not None) != self.electric:
+            return False
+        if self.battery_capacity_above is not None and (
+                battery_capacity is None or battery_capacity <= self.battery_capacity_above):
+            return False
+        if self.vin_from is not None and vin < self.vin_from:
+            return False
+        if self.vin_to is not None and vin > self.vin_to:
+            return False
+        if self.model_prefix is not None and not model.startswith(self.model_prefix):
+            return False
+        return True
+
+    def matches(self, car) -> bool:
+        """Проверить, подходит ли автомобиль под условия."""
+        return self.matches_values(car.model, car.vin, getattr(car, 'battery_capacity', None))
+
+
+@dataclass
+class Page:
+    """Страница выборки и курсор для запроса следующей страницы.
+
+    Курсор непрозрачен: его нужно передать в тот же репозиторий без изменений.
+    ``next_cursor`` равен None, если выборка закончилась.
+    """
+    cars: list
+    next_cursor: Optional[Any] = None
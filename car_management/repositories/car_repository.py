@@ -1,4 +1,6 @@
+from typing import Any, Iterable, Iterator, Optional
 from car_management.models.car import Car
+from car_management.repositories.car_query import CarFilter, Page
 
 
 class CarRepository:
@@ -11,6 +13,51 @@ class CarRepository:
         """Сохранить автомобиль."""
         self.cars.append(car)
 
+    def save_many(self, cars: Iterable[Car]) -> None:
+        """Сохранить пачку автомобилей одной операцией."""
+        self.cars.extend(cars)
+
     def get_all(self) -> list:
         """Получить все автомобили."""
         return self.cars
+
+    def iter_all(self) -> Iterator[Car]:
+        """Перебрать все автомобили."""
+        return iter(self.cars)
+
+    def fetch_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[Any] = None,
+                   limit: int = 1000) -> Page:
+        """Получить страницу автомобилей, подходящих под фильтр.
+
+        Курсор — позиция в списке, с которой продолжается просмотр. Если список
+        меняется между запросами страниц, автомобили могут быть пропущены или
+        повторены.
+        """
+        car_filter = car_filter or CarFilter()
+        position = cursor or 0
+        cars = []
+        while position < len(self.cars) and len(cars) < limit:
+            car = self.cars[position]
+            if car_filter.matches(car):
+                cars.append(car)
+            position += 1
+        return Page(cars, position if position < len(self.cars) else None)
+
+    def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру (линейный поиск)."""
+        return next((car for car in self.cars if car.vin == vin), None)
+
+    def get_by_numbers(self, numbers: str) -> Optional[Car]:
+        """Найти автомобиль по номеру (линейный поиск)."""
+        return next((car for car in self.cars if car.numbers == numbers), None)
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили, модель которых начинается с префикса."""
+        return [car for car in self.cars if car.model.startswith(prefix)]
+
+    def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру и вернуть его."""
+        for index, car in enumerate(self.cars):
+            if car.vin == vin:
+                return self.cars.pop(index)
+        return None
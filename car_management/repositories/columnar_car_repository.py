@@ -0,0 +1,160 @@
+import math
+from array import array
+from typing import Any, Iterable, Iterator, Optional
+from car_management.models.slotted_car import SlottedCar, SlottedElectricCar
+from car_management.repositories.car_query import CarFilter, Page
+
+# Номер всегда состоит из 6 символов (см. validate_numbers); в UTF-32 это 24 байта
+NUMBERS_LENGTH = 6
+NUMBERS_ENCODING = 'utf-32-le'
+NUMBERS_WIDTH = NUMBERS_LENGTH * 4
+
+
+class ColumnarCarRepository:
+    """Колоночное хранилище автомобилей.
+
+    Вместо списка объектов хранит по одному компактному массиву на атрибут:
+    коды моделей (``array('I')`` со справочником различных моделей), VIN
+    (``array('I')``), номера (``bytearray`` фиксированной ширины в UTF-32) и
+    емкости батарей (``array('d')``, NaN для обычных автомобилей). Объекты
+    SlottedCar и SlottedElectricCar создаются только при чтении.
+
+    Индексов нет: поиск по VIN и номеру — линейный просмотр массива на уровне C.
+    При удалении на место удалённого автомобиля переносится последний.
+    """
+
+    def __init__(self):
+        self._models = []
+        self._model_codes = {}
+        self._model_column = array('I')
+        self._vins = array('I')
+        self._numbers = bytearray()
+        self._battery_capacities = array('d')
+
+    def __len__(self) -> int:
+        return len(self._vins)
+
+    def __iter__(self) -> Iterator[SlottedCar]:
+        return (self.view(position) for position in range(len(self)))
+
+    def save(self, car) -> None:
+        """Сохранить автомобиль, разложив его атрибуты по колонкам."""
+        code = self._model_codes.get(car.model)
+        if code is None:
+            code = self._model_codes[car.model] = len(self._models)
+            self._models.append(car.model)
+        battery_capacity = getattr(car, 'battery_capacity', None)
+
+        self._model_column.append(code)
+        self._vins.append(car.vin)
+        self._numbers += car.numbers.encode(NUMBERS_ENCODING)
+        self._battery_capacities.append(math.nan if battery_capacity is None else battery_capacity)
+
+    def save_many(self, cars: Iterable) -> None:
+        """Сохранить пачку автомобилей."""
+        for car in cars:
+            self.save(car)
+
+    def view(self, position: int) -> SlottedCar:
+        """Создать объект автомобиля для строки с указанной позицией."""
+        model = self._models[self._model_column[position]]
+        vin = self._vins[position]
+        numbers = self._numbers_at(position)
+        battery_capacity = self._battery_capacities[position]
+        # В колонки попадают только проверенные автомобили, повторная валидация не нужна
+        if math.isnan(battery_capacity):
+            return SlottedCar.from_validated(model, vin, numbers)
+        return SlottedElectricCar.from_validated(model, vin, numbers, battery_capacity)
+
+    def get_all(self) -> list:
+        """Получить все автомобили (создаёт объект для каждой строки)."""
+        return list(self)
+
+    def iter_all(self) -> Iterator[SlottedCar]:
+        """Перебрать все автомобили, создавая объекты по одному."""
+        return iter(self)
+
+    def fetch_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[Any] = None,
+                   limit: int = 1000) -> Page:
+        """Получить страницу автомобилей, подходящих под фильтр.
+
+        Условия проверяются прямо по колонкам, объекты создаются только для
+        подходящих строк. Курсор — позиция строки, с которой продолжается просмотр.
+        """
+        car_filter = car_filter or CarFilter()
+        position = cursor or 0
+        count = len(self)
+        models = self._models
+        cars = []
+        while position < count and len(cars) < limit:
+            battery_capacity = self._battery_capacities[position]
+            if car_filter.matches_values(models[self._model_column[position]], self._vins[position],
+                                         None if math.isnan(battery_capacity) else battery_capacity):
+                cars.append(self.view(position))
+            position += 1
+        return Page(cars, position if position < count else None)
+
+    def get_by_vin(self, vin: int) -> Optional[SlottedCar]:
+        """Найти автомобиль по VIN номеру."""
+        position = self._find_vin(vin)
+        return None if position is None else self.view(position)
+
+    def get_by_numbers(self, numbers: str) -> Optional[SlottedCar]:
+        """Найти автомобиль по номеру."""
+        if len(numbers) != NUMBERS_LENGTH:
+            return None
+        needle = numbers.encode(NUMBERS_ENCODING)
+        offset = self._numbers.find(needle)
+        while offset != -1:
+            # Совпадение засчитывается только на границе записи
+            if offset % NUMBERS_WIDTH == 0:
+                return self.view(offset // NUMBERS_WIDTH)
+            offset = self._numbers.find(needle, offset + 1)
+        return None
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили, модель которых начинается с префикса."""
+        codes = {code for model, code in self._model_codes.items() if model.startswith(prefix)}
+        if not codes:
+            return []
+        return [self.view(position) for position, code in enumerate(self._model_column) if code in codes]
+
+    def remove(self, vin: int) -> Optional[SlottedCar]:
+        """Удалить автомобиль по VIN номеру и вернуть его."""
+        position = self._find_vin(vin)
+        if position is None:
+            return None
+
+        car = self.view(position)
+        last = len(self) - 1
+        if position != last:
+            # Переносим последнюю строку в освободившуюся позицию
+            self._model_column[position] = self._model_column[last]
+            self._vins[position] = self._vins[last]
+            self._battery_capacities[position] = self._battery_capacities[last]
+            start = position * NUMBERS_WIDTH
+            self._numbers[start:start + NUMBERS_WIDTH] = self._numbers[last * NUMBERS_WIDTH:]
+        self._model_column.pop()
+        self._vins.pop()
+        self._battery_capacities.pop()
+        del self._numbers[last * NUMBERS_WIDTH:]
+        return car
+
+    def memory_usage(self) -> int:
+        """Объём памяти под колонки в байтах (без справочника моделей)."""
+        return (self._model_column.buffer_info()[1] * self._model_column.itemsize
+                + self._vins.buffer_info()[1] * self._vins.itemsize
+                + len(self._numbers)
+                + self._battery_capacities.buffer_info()[1] * self._battery_capacities.itemsize)
+
+    def _find_vin(self, vin: int) -> Optional[int]:
+        """Позиция VIN в колонке или None."""
+        try:
+            return self._vins.index(vin)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    def _numbers_at(self, position: int) -> str:
+        """Декодировать номер из строки с указанной позицией."""
+        start = position * NUMBERS_WIDTH
+        return self._numbers[start:start + NUMBERS_WIDTH].decode(NUMBERS_ENCODING)
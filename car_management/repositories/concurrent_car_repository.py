@@ -0,0 +1,168 @@
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
+from car_management.models.car import Car
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.car_query import CarFilter, Page
+
+
+class _Stripe:
+    """Полоса репозитория: своя блокировка и своя часть автомобилей."""
+    __slots__ = ('lock', 'cars', 'acquisitions', 'contended')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cars = {}
+        self.acquisitions = 0
+        self.contended = 0
+
+    @contextmanager
+    def locked(self):
+        """Захватить блокировку полосы, подсчитав ожидания."""
+        contended = not self.lock.acquire(blocking=False)
+        if contended:
+            self.lock.acquire()
+        try:
+            # Счётчики меняются только под блокировкой полосы
+            self.acquisitions += 1
+            self.contended += contended
+            yield self.cars
+        finally:
+            self.lock.release()
+
+    def snapshot(self) -> list:
+        """Снимок автомобилей полосы без захвата блокировки.
+
+        В CPython копирование значений словаря выполняется целиком в C под GIL
+        и не пересекается с записью из других потоков. Если запись всё же
+        вклинилась (RuntimeError), снимок повторяется под блокировкой.
+        """
+        try:
+            return list(self.cars.values())
+        except RuntimeError:
+            with self.lock:
+                return list(self.cars.values())
+
+
+class ConcurrentCarRepository:
+    """Потокобезопасный репозиторий с блокировками, разбитыми на полосы по VIN.
+
+    Автомобили распределены по ``stripes`` словарям по хешу VIN, у каждого
+    словаря своя блокировка, поэтому потоки, пишущие разные VIN, почти не
+    мешают друг другу. Вставка атомарна: VIN проверяется и записывается под
+    одной блокировкой. Чтение по VIN и снимки для перебора не захватывают
+    блокировок и не задерживают писателей. Уникальность номеров не проверяется.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe.cars) for stripe in self._stripes)
+
+    def _stripe_index(self, vin: int) -> int:
+        return hash(vin) % len(self._stripes)
+
+    def save(self, car: Car) -> None:
+        """Сохранить автомобиль; если VIN уже есть, выбросить DuplicateCar."""
+        if not self.save_if_absent(car):
+            raise DuplicateCar(f'Автомобиль с VIN {car.vin} уже существует')
+
+    def save_if_absent(self, car: Car) -> bool:
+        """Атомарно сохранить автомобиль, если его VIN ещё нет. Возвращает True при вставке."""
+        with self._stripes[self._stripe_index(car.vin)].locked() as cars:
+            if car.vin in cars:
+                return False
+            cars[car.vin] = car
+            return True
+
+    def save_many(self, cars: Iterable[Car]) -> None:
+        """Атомарно сохранить пачку автомобилей.
+
+        Захватываются блокировки всех затронутых полос в порядке возрастания их
+        номеров, что исключает взаимную блокировку с другими пачками. Если хотя
+        бы один VIN уже есть, ничего не сохраняется и выбрасывается DuplicateCar.
+        """
+        groups = {}
+        for car in cars:
+            groups.setdefault(self._stripe_index(car.vin), []).append(car)
+
+        with ExitStack() as stack:
+            locked = {index: stack.enter_context(self._stripes[index].locked()) for index in sorted(groups)}
+            batch_vins = set()
+            for index, group in groups.items():
+                for car in group:
+                    if car.vin in locked[index] or car.vin in batch_vins:
+                        raise DuplicateCar(f'Автомобиль с VIN {car.vin} уже существует')
+                    batch_vins.add(car.vin)
+            for index, group in groups.items():
+                locked[index].update((car.vin, car) for car in group)
+
+    def snapshot(self) -> list:
+        """Снимок всех автомобилей, не блокирующий писателей.
+
+        Каждая полоса копируется атомарно, но полосы копируются по очереди,
+        поэтому снимок согласован в пределах полосы, а не всего репозитория.
+        """
+        cars = []
+        for stripe in self._stripes:
+            cars.extend(stripe.snapshot())
+        return cars
+
+    def get_all(self) -> list:
+        """Получить все автомобили (снимок)."""
+        return self.snapshot()
+
+    def iter_all(self) -> Iterator[Car]:
+        """Перебрать автомобили по снимкам полос."""
+        for stripe in self._stripes:
+            yield from stripe.snapshot()
+
+    def fetch_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[Tuple[int, int]] = None,
+                   limit: int = 1000) -> Page:
+        """Получить страницу автомобилей; курсор — пара (номер полосы, позиция в её снимке).
+
+        Снимок полосы берётся заново для каждой страницы, поэтому изменения
+        полосы между запросами могут сдвинуть позиции.
+        """
+        car_filter = car_filter or CarFilter()
+        stripe_index, position = cursor or (0, 0)
+        cars = []
+        while stripe_index < len(self._stripes):
+            stripe_cars = self._stripes[stripe_index].snapshot()
+            while position < len(stripe_cars):
+                if len(cars) == limit:
+                    return Page(cars, (stripe_index, position))
+                if car_filter.matches(stripe_cars[position]):
+                    cars.append(stripe_cars[position])
+                position += 1
+            stripe_index, position = stripe_index + 1, 0
+        return Page(cars, None)
+
+    def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру без захвата блокировки."""
+        return self._stripes[self._stripe_index(vin)].cars.get(vin)
+
+    def get_by_numbers(self, numbers: str) -> Optional[Car]:
+        """Найти автомобиль по номеру (линейный поиск по снимку)."""
+        return next((car for car in self.iter_all() if car.numbers == numbers), None)
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили по префиксу модели (линейный поиск по снимку)."""
+        return [car for car in self.iter_all() if car.model.startswith(prefix)]
+
+    def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру и вернуть его."""
+        with self._stripes[self._stripe_index(vin)].locked() as cars:
+            return cars.pop(vin, None)
+
+    def contention_stats(self) -> dict:
+        """Статистика блокировок: число захватов и захватов с ожиданием."""
+        acquisitions = sum(stripe.acquisitions for stripe in self._stripes)
+        contended = sum(stripe.contended for stripe in self._stripes)
+        return {
+            'stripes': len(self._stripes),
+            'acquisitions': acquisitions,
+            'contended': contended,
+            'contention_ratio': contended / acquisitions if acquisitions else 0.0,
+        }
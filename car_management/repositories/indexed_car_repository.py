@@ -0,0 +1,112 @@
+import bisect
+from typing import Iterable, Optional
+from car_management.models.car import Car
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.car_repository import CarRepository
+
+
+class IndexedCarRepository(CarRepository):
+    """Репозиторий автомобилей с индексами по VIN, номеру и модели.
+
+    Помимо списка автомобилей хранит хеш-индексы ``vin -> позиция в списке`` и
+    ``номер -> автомобиль``, а также вторичный индекс по модели: отсортированный
+    список различных моделей и для каждой модели множество её VIN в порядке
+    добавления. Поиск по VIN и номеру выполняется за O(1), поиск по префиксу
+    модели — за O(log m + k), где m — число различных моделей. При удалении на
+    место удалённого автомобиля переносится последний, поэтому порядок
+    ``get_all`` после удалений не сохраняется.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._vin_index = {}
+        self._numbers_index = {}
+        self._models = []
+        self._model_index = {}
+
+    def save(self, car: Car) -> None:
+        """Сохранить автомобиль, проверив уникальность VIN и номера."""
+        if car.vin in self._vin_index:
+            raise DuplicateCar(f'Автомобиль с VIN {car.vin} уже существует')
+        if car.numbers in self._numbers_index:
+            raise DuplicateCar(f'Автомобиль с номером {car.numbers} уже существует')
+
+        self._vin_index[car.vin] = len(self.cars)
+        self._numbers_index[car.numbers] = car
+        self._index_model(car)
+        self.cars.append(car)
+
+    def save_many(self, cars: Iterable[Car]) -> None:
+        """Сохранить пачку автомобилей атомарно.
+
+        Сначала проверяется уникальность всей пачки (включая повторы внутри неё),
+        и только затем она добавляется в список и индексы. При нарушении
+        уникальности выбрасывается DuplicateCar, а репозиторий не изменяется.
+        """
+        cars = list(cars)
+        batch_vins = set()
+        batch_numbers = set()
+        for car in cars:
+            if car.vin in self._vin_index or car.vin in batch_vins:
+                raise DuplicateCar(f'Автомобиль с VIN {car.vin} уже существует')
+            if car.numbers in self._numbers_index or car.numbers in batch_numbers:
+                raise DuplicateCar(f'Автомобиль с номером {car.numbers} уже существует')
+            batch_vins.add(car.vin)
+            batch_numbers.add(car.numbers)
+
+        position = len(self.cars)
+        for car in cars:
+            self._vin_index[car.vin] = position
+            self._numbers_index[car.numbers] = car
+            position += 1
+            self._index_model(car)
+        self.cars.extend(cars)
+
+    def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру за O(1)."""
+        position = self._vin_index.get(vin)
+        return None if position is None else self.cars[position]
+
+    def get_by_numbers(self, numbers: str) -> Optional[Car]:
+        """Найти автомобиль по номеру за O(1)."""
+        return self._numbers_index.get(numbers)
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили по префиксу модели: по возрастанию модели, внутри — в порядке добавления."""
+        models = self._models
+        position = bisect.bisect_left(models, prefix)
+        result = []
+        while position < len(models) and models[position].startswith(prefix):
+            result.extend(self.cars[self._vin_index[vin]] for vin in self._model_index[models[position]])
+            position += 1
+        return result
+
+    def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру и вернуть его."""
+        position = self._vin_index.pop(vin, None)
+        if position is None:
+            return None
+
+        car = self.cars[position]
+        last = self.cars.pop()
+        if position < len(self.cars):
+            # Переносим последний автомобиль в освободившуюся ячейку
+            self.cars[position] = last
+            self._vin_index[last.vin] = position
+
+        del self._numbers_index[car.numbers]
+        vins = self._model_index[car.model]
+        del vins[car.vin]
+        if not vins:
+            del self._model_index[car.model]
+            del self._models[bisect.bisect_left(self._models, car.model)]
+        return car
+
+    def _index_model(self, car: Car) -> None:
+        """Добавить VIN автомобиля во вторичный индекс по модели."""
+        vins = self._model_index.get(car.model)
+        if vins is None:
+            # Словарь используется как упорядоченное множество VIN
+            vins = self._model_index[car.model] = {}
+            bisect.insort(self._models, car.model)
+        vins[car.vin] = None
@@ -0,0 +1,256 @@
+import itertools
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.car_query import CarFilter, Page
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS cars (
+    vin INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    numbers TEXT NOT NULL UNIQUE,
+    battery_capacity REAL
+);
+CREATE INDEX IF NOT EXISTS idx_cars_model ON cars (model);
+'''
+
+COLUMNS = 'model, vin, numbers, battery_capacity'
+
+# Счётчик для уникальных имён разделяемых in-memory баз
+_memory_databases = itertools.count()
+
+
+class ConnectionPool:
+    """Небольшой пул соединений SQLite, который можно разделять между потоками.
+
+    Соединение выдаётся одному потоку на время ``with pool.connection()`` и
+    затем возвращается в пул; если все соединения заняты, поток ждёт.
+    ``close`` закрывает и выданные соединения.
+    """
+
+    def __init__(self, database: str, size: int = 4, timeout: float = 5.0):
+        uri = False
+        if database == ':memory:':
+            # Обычная :memory: база у каждого соединения своя, поэтому используем разделяемый кэш
+            database = f'file:car_management_{next(_memory_databases)}?mode=memory&cache=shared'
+            uri = True
+
+        self._connections = queue.Queue(maxsize=size)
+        self._all = []
+        for index in range(size):
+            connection = sqlite3.connect(database, timeout=timeout, uri=uri, check_same_thread=False)
+            if index == 0:
+                # Режим WAL включается до открытия остальных соединений, иначе они
+                # продолжат видеть прежний режим журнала до первого чтения
+                connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._all.append(connection)
+            self._connections.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Взять соединение из пула на время блока with."""
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        """Закрыть все соединения пула, в том числе выданные потокам.
+
+        Закрытые соединения остаются в пуле, поэтому обращение к базе после
+        закрытия завершается ошибкой sqlite3.ProgrammingError, а не ожиданием.
+        """
+        for connection in self._all:
+            connection.close()
+
+
+def _row_to_car(row) -> Car:
+    """Создать автомобиль из строки таблицы cars; данные в таблице уже проверены."""
+    model, vin, numbers, battery_capacity = row
+    if battery_capacity is None:
+        return Car.from_validated(model, vin, numbers)
+    return ElectricCar.from_validated(model, vin, numbers, battery_capacity)
+
+
+def _car_to_row(car: Car) -> tuple:
+    """Преобразовать автомобиль в строку таблицы cars."""
+    return car.model, car.vin, car.numbers, getattr(car, 'battery_capacity', None)
+
+
+def _duplicate_error(error: sqlite3.IntegrityError, car: Optional[Car] = None) -> DuplicateCar:
+    """Преобразовать нарушение уникальности SQLite в DuplicateCar."""
+    if car is not None and 'cars.vin' in str(error):
+        return DuplicateCar(f'Автомобиль с VIN {car.vin} уже существует')
+    if car is not None and 'cars.numbers' in str(error):
+        return DuplicateCar(f'Автомобиль с номером {car.numbers} уже существует')
+    return DuplicateCar(f'Нарушена уникальность автомобилей: {error}')
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Наименьшая строка, большая всех строк с данным префиксом."""
+    if not prefix or ord(prefix[-1]) == 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _filter_to_sql(car_filter: CarFilter) -> Tuple[List[str], list]:
+    """Перевести CarFilter в условия WHERE и их параметры."""
+    clauses, parameters = [], []
+    if car_filter.electric is True:
+        clauses.append('battery_capacity IS NOT NULL')
+    elif car_filter.electric is False:
+        clauses.append('battery_capacity IS NULL')
+    if car_filter.battery_capacity_above is not None:
+        clauses.append('battery_capacity > ?')
+        parameters.append(car_filter.battery_capacity_above)
+    if car_filter.vin_from is not None:
+        clauses.append('vin >= ?')
+        parameters.append(car_filter.vin_from)
+    if car_filter.vin_to is not None:
+        clauses.append('vin <= ?')
+        parameters.append(car_filter.vin_to)
+    if car_filter.model_prefix:
+        upper_bound = _prefix_upper_bound(car_filter.model_prefix)
+        if upper_bound is None:
+            clauses.append('substr(model, 1, ?) = ?')
+            parameters.extend((len(car_filter.model_prefix), car_filter.model_prefix))
+        else:
+            clauses.append('model >= ? AND model < ?')
+            parameters.extend((car_filter.model_prefix, upper_bound))
+    return clauses, parameters
+
+
+class SQLiteCarRepository:
+    """Репозиторий автомобилей в базе SQLite.
+
+    Реализует тот же контракт, что и CarRepository. VIN хранится как
+    INTEGER PRIMARY KEY, номер — как UNIQUE-колонка, для модели есть
+    отдельный индекс. База работает в режиме WAL, поэтому чтение не блокирует
+    запись; пул соединений позволяет использовать один репозиторий из
+    нескольких потоков.
+    """
+
+    # Операции ждут диск, поэтому AsyncCarService выполняет их в пуле потоков
+    blocking_io = True
+
+    def __init__(self, database: str, pool_size: int = 4, fetch_size: int = 1000):
+        self.fetch_size = fetch_size
+        self.pool = ConnectionPool(database, size=pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT COUNT(*) FROM cars').fetchone()[0]
+
+    def save(self, car: Car) -> None:
+        """Сохранить автомобиль."""
+        with self.pool.connection() as connection:
+            try:
+                with connection:
+                    connection.execute(f'INSERT INTO cars ({COLUMNS}) VALUES (?, ?, ?, ?)', _car_to_row(car))
+            except sqlite3.IntegrityError as error:
+                raise _duplicate_error(error, car) from error
+
+    def save_many(self, cars: Iterable[Car]) -> None:
+        """Сохранить пачку автомобилей одной транзакцией через executemany.
+
+        При нарушении уникальности транзакция откатывается целиком и
+        выбрасывается DuplicateCar.
+        """
+        with self.pool.connection() as connection:
+            try:
+                with connection:
+                    connection.executemany(f'INSERT INTO cars ({COLUMNS}) VALUES (?, ?, ?, ?)',
+                                           map(_car_to_row, cars))
+            except sqlite3.IntegrityError as error:
+                raise _duplicate_error(error) from error
+
+    def iter_all(self) -> Iterator[Car]:
+        """Потоково перебрать все автомобили в порядке VIN.
+
+        Автомобили читаются страницами fetch_page по ``fetch_size``, поэтому в
+        памяти одновременно находится не больше одной страницы. Соединение
+        берётся из пула только на время запроса страницы, так что вложенный или
+        брошенный перебор не занимает пул.
+        """
+        cursor = None
+        while True:
+            page = self.fetch_page(cursor=cursor, limit=self.fetch_size)
+            yield from page.cars
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def fetch_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[int] = None,
+                   limit: int = 1000) -> Page:
+        """Получить страницу автомобилей, подходящих под фильтр.
+
+        Условия фильтра выполняются в SQL. Пагинация — по ключу: курсор равен
+        последнему VIN страницы, и следующая страница начинается с ``vin > cursor``
+        по первичному ключу, без OFFSET.
+        """
+        clauses, parameters = _filter_to_sql(car_filter or CarFilter())
+        if cursor is not None:
+            clauses.append('vin > ?')
+            parameters.append(cursor)
+        where = f'WHERE {" AND ".join(clauses)}' if clauses else ''
+
+        with self.pool.connection() as connection:
+            # Лишняя строка показывает, есть ли следующая страница
+            rows = connection.execute(f'SELECT {COLUMNS} FROM cars {where} ORDER BY vin LIMIT ?',
+                                      (*parameters, limit + 1)).fetchall()
+        cars = [_row_to_car(row) for row in rows[:limit]]
+        return Page(cars, cars[-1].vin if len(rows) > limit else None)
+
+    def get_all(self) -> list:
+        """Получить все автомобили списком; для больших баз используйте iter_all."""
+        return list(self.iter_all())
+
+    def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру."""
+        return self._fetch_one(f'SELECT {COLUMNS} FROM cars WHERE vin = ?', (vin,))
+
+    def get_by_numbers(self, numbers: str) -> Optional[Car]:
+        """Найти автомобиль по номеру."""
+        return self._fetch_one(f'SELECT {COLUMNS} FROM cars WHERE numbers = ?', (numbers,))
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили по префиксу модели с помощью диапазона по индексу модели."""
+        upper_bound = _prefix_upper_bound(prefix)
+        with self.pool.connection() as connection:
+            if upper_bound is None:
+                rows = connection.execute(
+                    f'SELECT {COLUMNS} FROM cars WHERE model >= ? ORDER BY model, vin', (prefix,))
+            else:
+                rows = connection.execute(
+                    f'SELECT {COLUMNS} FROM cars WHERE model >= ? AND model < ? ORDER BY model, vin',
+                    (prefix, upper_bound))
+            return [_row_to_car(row) for row in rows if row[0].startswith(prefix)]
+
+    def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру и вернуть его."""
+        with self.pool.connection() as connection:
+            with connection:
+                row = connection.execute(f'SELECT {COLUMNS} FROM cars WHERE vin = ?', (vin,)).fetchone()
+                if row is None:
+                    return None
+                deleted = connection.execute('DELETE FROM cars WHERE vin = ?', (vin,)).rowcount
+        # Строку мог удалить другой поток между SELECT и DELETE
+        return _row_to_car(row) if deleted else None
+
+    def close(self) -> None:
+        """Закрыть соединения с базой."""
+        self.pool.close()
+
+    def _fetch_one(self, sql: str, parameters: tuple) -> Optional[Car]:
+        """Выполнить запрос и вернуть первый автомобиль или None."""
+        with self.pool.connection() as connection:
+            row = connection.execute(sql, parameters).fetchone()
+        return None if row is None else _row_to_car(row)
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Optional
+from car_management.analytics.fleet_analytics import FleetAnalytics
+from car_management.models.car import Car
+from car_management.repositories.car_query import CarFilter, Page
+from car_management.services.car_service import BulkAddResult, CarService, RowError
+
+
+class AsyncCarService:
+    """Асинхронный сервис для работы с автомобилями поверх CarService.
+
+    Если репозиторий выполняет блокирующий ввод-вывод (атрибут ``blocking_io``,
+    например у SQLiteCarRepository), вызовы уходят в пул из ``max_workers``
+    потоков, а число ожидающих вызовов ограничено ``max_pending``, чтобы очередь
+    пула не росла без предела. Репозитории в памяти вызываются прямо в цикле
+    событий: их операции короткие, и передача в поток стоила бы дороже.
+    """
+
+    def __init__(self, repository, max_workers: int = 4, max_pending: Optional[int] = None,
+                 executor: Optional[ThreadPoolExecutor] = None, analytics: Optional[FleetAnalytics] = None):
+        self.service = CarService(repository, analytics)
+        self._blocking = getattr(repository, 'blocking_io', False)
+        self._own_executor = executor is None and self._blocking
+        self._executor = executor
+        if self._own_executor:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='car-service')
+        self._pending = asyncio.Semaphore(max_pending or max_workers * 4)
+
+    async def __aenter__(self) -> 'AsyncCarService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _call(self, function, *args):
+        """Выполнить вызов сервиса в пуле потоков или прямо в цикле событий."""
+        if not self._blocking:
+            return function(*args)
+        async with self._pending:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(function, *args))
+
+    async def add_car(self, car: Car) -> None:
+        """Добавить автомобиль в репозиторий."""
+        await self._call(self.service.add_car, car)
+
+    async def add_cars(self, rows, chunk_size: int = 10000) -> BulkAddResult:
+        """Пакетно добавить автомобили из обычного или асинхронного потока строк.
+
+        Каждая пачка из ``chunk_size`` строк обрабатывается одним вызовом
+        CarService.add_cars; номера строк в ошибках сквозные для всего потока.
+        Между пачками управление отдаётся циклу событий, даже если репозиторий
+        в памяти и пачки обрабатываются прямо в цикле.
+        """
+        result = BulkAddResult()
+        offset = 0
+        async for chunk in _chunks(rows, chunk_size):
+            chunk_result = await self._call(self.service.add_cars, chunk, chunk_size)
+            result.added += chunk_result.added
+            result.errors.extend(RowError(error.index + offset, error.row, error.error)
+                                 for error in chunk_result.errors)
+            offset += len(chunk)
+            await asyncio.sleep(0)
+        return result
+
+    async def get_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[Any] = None,
+                       page_size: int = 1000) -> Page:
+        """Получить одну страницу автомобилей."""
+        return await self._call(self.service.get_page, car_filter, cursor, page_size)
+
+    async def iter_cars(self, car_filter: Optional[CarFilter] = None,
+                        page_size: int = 1000) -> AsyncIterator[Car]:
+        """Асинхронно перебрать автомобили, запрашивая их страницами.
+
+        Между страницами управление отдаётся циклу событий, поэтому перебор
+        репозитория в памяти не блокирует другие задачи.
+        """
+        cursor = None
+        while True:
+            page = await self.get_page(car_filter, cursor, page_size)
+            for car in page.cars:
+                yield car
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+            await asyncio.sleep(0)
+
+    async def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру."""
+        return await self._call(self.service.get_by_vin, vin)
+
+    async def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру."""
+        return await self._call(self.service.remove, vin)
+
+    def close(self) -> None:
+        """Остановить собственный пул потоков, дождавшись текущих вызовов."""
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    async def aclose(self) -> None:
+        """Остановить собственный пул потоков, не блокируя цикл событий, пока идут текущие вызовы."""
+        if self._own_executor:
+            await asyncio.to_thread(self._executor.shutdown, True)
+
+
+async def _chunks(rows, chunk_size: int):
+    """Разбить обычный или асинхронный поток строк на списки по chunk_size."""
+    if hasattr(rows, '__aiter__'):
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    else:
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield chunk
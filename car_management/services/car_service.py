@@ -1,17 +1,173 @@
+from dataclasses import dataclass, field
+from itertools import count, islice
+from typing import Any, Iterable, Iterator, List, Optional
+from car_management.analytics.fleet_analytics import FleetAnalytics
 from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.car_query import CarFilter, Page
 from car_management.repositories.car_repository import CarRepository
+from car_management.validators.car_validators import (
+    VIN_RANGE_ERROR, VIN_TYPE_ERROR, validate_cars_batch, validation_error
+)
+
+
+@dataclass
+class RowError:
+    """Ошибка при добавлении одной строки пакетной загрузки."""
+    index: int
+    row: Any
+    error: Exception
+
+
+@dataclass
+class BulkAddResult:
+    """Итог пакетной загрузки автомобилей."""
+    added: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+
+def _parse_row(row) -> tuple:
+    """Разобрать строку загрузки в (model, vin, numbers, battery_capacity).
+
+    Для короткой, нечитаемой строки или нечисловой емкости батареи бросает
+    TypeError, ValueError, KeyError или IndexError.
+    """
+    if type(row) is tuple and len(row) == 4 and (row[3] is None or type(row[3]) is float):
+        return row
+    if isinstance(row, Car):
+        return row.model, row.vin, row.numbers, getattr(row, 'battery_capacity', None)
+    if isinstance(row, (str, bytes)):
+        raise ValueError(f'Не удалось разобрать строку: {row!r}')
+    if isinstance(row, dict):
+        model, vin, numbers, battery_capacity = row['model'], row['vin'], row['numbers'], row.get('battery_capacity')
+    else:
+        model, vin, numbers, *rest = row
+        battery_capacity = rest[0] if rest else None
+    if battery_capacity is not None:
+        battery_capacity = float(battery_capacity)
+    return model, vin, numbers, battery_capacity
+
+
+_PARSE_ERRORS = (TypeError, ValueError, KeyError, IndexError)
 
 
 class CarService:
     """Сервис для работы с автомобилями."""
 
-    def __init__(self, repository: CarRepository):
+    def __init__(self, repository: CarRepository, analytics: Optional[FleetAnalytics] = None):
         self.repository = repository
+        self.analytics = analytics
 
     def add_car(self, car: Car) -> None:
         """Добавить автомобиль в репозиторий."""
         self.repository.save(car)
+        if self.analytics is not None:
+            self.analytics.on_add(car)
+
+    def add_cars(self, rows: Iterable, chunk_size: int = 10000) -> BulkAddResult:
+        """Пакетно добавить автомобили из потока строк.
+
+        Строки (кортежи, словари или готовые Car) читаются лениво и обрабатываются
+        частями по ``chunk_size``. Каждая часть проверяется пакетным валидатором,
+        а автомобили создаются без повторной валидации. Ошибки отдельных строк
+        (в том числе нечитаемые строки и нечисловая емкость батареи) собираются
+        в результат и не прерывают загрузку. Каждая часть сохраняется
+        в репозиторий одним вызовом ``save_many``; если в ней найден дубликат,
+        часть сохраняется поштучно, чтобы отклонить только повторяющиеся строки.
+        """
+        result = BulkAddResult()
+        rows = iter(rows)
+        offset = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            parsed = []
+            parse_errors = {}
+            for index, row in zip(count(offset), chunk):
+                try:
+                    parsed.append(_parse_row(row))
+                except _PARSE_ERRORS as error:
+                    parse_errors[index] = error
+                    parsed.append((None, None, None, None))
+            _, codes = validate_cars_batch([fields[1] for fields in parsed], [fields[2] for fields in parsed])
+
+            cars = []
+            indexes = []
+            for index, row, (model, vin, numbers, battery_capacity), code in zip(
+                    count(offset), chunk, parsed, codes):
+                if parse_errors and index in parse_errors:
+                    result.errors.append(RowError(index, row, parse_errors[index]))
+                    continue
+                if code:
+                    value = vin if code in (VIN_TYPE_ERROR, VIN_RANGE_ERROR) else numbers
+                    result.errors.append(RowError(index, row, validation_error(code, value)))
+                    continue
+                if isinstance(row, Car):
+                    cars.append(row)
+                elif battery_capacity is None:
+                    cars.append(Car.from_validated(model, vin, numbers))
+                else:
+                    cars.append(ElectricCar.from_validated(model, vin, numbers, battery_capacity))
+                indexes.append(index)
+
+            try:
+                self.repository.save_many(cars)
+                result.added += len(cars)
+                if self.analytics is not None:
+                    self.analytics.on_add_many(cars)
+            except DuplicateCar:
+                for index, car in zip(indexes, cars):
+                    try:
+                        self.add_car(car)
+                        result.added += 1
+                    except DuplicateCar as error:
+                        result.errors.append(RowError(index, chunk[index - offset], error))
+            offset += len(chunk)
+
+        result.errors.sort(key=lambda row_error: row_error.index)
+        return result
 
     def get_all_cars(self) -> list:
         """Получить все автомобили."""
         return self.repository.get_all()
+
+    def get_page(self, car_filter: Optional[CarFilter] = None, cursor: Optional[Any] = None,
+                 page_size: int = 1000) -> Page:
+        """Получить одну страницу автомобилей; фильтр выполняется в репозитории."""
+        return self.repository.fetch_page(car_filter, cursor, page_size)
+
+    def iter_cars(self, car_filter: Optional[CarFilter] = None, page_size: int = 1000) -> Iterator[Car]:
+        """Лениво перебрать автомобили, подходящие под фильтр, запрашивая их страницами.
+
+        В памяти одновременно находится не больше одной страницы, поэтому отчёты
+        и выгрузки по всему автопарку работают в постоянной памяти.
+        """
+        cursor = None
+        while True:
+            page = self.repository.fetch_page(car_filter, cursor, page_size)
+            yield from page.cars
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    def get_by_vin(self, vin: int) -> Optional[Car]:
+        """Найти автомобиль по VIN номеру."""
+        return self.repository.get_by_vin(vin)
+
+    def get_by_numbers(self, numbers: str) -> Optional[Car]:
+        """Найти автомобиль по номеру."""
+        return self.repository.get_by_numbers(numbers)
+
+    def find_by_model_prefix(self, prefix: str) -> list:
+        """Найти автомобили по префиксу модели."""
+        return self.repository.find_by_model_prefix(prefix)
+
+    def remove(self, vin: int) -> Optional[Car]:
+        """Удалить автомобиль по VIN номеру."""
+        car = self.repository.remove(vin)
+        if car is not None and self.analytics is not None:
+            self.analytics.on_remove(car)
+        return car
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from car_management.models.car import Car
+from car_management.repositories.car_query import CarFilter
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.repositories.sqlite_car_repository import SQLiteCarRepository
+from car_management.services.async_car_service import AsyncCarService
+
+
+async def async_rows(rows):
+    for row in rows:
+        await asyncio.sleep(0)
+        yield row
+
+
+class TestAsyncCarService(unittest.IsolatedAsyncioTestCase):
+    """Тесты для AsyncCarService."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.sqlite = SQLiteCarRepository(os.path.join(self.directory.name, 'cars.db'))
+
+    def tearDown(self):
+        self.sqlite.close()
+        self.directory.cleanup()
+
+    async def test_concurrent_add_car(self):
+        """Тест: одновременные add_car не теряют автомобили ни в памяти, ни в SQLite."""
+        for repository in (IndexedCarRepository(), self.sqlite):
+            with self.subTest(repository=type(repository).__name__):
+                async with AsyncCarService(repository, max_workers=2, max_pending=4) as service:
+                    await asyncio.gather(*(service.add_car(Car('Model', 1000000 + i, f'{i:06d}'))
+                                           for i in range(200)))
+                    self.assertEqual((await service.get_by_vin(1000199)).numbers, '000199')
+                self.assertEqual(len(repository.get_all()), 200)
+
+    async def test_add_cars_from_async_stream(self):
+        """Тест пакетной загрузки из асинхронного потока со сквозными номерами строк."""
+        rows = [('Model1', 1000001, 'a00001'), ('Model2', 999, 'a00002'),
+                ('Model3', 1000003, 'a00003'), ('Model4', 1000001, 'a00004')]
+        async with AsyncCarService(self.sqlite) as service:
+            result = await service.add_cars(async_rows(rows), chunk_size=2)
+        self.assertEqual(result.added, 2)
+        self.assertEqual([error.index for error in result.errors], [1, 3])
+
+    async def test_add_cars_yields_between_chunks(self):
+        """Тест: загрузка в репозиторий в памяти отдаёт управление циклу событий между пачками."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        started = ticks
+        service = AsyncCarService(IndexedCarRepository())
+        await service.add_cars(((f'Model{i}', 1000000 + i, f'{i:06d}') for i in range(30)), chunk_size=10)
+        task.cancel()
+        self.assertGreaterEqual(ticks - started, 2)
+
+    async def test_iter_cars_yields_between_pages(self):
+        """Тест: перебор репозитория в памяти отдаёт управление циклу событий между страницами."""
+        service = AsyncCarService(IndexedCarRepository())
+        await service.add_cars((f'Model{i}', 1000000 + i, f'{i:06d}') for i in range(30))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        started = ticks
+        vins = [car.vin async for car in service.iter_cars(page_size=10)]
+        task.cancel()
+        self.assertEqual(len(vins), 30)
+        self.assertGreaterEqual(ticks - started, 2)
+
+    async def test_aclose_does_not_block_loop(self):
+        """Тест: выход из async with ждёт пул потоков, не останавливая другие задачи."""
+        service = AsyncCarService(self.sqlite, max_workers=1)
+        loop = asyncio.get_running_loop()
+        slow_call = loop.run_in_executor(service._executor, time.sleep, 0.2)
+        closing = asyncio.create_task(service.aclose())
+        await asyncio.sleep(0.05)
+        self.assertFalse(closing.done())  # Цикл событий продолжает работать, пока пул завершается
+        await closing
+        self.assertTrue(slow_call.done())
+
+    async def test_iter_cars(self):
+        """Тест асинхронного перебора автомобилей по страницам."""
+        async with AsyncCarService(self.sqlite) as service:
+            await service.add_cars((f'Model{i}', 1000000 + i, f'{i:06d}', 50.0 if i % 2 else None)
+                                   for i in range(10))
+            vins = [car.vin async for car in service.iter_cars(CarFilter(electric=True), page_size=2)]
+            self.assertEqual(vins, [1000001, 1000003, 1000005, 1000007, 1000009])
+            self.assertEqual((await service.remove(1000001)).vin, 1000001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.exceptions.car_exceptions import DuplicateCar, IncorrectVinNumber, IncorrectCarNumbers
+from car_management.loaders.car_loaders import read_rows
+from car_management.repositories.car_repository import CarRepository
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestBulkAddCars(unittest.TestCase):
+    """Тесты для пакетной загрузки CarService.add_cars."""
+
+    rows = [
+        ('Model1', 1000001, 'f1234d'),
+        ('Model2', 999, 'т001тг'),  # Неверный диапазон VIN
+        ('Model3', 2020202, 'abc'),  # Неверная длина номера
+        ('ElectricModel1', 1000003, 'e12345', 75.0),
+        {'model': 'Model4', 'vin': 1000004, 'numbers': 'd00004'},
+    ]
+
+    def test_errors_do_not_abort_batch(self):
+        """Тест: ошибки отдельных строк собираются, остальные строки сохраняются."""
+        repository = CarRepository()
+        result = CarService(repository).add_cars(self.rows, chunk_size=2)
+
+        self.assertEqual(result.added, 3)
+        self.assertEqual([error.index for error in result.errors], [1, 2])
+        self.assertIsInstance(result.errors[0].error, IncorrectVinNumber)
+        self.assertIsInstance(result.errors[1].error, IncorrectCarNumbers)
+        self.assertEqual([car.vin for car in repository.get_all()], [1000001, 1000003, 1000004])
+        self.assertIsInstance(repository.get_all()[1], ElectricCar)
+
+    def test_duplicates_rejected_per_row(self):
+        """Тест: дубликаты в пачке отклоняются поштучно, а не всей пачкой."""
+        repository = IndexedCarRepository()
+        service = CarService(repository)
+        service.add_car(Car('Model1', 1000001, 'f1234d'))
+
+        rows = [('Model2', 1000002, 'a00002'), ('Model1', 1000001, 'z99999'),
+                ('Model3', 1000003, 'a00002'), ('Model4', 1000004, 'a00004')]
+        result = service.add_cars(rows)
+
+        self.assertEqual(result.added, 2)
+        self.assertEqual([error.index for error in result.errors], [1, 2])
+        self.assertTrue(all(isinstance(error.error, DuplicateCar) for error in result.errors))
+        self.assertEqual(sorted(car.vin for car in repository.get_all()), [1000001, 1000002, 1000004])
+
+    def test_load_from_csv_and_jsonl(self):
+        """Тест потокового чтения строк из CSV и JSONL."""
+        files = {
+            '.csv': 'model,vin,numbers,battery_capacity\n'
+                    'Model1,1000001,f1234d,\n'
+                    'ElectricModel1,1000003,e12345,75.0\n'
+                    'Model2,not_a_vin,abc123,\n',
+            '.jsonl': '{"model": "Model1", "vin": 1000001, "numbers": "f1234d"}\n'
+                      '{"model": "ElectricModel1", "vin": 1000003, "numbers": "e12345", "battery_capacity": 75.0}\n'
+                      '\n'
+                      '{"model": "Model2", "vin": "not_a_vin", "numbers": "abc123"}\n',
+        }
+        for suffix, content in files.items():
+            with self.subTest(suffix=suffix):
+                fd, path = tempfile.mkstemp(suffix=suffix)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                try:
+                    repository = CarRepository()
+                    result = CarService(repository).add_cars(read_rows(path))
+                finally:
+                    os.remove(path)
+
+                self.assertEqual(result.added, 2)
+                self.assertEqual(len(result.errors), 1)
+                self.assertEqual(str(result.errors[0].error),
+                                 'Некорректный тип vin номер: str, ожидается int')
+                self.assertEqual(repository.get_all()[1].battery_capacity, 75.0)
+
+    def test_malformed_rows_do_not_abort_load(self):
+        """Тест: нечисловая емкость батареи и битые строки посреди файла попадают в ошибки."""
+        files = {
+            '.csv': 'model,vin,numbers,battery_capacity\n'
+                    'Model1,1000001,f1234d,\n'
+                    'ElectricModel1,1000002,e12345,много\n'
+                    'Model2,1000003\n'
+                    'ElectricModel2,1000004,e12346,60\n',
+            '.jsonl': '{"model": "Model1", "vin": 1000001, "numbers": "f1234d"}\n'
+                      '{"model": "ElectricModel1", "vin": 1000002, "numbers": "e12345", "battery_capacity": "много"}\n'
+                      '{"model": "Model2", "vin": 1000003\n'
+                      '{"model": "ElectricModel2", "vin": 1000004, "numbers": "e12346", "battery_capacity": 60}\n',
+        }
+        for suffix, content in files.items():
+            with self.subTest(suffix=suffix):
+                fd, path = tempfile.mkstemp(suffix=suffix)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                try:
+                    repository = CarRepository()
+                    result = CarService(repository).add_cars(read_rows(path), chunk_size=2)
+                finally:
+                    os.remove(path)
+
+                self.assertEqual(result.added, 2)
+                self.assertEqual([error.index for error in result.errors], [1, 2])
+                self.assertIsInstance(result.errors[0].error, ValueError)
+                self.assertEqual([car.vin for car in repository.get_all()], [1000001, 1000004])
+                self.assertEqual(repository.get_all()[1].battery_capacity, 60.0)
+
+    def test_short_rows(self):
+        """Тест: короткие кортежи и словари без полей не прерывают загрузку."""
+        rows = [('Model1', 1000001), {'model': 'Model2'}, ('Model3', 1000003, 'f12345', 'x'),
+                ('Model4', 1000004, 'f12346')]
+        result = CarService(CarRepository()).add_cars(rows)
+        self.assertEqual(result.added, 1)
+        self.assertEqual([type(error.error) for error in result.errors], [ValueError, KeyError, ValueError])
+
+    def test_unsupported_format(self):
+        """Тест на неподдерживаемое расширение файла."""
+        with self.assertRaises(ValueError):
+            read_rows('cars.xml')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.models.slotted_car import SlottedElectricCar
+from car_management.exceptions.car_exceptions import IncorrectVinNumber, IncorrectCarNumbers
+from car_management.validators.car_validators import (
+    NUMBERS_FORMAT_ERROR, NUMBERS_TYPE_ERROR, VALID, VIN_RANGE_ERROR, VIN_TYPE_ERROR,
+    validate_cars_batch, validate_numbers_batch, validate_vin_batch, validation_error
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBatchValidators(unittest.TestCase):
+    """Тесты для пакетных валидаторов."""
+
+    def test_vin_batch(self):
+        """Тест пакетной проверки VIN: маска и коды ошибок."""
+        mask, codes = validate_vin_batch([1234567, 999999, 'abc', 10000000, 9999999])
+        self.assertEqual(mask, [True, False, False, False, True])
+        self.assertEqual(codes, [VALID, VIN_RANGE_ERROR, VIN_TYPE_ERROR, VIN_RANGE_ERROR, VALID])
+
+    def test_numbers_batch(self):
+        """Тест пакетной проверки номеров: маска и коды ошибок."""
+        mask, codes = validate_numbers_batch(['abc123', 'т001тг', 'abc', 'abc12!', 123456])
+        self.assertEqual(mask, [True, True, False, False, False])
+        self.assertEqual(codes, [VALID, VALID, NUMBERS_FORMAT_ERROR, NUMBERS_FORMAT_ERROR, NUMBERS_TYPE_ERROR])
+
+    def test_cars_batch_reports_vin_first(self):
+        """Тест: для строки с двумя ошибками возвращается ошибка VIN, как в Car."""
+        _, codes = validate_cars_batch([999999, 1234567, 1234567], ['abc', 'abc', 'abc123'])
+        self.assertEqual(codes, [VIN_RANGE_ERROR, NUMBERS_FORMAT_ERROR, VALID])
+
+    def test_batch_matches_scalar_messages(self):
+        """Тест: исключения по кодам совпадают с исключениями при создании Car."""
+        for vin, numbers in [('x', 'abc123'), (999999, 'abc123'), (1234567, 123456), (1234567, 'abc')]:
+            _, codes = validate_cars_batch([vin], [numbers])
+            with self.assertRaises((IncorrectVinNumber, IncorrectCarNumbers)) as context:
+                Car('Model', vin, numbers)
+            value = vin if codes[0] in (VIN_TYPE_ERROR, VIN_RANGE_ERROR) else numbers
+            error = validation_error(codes[0], value)
+            self.assertIs(type(error), type(context.exception))
+            self.assertEqual(str(error), str(context.exception))
+
+    @unittest.skipIf(np is None, 'NumPy не установлен')
+    def test_numpy_arrays(self):
+        """Тест векторизованной проверки массивов NumPy."""
+        mask, codes = validate_cars_batch(np.array([1234567, 999999, 1234568]),
+                                          np.array(['abc123', 'abc123', 'abc12']))
+        self.assertEqual(mask.tolist(), [True, False, False])
+        self.assertEqual(codes.tolist(), [VALID, VIN_RANGE_ERROR, NUMBERS_FORMAT_ERROR])
+
+
+class TestFromValidated(unittest.TestCase):
+    """Тесты для создания автомобилей без повторной валидации."""
+
+    def test_from_validated(self):
+        """Тест: from_validated даёт те же объекты, что и конструктор."""
+        self.assertEqual(Car.from_validated('Model1', 1234567, 'abc123'), Car('Model1', 1234567, 'abc123'))
+        electric = ElectricCar.from_validated('E1', 1234568, 'abc124', 75.0)
+        self.assertEqual(electric.get_info(), ElectricCar('E1', 1234568, 'abc124', 75.0).get_info())
+        slotted = SlottedElectricCar.from_validated('E1', 1234568, 'abc124', 75.0)
+        self.assertEqual(slotted.battery_capacity, 75.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from car_management.models.slotted_car import SlottedCar, SlottedElectricCar
+from car_management.exceptions.car_exceptions import IncorrectVinNumber
+from car_management.repositories.columnar_car_repository import ColumnarCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestSlottedCar(unittest.TestCase):
+    """Тесты для SlottedCar и SlottedElectricCar."""
+
+    def test_no_instance_dict(self):
+        """Тест: у экземпляров нет __dict__."""
+        self.assertFalse(hasattr(SlottedCar('Model1', 1234567, 'abc123'), '__dict__'))
+        self.assertFalse(hasattr(SlottedElectricCar('Model1', 1234567, 'abc123', 75.0), '__dict__'))
+
+    def test_validation(self):
+        """Тест: валидация выполняется так же, как у Car."""
+        with self.assertRaises(IncorrectVinNumber):
+            SlottedCar('Model1', 999999, 'abc123')
+
+    def test_get_info(self):
+        """Тест на совпадение формата get_info с ElectricCar."""
+        car = SlottedElectricCar('ElectricModel1', 1000003, 'e12345', 75.0)
+        self.assertEqual(car.get_info(),
+                         'ElectricModel1 с VIN: 1000003 и номером: e12345 и емкостью батареи: 75.0 кВтч')
+
+
+class TestColumnarCarRepository(unittest.TestCase):
+    """Тесты для колоночного хранилища автомобилей."""
+
+    def setUp(self):
+        self.repository = ColumnarCarRepository()
+        self.service = CarService(self.repository)
+        self.service.add_cars([
+            ('Lada', 1000001, 'a001aa'),
+            ('Volga', 1000002, 'т002тт'),
+            ('LadaE', 1000003, 'e003ee', 50.0),
+            ('Lada', 1000004, 'a004aa'),
+        ])
+
+    def test_round_trip(self):
+        """Тест: автомобили восстанавливаются из колонок без потерь."""
+        cars = self.service.get_all_cars()
+        self.assertEqual(len(self.repository), 4)
+        self.assertEqual(cars[1], SlottedCar('Volga', 1000002, 'т002тт'))
+        self.assertEqual(cars[1].numbers, 'т002тт')
+        self.assertIsInstance(cars[2], SlottedElectricCar)
+        self.assertEqual(cars[2].battery_capacity, 50.0)
+        self.assertNotIsInstance(cars[0], SlottedElectricCar)
+
+    def test_lookups(self):
+        """Тест поиска по VIN, номеру и префиксу модели."""
+        self.assertEqual(self.service.get_by_vin(1000004).numbers, 'a004aa')
+        self.assertIsNone(self.service.get_by_vin(9999999))
+        self.assertEqual(self.service.get_by_numbers('e003ee').vin, 1000003)
+        self.assertIsNone(self.service.get_by_numbers('003ee0'))
+        self.assertEqual([car.vin for car in self.service.find_by_model_prefix('Lada')],
+                         [1000001, 1000003, 1000004])
+
+    def test_remove(self):
+        """Тест удаления: последняя строка переносится на место удалённой."""
+        removed = self.service.remove(1000001)
+        self.assertEqual(removed.numbers, 'a001aa')
+        self.assertIsNone(self.service.remove(1000001))
+        self.assertEqual([car.vin for car in self.repository], [1000004, 1000002, 1000003])
+        self.assertEqual(self.service.get_by_numbers('a004aa').vin, 1000004)
+        self.assertEqual(self.repository.memory_usage(), 3 * (4 + 4 + 24 + 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
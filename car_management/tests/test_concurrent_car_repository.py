@@ -0,0 +1,88 @@
+import threading
+import unittest
+from car_management.models.car import Car
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.car_query import CarFilter
+from car_management.repositories.concurrent_car_repository import ConcurrentCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestConcurrentCarRepository(unittest.TestCase):
+    """Тесты для ConcurrentCarRepository."""
+
+    def setUp(self):
+        self.repository = ConcurrentCarRepository(stripes=8)
+        self.service = CarService(self.repository)
+
+    def test_insert_if_absent(self):
+        """Тест атомарной вставки: повторный VIN не перезаписывает автомобиль."""
+        first = Car('Model1', 1000001, 'a00001')
+        self.assertTrue(self.repository.save_if_absent(first))
+        self.assertFalse(self.repository.save_if_absent(Car('Model2', 1000001, 'a00002')))
+        self.assertIs(self.service.get_by_vin(1000001), first)
+        with self.assertRaises(DuplicateCar):
+            self.service.add_car(Car('Model2', 1000001, 'a00002'))
+
+    def test_concurrent_writers_same_vins(self):
+        """Тест: при одновременной вставке одних и тех же VIN каждый VIN вставляется один раз."""
+        cars = [Car('Model', 1000000 + i, f'{i:06d}') for i in range(2000)]
+        inserted = []
+
+        def writer():
+            inserted.append(sum(self.repository.save_if_absent(car) for car in cars))
+
+        threads = [threading.Thread(target=writer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(inserted), len(cars))
+        self.assertEqual(len(self.repository), len(cars))
+        stats = self.repository.contention_stats()
+        self.assertEqual(stats['acquisitions'], 8 * len(cars))
+
+    def test_save_many_is_atomic(self):
+        """Тест: пачка с занятым VIN не сохраняется, add_cars отклоняет только дубликат."""
+        self.service.add_car(Car('Model1', 1000003, 'a00003'))
+        rows = [('Model1', 1000001, 'a00001'), ('Model1', 1000002, 'a00002'), ('Model1', 1000003, 'b00003')]
+        with self.assertRaises(DuplicateCar):
+            self.repository.save_many(Car(*row) for row in rows)
+        self.assertEqual(len(self.repository), 1)
+
+        result = self.service.add_cars(rows)
+        self.assertEqual(result.added, 2)
+        self.assertEqual([error.index for error in result.errors], [2])
+
+    def test_snapshot_and_pages(self):
+        """Тест снимков и постраничного перебора."""
+        self.service.add_cars((f'Model{i % 2}', 1000000 + i, f'{i:06d}') for i in range(50))
+        self.assertEqual(sorted(car.vin for car in self.repository.snapshot()),
+                         [1000000 + i for i in range(50)])
+        vins = [car.vin for car in self.service.iter_cars(CarFilter(model_prefix='Model1'), page_size=7)]
+        self.assertEqual(sorted(vins), [1000000 + i for i in range(1, 50, 2)])
+        self.assertEqual(self.service.remove(1000001).vin, 1000001)
+        self.assertIsNone(self.service.get_by_vin(1000001))
+
+    def test_snapshot_during_writes(self):
+        """Тест: снимки можно брать, пока другие потоки пишут."""
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                self.repository.save_if_absent(Car('Model', 1000000 + i, f'{i:06d}'))
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            sizes = [len(self.repository.snapshot()) for _ in range(200)]
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual(sizes, sorted(sizes))
+
+
+if __name__ == "__main__":
+    unittest.main()
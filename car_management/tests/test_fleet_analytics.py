@@ -0,0 +1,56 @@
+import unittest
+from car_management.analytics.fleet_analytics import FleetAnalytics, recompute
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestFleetAnalytics(unittest.TestCase):
+    """Тесты для инкрементальных агрегатов FleetAnalytics."""
+
+    def setUp(self):
+        self.repository = IndexedCarRepository()
+        self.analytics = FleetAnalytics(battery_bucket_size=10.0, vin_bucket_size=1000000)
+        self.service = CarService(self.repository, self.analytics)
+        self.service.add_car(Car('Lada', 1000001, 'a00001'))
+        self.service.add_cars([
+            ('Lada', 2000002, 'a00002'),
+            ('Tesla', 2000003, 'e00003', 75.0),
+            ('Tesla', 3000004, 'e00004', 79.9),
+            ('Leaf', 3000005, 'e00005', 40.0),
+            ('Lada', 999, 'bad001'),  # Не проходит валидацию и не учитывается
+            ('Lada', 1000001, 'dup001'),  # Дубликат VIN и не учитывается
+        ])
+
+    def test_aggregates_follow_service(self):
+        """Тест: агрегаты обновляются при add_car и add_cars."""
+        self.assertEqual(self.analytics.total, 5)
+        self.assertEqual(self.analytics.electric, 3)
+        self.assertEqual(self.analytics.count_by_model('Lada'), 2)
+        self.assertEqual(self.analytics.count_by_model('Volga'), 0)
+        self.assertEqual(self.analytics.battery_histogram(), [(40.0, 1), (70.0, 2)])
+        self.assertEqual(self.analytics.vin_distribution(), [(1000000, 1), (2000000, 2), (3000000, 2)])
+
+    def test_remove(self):
+        """Тест: удаление уменьшает агрегаты и убирает пустые корзины."""
+        self.service.remove(3000005)
+        self.service.remove(9999999)
+        self.assertEqual(self.analytics.model_counts(), {'Lada': 2, 'Tesla': 2})
+        self.assertEqual(self.analytics.battery_histogram(), [(70.0, 2)])
+        self.assertEqual(self.analytics.electric, 2)
+
+    def test_verify_against_recompute(self):
+        """Тест: инкрементальные агрегаты совпадают с полным пересчётом."""
+        self.assertTrue(self.analytics.verify(self.repository.get_all()))
+        self.assertFalse(self.analytics.verify(self.repository.get_all()[1:]))
+        self.assertEqual(recompute(self.repository.get_all()), self.analytics.snapshot())
+
+    def test_from_cars(self):
+        """Тест построения агрегатов по существующему автопарку."""
+        analytics = FleetAnalytics.from_cars([ElectricCar('Tesla', 1000001, 'e00001', 75.0)])
+        self.assertEqual(analytics.snapshot()['models'], {'Tesla': 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.indexed_car_repository import IndexedCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestIndexedCarRepository(unittest.TestCase):
+    """Тесты для IndexedCarRepository и поисковых методов CarService."""
+
+    def setUp(self):
+        self.repository = IndexedCarRepository()
+        self.service = CarService(self.repository)
+        self.cars = [
+            Car('Lada', 1000001, 'a001aa'),
+            Car('Volga', 1000002, 'a002aa'),
+            ElectricCar('LadaE', 1000003, 'e003ee', 50.0),
+            Car('Lada', 1000004, 'a004aa'),
+        ]
+        for car in self.cars:
+            self.service.add_car(car)
+
+    def test_get_by_vin(self):
+        """Тест поиска по VIN номеру."""
+        self.assertIs(self.service.get_by_vin(1000002), self.cars[1])
+        self.assertIsNone(self.service.get_by_vin(9999999))
+
+    def test_get_by_numbers(self):
+        """Тест поиска по номеру автомобиля."""
+        self.assertIs(self.service.get_by_numbers('e003ee'), self.cars[2])
+        self.assertIsNone(self.service.get_by_numbers('zzz999'))
+
+    def test_find_by_model_prefix(self):
+        """Тест поиска по префиксу модели."""
+        found = self.service.find_by_model_prefix('Lada')
+        self.assertEqual([car.vin for car in found], [1000001, 1000004, 1000003])
+        self.assertEqual(self.service.find_by_model_prefix('Mos'), [])
+
+    def test_duplicate_vin(self):
+        """Тест на запрет повторного VIN номера."""
+        with self.assertRaises(DuplicateCar):
+            self.service.add_car(Car('Other', 1000001, 'b001bb'))
+        self.assertEqual(len(self.repository.get_all()), 4)
+
+    def test_duplicate_numbers(self):
+        """Тест на запрет повторного номера автомобиля."""
+        with self.assertRaises(DuplicateCar):
+            self.service.add_car(Car('Other', 1000009, 'a001aa'))
+        self.assertIsNone(self.service.get_by_vin(1000009))
+
+    def test_remove_keeps_indexes_consistent(self):
+        """Тест удаления: индексы остаются согласованными со списком."""
+        removed = self.service.remove(1000001)
+        self.assertIs(removed, self.cars[0])
+        self.assertIsNone(self.service.remove(1000001))
+        self.assertIsNone(self.service.get_by_vin(1000001))
+        self.assertIsNone(self.service.get_by_numbers('a001aa'))
+        self.assertIs(self.service.get_by_vin(1000004), self.cars[3])
+        self.assertEqual([car.vin for car in self.service.find_by_model_prefix('Lada')],
+                         [1000004, 1000003])
+        self.assertEqual(len(self.service.get_all_cars()), 3)
+
+        # После удаления VIN и номер снова свободны
+        self.service.add_car(Car('Lada', 1000001, 'a001aa'))
+        self.assertEqual(self.service.get_by_vin(1000001).numbers, 'a001aa')
+
+
+if __name__ == "__main__":
+    unittest.main()
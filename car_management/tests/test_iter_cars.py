@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from car_management.repositories.car_query import CarFilter
+from car_management.repositories.car_repository import CarRepository
+from car_management.repositories.columnar_car_repository import ColumnarCarRepository
+from car_management.repositories.sqlite_car_repository import SQLiteCarRepository
+from car_management.services.car_service import CarService
+
+ROWS = [(f'Model{i % 3}', 1000000 + i, f'{i:06d}', 40.0 + i if i % 4 == 0 else None) for i in range(20)]
+
+
+class TestIterCars(unittest.TestCase):
+    """Тесты для iter_cars, постраничной выборки и фильтров во всех репозиториях."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.sqlite = SQLiteCarRepository(os.path.join(self.directory.name, 'cars.db'))
+        self.repositories = [CarRepository(), ColumnarCarRepository(), self.sqlite]
+        for repository in self.repositories:
+            CarService(repository).add_cars(ROWS)
+
+    def tearDown(self):
+        self.sqlite.close()
+        self.directory.cleanup()
+
+    def assert_vins(self, car_filter, expected):
+        for repository in self.repositories:
+            with self.subTest(repository=type(repository).__name__, car_filter=car_filter):
+                service = CarService(repository)
+                self.assertEqual([car.vin for car in service.iter_cars(car_filter, page_size=3)], expected)
+
+    def test_without_filter(self):
+        """Тест: без фильтра перебираются все автомобили."""
+        self.assert_vins(None, [1000000 + i for i in range(20)])
+
+    def test_electric_only(self):
+        """Тест фильтра «только электромобили»."""
+        self.assert_vins(CarFilter(electric=True), [1000000, 1000004, 1000008, 1000012, 1000016])
+        self.assert_vins(CarFilter(electric=False, vin_to=1000003), [1000001, 1000002, 1000003])
+
+    def test_battery_capacity_above(self):
+        """Тест фильтра battery_capacity > X (строгое сравнение)."""
+        self.assert_vins(CarFilter(battery_capacity_above=48.0), [1000012, 1000016])
+
+    def test_vin_range_and_model_prefix(self):
+        """Тест фильтров по диапазону VIN и префиксу модели."""
+        self.assert_vins(CarFilter(vin_from=1000005, vin_to=1000010, model_prefix='Model1'),
+                         [1000007, 1000010])
+
+    def test_get_page_cursor(self):
+        """Тест постраничной выборки с курсором."""
+        for repository in self.repositories:
+            with self.subTest(repository=type(repository).__name__):
+                service = CarService(repository)
+                first = service.get_page(CarFilter(electric=True), page_size=3)
+                self.assertEqual([car.vin for car in first.cars], [1000000, 1000004, 1000008])
+                self.assertIsNotNone(first.next_cursor)
+                second = service.get_page(CarFilter(electric=True), first.next_cursor, page_size=3)
+                self.assertEqual([car.vin for car in second.cars], [1000012, 1000016])
+
+
+if __name__ == "__main__":
+    unittest.main()
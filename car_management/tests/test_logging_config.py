@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import unittest
+from car_management.logging_config import CACHE_SUFFIX, DEFAULT_CONFIG_FILE, apply_log_level, load_config
+
+
+class TestLoggingConfig(unittest.TestCase):
+    """Тесты для загрузки конфигурации логирования с кэшем."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.directory, 'logging_config.yaml')
+        shutil.copy(DEFAULT_CONFIG_FILE, self.config_file)
+        self.cache_file = self.config_file + CACHE_SUFFIX
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_cache_created_and_used(self):
+        """Тест: первый вызов создаёт кэш, второй читает его без разбора YAML."""
+        config = load_config(self.config_file)
+        self.assertTrue(os.path.exists(self.cache_file))
+        self.assertEqual(load_config(self.config_file), config)
+        self.assertEqual(load_config(self.config_file, use_cache=False), config)
+
+    def test_cache_invalidated_by_mtime(self):
+        """Тест: изменение YAML сбрасывает кэш."""
+        load_config(self.config_file)
+        with open(self.config_file, 'a', encoding='utf-8') as f:
+            f.write('  extra:\n    level: DEBUG\n')
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIn('extra', load_config(self.config_file)['loggers'])
+
+    def test_corrupted_cache_ignored(self):
+        """Тест: повреждённый кэш перезаписывается."""
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            f.write('{')
+        self.assertEqual(load_config(self.config_file)['version'], 1)
+
+    def test_log_level_applied_to_all_loggers(self):
+        """Тест: уровень применяется ко всем логгерам, а не к фиксированному списку."""
+        config = apply_log_level(load_config(self.config_file, use_cache=False), 'DEBUG')
+        self.assertTrue(config['loggers'])
+        self.assertEqual({logger['level'] for logger in config['loggers'].values()}, {'DEBUG'})
+
+
+if __name__ == "__main__":
+    unittest.main()
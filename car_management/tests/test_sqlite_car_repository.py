@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from car_management.models.car import Car
+from car_management.models.electric_car import ElectricCar
+from car_management.exceptions.car_exceptions import DuplicateCar
+from car_management.repositories.sqlite_car_repository import SQLiteCarRepository
+from car_management.services.car_service import CarService
+
+
+class TestSQLiteCarRepository(unittest.TestCase):
+    """Тесты для SQLiteCarRepository."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, 'cars.db')
+        self.repository = SQLiteCarRepository(self.database, fetch_size=2)
+        self.service = CarService(self.repository)
+
+    def tearDown(self):
+        self.repository.close()
+        self.directory.cleanup()
+
+    def test_save_and_reopen(self):
+        """Тест: автомобили сохраняются на диске и доступны после переоткрытия."""
+        self.service.add_car(Car('Model1', 1000001, 'f1234d'))
+        self.service.add_car(ElectricCar('ElectricModel1', 1000003, 'e12345', 75.0))
+        self.repository.close()
+
+        self.repository = SQLiteCarRepository(self.database)
+        cars = self.repository.get_all()
+        self.assertEqual([car.vin for car in cars], [1000001, 1000003])
+        self.assertIsInstance(cars[1], ElectricCar)
+        self.assertEqual(cars[1].battery_capacity, 75.0)
+
+    def test_wal_mode(self):
+        """Тест: база работает в режиме WAL."""
+        with self.repository.pool.connection() as connection:
+            mode = connection.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal')
+
+    def test_duplicates(self):
+        """Тест: повторный VIN или номер приводит к DuplicateCar."""
+        self.service.add_car(Car('Model1', 1000001, 'f1234d'))
+        with self.assertRaises(DuplicateCar):
+            self.service.add_car(Car('Model2', 1000001, 'abc123'))
+        with self.assertRaises(DuplicateCar):
+            self.service.add_car(Car('Model2', 1000002, 'f1234d'))
+
+    def test_save_many_is_atomic(self):
+        """Тест: пачка с дубликатом откатывается целиком, add_cars отклоняет только дубликат."""
+        rows = [('Model1', 1000001, 'a00001'), ('Model2', 1000002, 'a00002'), ('Model3', 1000001, 'a00003')]
+        with self.assertRaises(DuplicateCar):
+            self.repository.save_many(Car(*row) for row in rows)
+        self.assertEqual(len(self.repository), 0)
+
+        result = self.service.add_cars(rows)
+        self.assertEqual(result.added, 2)
+        self.assertEqual([error.index for error in result.errors], [2])
+
+    def test_lookups_and_remove(self):
+        """Тест поиска по индексам и удаления."""
+        self.service.add_cars([('Lada', 1000001, 'a001aa'), ('Volga', 1000002, 'a002aa'),
+                               ('LadaE', 1000003, 'e003ee', 50.0), ('Lada', 1000004, 'a004aa')])
+        self.assertEqual(self.service.get_by_vin(1000002).model, 'Volga')
+        self.assertEqual(self.service.get_by_numbers('e003ee').battery_capacity, 50.0)
+        self.assertEqual([car.vin for car in self.service.find_by_model_prefix('Lada')],
+                         [1000001, 1000004, 1000003])
+        self.assertEqual(self.service.remove(1000001).numbers, 'a001aa')
+        self.assertIsNone(self.service.remove(1000001))
+        self.assertIsNone(self.service.get_by_vin(1000001))
+
+    def test_iter_all_streams(self):
+        """Тест: iter_all отдаёт автомобили по одному, читая базу порциями."""
+        self.service.add_cars((f'Model{i}', 1000000 + i, f'{i:06d}') for i in range(5))
+        cars = self.repository.iter_all()
+        self.assertEqual(next(cars).vin, 1000000)
+        self.assertEqual([car.vin for car in cars], [1000001, 1000002, 1000003, 1000004])
+
+    def test_iter_all_releases_connection_between_pages(self):
+        """Тест: вложенный и брошенный перебор не занимают единственное соединение пула."""
+        self.repository.close()
+        self.repository = SQLiteCarRepository(self.database, pool_size=1, fetch_size=2)
+        self.repository.save_many(Car(f'Model{i}', 1000000 + i, f'{i:06d}') for i in range(3))
+
+        abandoned = self.repository.iter_all()
+        next(abandoned)
+        pairs = [(outer.vin, inner.vin) for outer in self.repository.iter_all()
+                 for inner in self.repository.iter_all()]
+        self.assertEqual(len(pairs), 9)
+        self.assertEqual(len(self.repository), 3)
+
+    def test_close_closes_checked_out_connections(self):
+        """Тест: close закрывает и соединение, выданное потоку."""
+        with self.repository.pool.connection() as connection:
+            self.repository.close()
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute('SELECT 1')
+        with self.assertRaises(sqlite3.ProgrammingError):
+            len(self.repository)
+
+    def test_concurrent_writers(self):
+        """Тест: сервис с одним репозиторием можно использовать из нескольких потоков."""
+        def add_range(start):
+            self.service.add_cars((f'Model{i}', 1000000 + i, f'{i:06d}') for i in range(start, start + 100))
+
+        threads = [threading.Thread(target=add_range, args=(start,)) for start in range(0, 400, 100)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.repository), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,137 @@
 import re
-from car_management.exceptions.car_exceptions import IncorrectVinNumber, IncorrectCarNumbers
+from car_management.exceptions.car_exceptions import CarException, IncorrectVinNumber, IncorrectCarNumbers
+
+# Шаблон номера компилируется один раз при импорте модуля
+NUMBERS_PATTERN = re.compile(r'^[a-zA-Zа-яА-Я0-9]+$')
+
+VIN_MIN = 1000000
+VIN_MAX = 9999999
+NUMBERS_LENGTH = 6
+
+# Коды ошибок пакетной валидации
+VALID = 0
+VIN_TYPE_ERROR = 1
+VIN_RANGE_ERROR = 2
+NUMBERS_TYPE_ERROR = 3
+NUMBERS_FORMAT_ERROR = 4
+
+
+def _vin_code(vin_number) -> int:
+    """Код ошибки для одного VIN номера."""
+    if not isinstance(vin_number, int):
+        return VIN_TYPE_ERROR
+    if vin_number < VIN_MIN or vin_number > VIN_MAX:
+        return VIN_RANGE_ERROR
+    return VALID
+
+
+def _numbers_code(numbers) -> int:
+    """Код ошибки для одного номера автомобиля."""
+    if not isinstance(numbers, str):
+        return NUMBERS_TYPE_ERROR
+    if len(numbers) != NUMBERS_LENGTH or not NUMBERS_PATTERN.match(numbers):
+        return NUMBERS_FORMAT_ERROR
+    return VALID
+
+
+def validation_error(code: int, value) -> CarException:
+    """Создать исключение, соответствующее коду ошибки и проверенному значению."""
+    if code == VIN_TYPE_ERROR:
+        return IncorrectVinNumber(f'Некорректный тип vin номер: {type(value).__name__}, ожидается int')
+    if code == VIN_RANGE_ERROR:
+        return IncorrectVinNumber('Неверный диапазон для vin номера')
+    if code == NUMBERS_TYPE_ERROR:
+        return IncorrectCarNumbers(f'Некорректный тип данных для номеров: {type(value).__name__}, ожидается str')
+    if code == NUMBERS_FORMAT_ERROR:
+        return IncorrectCarNumbers('Неверная длина или формат номера')
+    raise ValueError(f'Неизвестный код ошибки валидации: {code}')
 
 
 def validate_vin(vin_number: int) -> None:
     """Валидация VIN номера."""
-    if not isinstance(vin_number, int):
-        raise IncorrectVinNumber(f'Некорректный тип vin номер: {type(vin_number).__name__}, ожидается int')
-    if vin_number < 1000000 or vin_number > 9999999:
-        raise IncorrectVinNumber('Неверный диапазон для vin номера')
+    code = _vin_code(vin_number)
+    if code:
+        raise validation_error(code, vin_number)
 
 
 def validate_numbers(numbers: str) -> None:
     """Валидация номера автомобиля с использованием регулярных выражений."""
-    if not isinstance(numbers, str):
-        raise IncorrectCarNumbers(f'Некорректный тип данных для номеров: {type(numbers).__name__}, ожидается str')
-    if len(numbers) != 6 or not re.match(r'^[a-zA-Zа-яА-Я0-9]+$', numbers):
-        raise IncorrectCarNumbers('Неверная длина или формат номера')
+    code = _numbers_code(numbers)
+    if code:
+        raise validation_error(code, numbers)
+
+
+def _is_numpy_array(values) -> bool:
+    """Проверка на массив NumPy без импорта NumPy."""
+    return type(values).__module__ == 'numpy' and hasattr(values, 'dtype')
+
+
+def _vin_codes(values):
+    """Коды ошибок для последовательности или массива NumPy с VIN номерами."""
+    if _is_numpy_array(values) and values.dtype.kind in 'iu':
+        import numpy as np
+        return np.where((values < VIN_MIN) | (values > VIN_MAX), VIN_RANGE_ERROR, VALID).astype(np.uint8)
+
+    if _is_numpy_array(values):
+        values = values.tolist()
+    # Корректные int проверяются прямо в выражении, остальные — через _vin_code
+    return [VALID if type(value) is int and VIN_MIN <= value <= VIN_MAX else _vin_code(value)
+            for value in values]
+
+
+def _numbers_codes(values):
+    """Коды ошибок для последовательности или массива NumPy с номерами."""
+    match = NUMBERS_PATTERN.match
+    if _is_numpy_array(values) and values.dtype.kind == 'U':
+        import numpy as np
+        codes = np.full(len(values), NUMBERS_FORMAT_ERROR, dtype=np.uint8)
+        candidates = np.flatnonzero(np.char.str_len(values) == NUMBERS_LENGTH)
+        codes[[index for index in candidates.tolist() if match(values[index])]] = VALID
+        return codes
+
+    if _is_numpy_array(values):
+        values = values.tolist()
+    return [VALID if type(value) is str and len(value) == NUMBERS_LENGTH and match(value)
+            else _numbers_code(value) for value in values]
+
+
+def _with_mask(codes):
+    """Пара (маска корректных значений, коды ошибок)."""
+    if _is_numpy_array(codes):
+        return codes == VALID, codes
+    return [code == VALID for code in codes], codes
+
+
+def validate_vin_batch(values):
+    """Пакетная валидация VIN номеров без исключений.
+
+    Принимает последовательность или массив NumPy и возвращает пару
+    ``(mask, codes)``: маску корректных значений и коды ошибок (VALID,
+    VIN_TYPE_ERROR, VIN_RANGE_ERROR). Для целочисленных массивов NumPy проверка
+    диапазона векторизована, и результатом тоже будут массивы NumPy.
+    """
+    return _with_mask(_vin_codes(values))
+
+
+def validate_numbers_batch(values):
+    """Пакетная валидация номеров автомобилей без исключений.
+
+    Возвращает пару ``(mask, codes)`` с кодами VALID, NUMBERS_TYPE_ERROR и
+    NUMBERS_FORMAT_ERROR. Формат проверяется одним заранее скомпилированным
+    шаблоном; для строковых массивов NumPy длина проверяется векторизованно,
+    а шаблон применяется только к строкам нужной длины.
+    """
+    return _with_mask(_numbers_codes(values))
+
+
+def validate_cars_batch(vins, numbers):
+    """Пакетная валидация VIN и номеров; для каждой строки возвращается первая ошибка.
+
+    Порядок проверок тот же, что при создании Car: сначала VIN, затем номер.
+    """
+    vin_codes = _vin_codes(vins)
+    numbers_codes = _numbers_codes(numbers)
+    if _is_numpy_array(vin_codes) and _is_numpy_array(numbers_codes):
+        import numpy as np
+        return _with_mask(np.where(vin_codes != VALID, vin_codes, numbers_codes))
+    return _with_mask([vin_code or numbers_code for vin_code, numbers_code in zip(vin_codes, numbers_codes)])
@@ -1,3 +1,4 @@
+import argparse
 import time
 import logging
 import rarfile
@@ -65,21 +66,54 @@ def read_info(args):
     return all_data
 
 
+def iter_lines(filename, archive_path):
+    """Построчно читает файл из архива, не загружая его целиком в память.
+
+    Строки декодируются по мере чтения через io.TextIOWrapper поверх потока
+    файла в архиве и возвращаются без символов конца строки.
+    """
+    with rarfile.RarFile(archive_path) as rf:
+        with rf.open(filename) as f:
+            for line in io.TextIOWrapper(f, encoding='utf-8'):
+                yield line.rstrip('\n')
+
+
+@profile_logger
+def summarize_info(args):
+    """Считывает файл построчно и возвращает только сводку: имя файла, число строк и символов."""
+    filename, archive_path = args
+    lines = chars = 0
+    for line in iter_lines(filename, archive_path):
+        lines += 1
+        chars += len(line)
+    return {'filename': filename, 'lines': lines, 'chars': chars}
+
+
 def process_file(args):
     """Обрабатывает один файл."""
     return read_info(args)  # Передаем кортеж args напрямую
 
 
+def process_file_streaming(args):
+    """Обрабатывает один файл построчно и возвращает сводку вместо списка строк."""
+    return summarize_info(args)
+
+
 @profile_logger
-def process_files(filenames, archive_path):
-    """Обрабатывает файлы линейно и многопроцессно."""
+def process_files(filenames, archive_path, streaming=False):
+    """Обрабатывает файлы линейно и многопроцессно.
+
+    С streaming=True файлы читаются построчно, а из процессов возвращаются
+    только сводки summarize_info, поэтому память не растёт с размером файлов.
+    """
+    read, worker = (summarize_info, process_file_streaming) if streaming else (read_info, process_file)
     start_time = time.time()
 
     # Линейная обработка
     linear_results = []
     with rarfile.RarFile(archive_path) as rf:
         for filename in tqdm(filenames, desc="Линейный вызов", unit="файл"):
-            data = read_info((filename, archive_path))
+            data = read((filename, archive_path))
             linear_results.append(data)  # Сохраняем результаты
     linear_time = time.time() - start_time
     logging.info(f"Линейный вызов: {linear_time:.6f} секунд")
@@ -87,7 +121,7 @@ def process_files(filenames, archive_path):
     # Многопроцессная обработка
     start_time = time.time()
     with Pool(processes=4) as pool:  # Увеличьте количество процессов, если это необходимо
-        multiprocessing_results = list(tqdm(pool.imap(process_file, zip(filenames, [archive_path] * len(filenames))),
+        multiprocessing_results = list(tqdm(pool.imap(worker, zip(filenames, [archive_path] * len(filenames))),
                                             total=len(filenames), desc="Многопроцессный вызов", unit="файл"))
     multiprocessing_time = time.time() - start_time
     logging.info(f"Многопроцессный вызов: {multiprocessing_time:.6f} секунд")
@@ -97,12 +131,16 @@ def process_files(filenames, archive_path):
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Линейная и многопроцессная обработка файлов из RAR-архива')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Читать файлы построчно и возвращать из процессов только сводки')
+    args = parser.parse_args()
     archive_path = 'data/Files.rar'
 
     try:
         with rarfile.RarFile(archive_path) as rf:
             filenames = rf.namelist()
-            process_files(filenames, archive_path)
+            process_files(filenames, archive_path, streaming=args.streaming)
     except FileNotFoundError:
         logging.error(f"Файл не найден: {archive_path}")
     except Exception as e:
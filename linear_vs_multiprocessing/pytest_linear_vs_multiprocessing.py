@@ -1,7 +1,7 @@
 import os
 import pytest
 import logging
-from linear_vs_multiprocessing import read_info, process_file, process_files
+from linear_vs_multiprocessing import iter_lines, read_info, summarize_info, process_file, process_files
 import rarfile
 
 
@@ -43,6 +43,27 @@ def test_process_file(setup_test_environment):
     assert result == ["Hello, World!", "This is a test file."]
 
 
+def test_iter_lines(setup_test_environment):
+    """Тестируем построчное чтение iter_lines."""
+    archive_path = setup_test_environment
+    assert list(iter_lines('test.txt', archive_path)) == ["Hello, World!", "This is a test file."]
+
+
+def test_summarize_info(setup_test_environment):
+    """Тестируем сводку по файлу вместо списка строк."""
+    archive_path = setup_test_environment
+    result = summarize_info(('test.txt', archive_path))
+    assert result == {'filename': 'test.txt', 'lines': 2, 'chars': 33}
+
+
+def test_process_files_streaming(setup_test_environment):
+    """Тестируем process_files в потоковом режиме."""
+    archive_path = setup_test_environment
+    linear_results, multiprocessing_results = process_files(['test.txt'], archive_path, streaming=True)
+    assert linear_results == [{'filename': 'test.txt', 'lines': 2, 'chars': 33}]
+    assert linear_results == multiprocessing_results
+
+
 def test_process_files(setup_test_environment):
     """Тестируем функцию process_files."""
     archive_path = setup_test_environment
@@ -5,7 +5,7 @@ import tempfile
 import logging
 
 # Импортируем функции из вашего модуля
-from linear_vs_multiprocessing import read_info, process_file, process_files
+from linear_vs_multiprocessing import iter_lines, read_info, summarize_info, process_file, process_files
 
 
 class TestRarFileProcessing(unittest.TestCase):
@@ -25,6 +25,22 @@ class TestRarFileProcessing(unittest.TestCase):
         result = process_file(('test.txt', self.archive_path))
         self.assertEqual(result, ["Hello, World!", "This is a test file."])
 
+    def test_iter_lines(self):
+        """Тестируем построчное чтение iter_lines."""
+        result = list(iter_lines('test.txt', self.archive_path))
+        self.assertEqual(result, ["Hello, World!", "This is a test file."])
+
+    def test_summarize_info(self):
+        """Тестируем сводку по файлу вместо списка строк."""
+        result = summarize_info(('test.txt', self.archive_path))
+        self.assertEqual(result, {'filename': 'test.txt', 'lines': 2, 'chars': 33})
+
+    def test_process_files_streaming(self):
+        """Тестируем process_files в потоковом режиме."""
+        linear_results, multiprocessing_results = process_files(['test.txt'], self.archive_path, streaming=True)
+        self.assertEqual(linear_results, [{'filename': 'test.txt', 'lines': 2, 'chars': 33}])
+        self.assertEqual(linear_results, multiprocessing_results)
+
     def test_process_files(self):
         """Тестируем функцию process_files."""
         linear_results, multiprocessing_results = process_files(['test.txt'], self.archive_path)